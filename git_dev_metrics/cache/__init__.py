@@ -1,59 +1,97 @@
 """SQLite cache for sealed PR/review data."""
 
 from .db import (
+    clear_checkpoints,
     close_connection,
     count_prs,
     default_db_path,
     delete_nickname,
     delete_target,
     get_all_dev_logins,
+    get_cached_snapshot,
     get_nicknames,
+    get_page_size,
+    get_partial_synced_at,
+    get_synced_profile,
     get_targets,
+    has_pr_files,
     insert_prs,
+    insert_prs_by_month,
     is_partial,
     is_sealed,
     is_synced,
+    load_checkpoints,
+    mark_files_synced,
     mark_partial,
     open_connection,
     query_prs,
+    replace_pr_files,
+    save_cached_snapshot,
+    save_checkpoint,
+    save_page_size,
     seal_month,
     set_nickname,
     set_target,
 )
 from .query import (
     has_partial_for_range,
+    has_timing_profile_for_range,
     list_partial_months,
     list_synced_months,
+    load_aggregates_by_month,
     load_all_repos_by_month,
     load_all_repos_for_range,
+    load_pr_files,
     load_prs,
     load_prs_for_range,
+    load_repo_aggregates_for_range,
+    refresh_dev_month_aggregates,
+    snapshot_cache_key,
 )
 
 __all__ = [
+    "clear_checkpoints",
     "close_connection",
     "count_prs",
     "default_db_path",
     "delete_nickname",
     "delete_target",
     "get_all_dev_logins",
+    "get_cached_snapshot",
     "get_nicknames",
+    "get_page_size",
+    "get_partial_synced_at",
+    "get_synced_profile",
     "get_targets",
     "has_partial_for_range",
+    "has_pr_files",
+    "has_timing_profile_for_range",
     "insert_prs",
+    "insert_prs_by_month",
     "is_partial",
     "is_sealed",
     "is_synced",
     "list_partial_months",
     "list_synced_months",
+    "load_aggregates_by_month",
     "load_all_repos_by_month",
     "load_all_repos_for_range",
+    "load_checkpoints",
+    "load_pr_files",
     "load_prs",
     "load_prs_for_range",
+    "load_repo_aggregates_for_range",
+    "mark_files_synced",
     "mark_partial",
     "open_connection",
     "query_prs",
+    "refresh_dev_month_aggregates",
+    "replace_pr_files",
+    "save_cached_snapshot",
+    "save_checkpoint",
+    "save_page_size",
     "seal_month",
     "set_nickname",
     "set_target",
+    "snapshot_cache_key",
 ]
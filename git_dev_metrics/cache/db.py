@@ -3,10 +3,25 @@ import sqlite3
 from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+from ..models import DevAggregate, PullRequest
+from ..pr_metrics import METRICS_VERSION, derive_pr_metrics
 
 _connections: dict[Path, sqlite3.Connection] = {}
 
+# `PRAGMA user_version` of a current cache. 1: PR and review timestamps are
+# INTEGER UTC epoch seconds (they were ISO strings).
+SCHEMA_VERSION = 1
+
+# Snapshots kept in `snapshot_cache`; a key that no longer matches is never read again.
+SNAPSHOT_CACHE_SIZE = 32
+
+_TIMESTAMP_COLUMNS = {
+    "prs": ("created_at", "merged_at", "closed_at", "first_commit_at", "ready_for_review_at"),
+    "reviews": ("submitted_at",),
+}
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS prs (
     repo_org TEXT NOT NULL,
@@ -17,16 +32,24 @@ CREATE TABLE IF NOT EXISTS prs (
     state TEXT,
     title TEXT,
     author_login TEXT,
-    created_at TEXT,
-    merged_at TEXT,
-    closed_at TEXT,
+    created_at INTEGER,
+    merged_at INTEGER,
+    closed_at INTEGER,
     additions INTEGER,
     deletions INTEGER,
     changed_files INTEGER,
-    first_commit_at TEXT,
-    ready_for_review_at TEXT,
+    first_commit_at INTEGER,
+    ready_for_review_at INTEGER,
     body TEXT,
     commit_messages_json TEXT,
+    start_at INTEGER,
+    first_approval_at INTEGER,
+    cycle_hours REAL,
+    pickup_hours REAL,
+    review_hours REAL,
+    size INTEGER,
+    is_ai INTEGER,
+    metrics_version INTEGER,
     PRIMARY KEY (repo_org, repo_name, year, month, number)
 );
 
@@ -38,7 +61,7 @@ CREATE TABLE IF NOT EXISTS reviews (
     month INTEGER NOT NULL,
     user_login TEXT,
     state TEXT,
-    submitted_at TEXT
+    submitted_at INTEGER
 );
 
 CREATE INDEX IF NOT EXISTS idx_reviews_scope
@@ -51,9 +74,78 @@ CREATE TABLE IF NOT EXISTS synced_months (
     repo_name TEXT NOT NULL,
     synced_at TEXT NOT NULL,
     partial INTEGER NOT NULL DEFAULT 0,
+    profile TEXT NOT NULL DEFAULT 'full',
+    agg_version INTEGER,
     PRIMARY KEY (year, month, repo_org, repo_name)
 );
 
+CREATE TABLE IF NOT EXISTS dev_month_agg (
+    repo_org TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    login TEXT NOT NULL,
+    pr_count INTEGER NOT NULL,
+    ai_count INTEGER NOT NULL,
+    size_sum INTEGER NOT NULL,
+    reviews_given INTEGER NOT NULL,
+    cycle_hours_json TEXT NOT NULL,
+    pickup_hours_json TEXT NOT NULL,
+    review_hours_json TEXT NOT NULL,
+    sizes_json TEXT NOT NULL,
+    PRIMARY KEY (repo_org, repo_name, year, month, login)
+);
+
+CREATE TABLE IF NOT EXISTS pull_checkpoints (
+    repo_org TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    search_query TEXT NOT NULL,
+    end_cursor TEXT,
+    rows_ingested INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (repo_org, repo_name, year, month, search_query)
+);
+
+CREATE TABLE IF NOT EXISTS pr_files (
+    repo_org TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    pr_number INTEGER NOT NULL,
+    author_login TEXT,
+    path TEXT NOT NULL,
+    additions INTEGER,
+    deletions INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_pr_files_scope
+    ON pr_files (repo_org, repo_name, year, month);
+
+CREATE TABLE IF NOT EXISTS file_syncs (
+    repo_org TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (repo_org, repo_name, year, month)
+);
+
+CREATE TABLE IF NOT EXISTS page_sizes (
+    repo_org TEXT NOT NULL,
+    repo_name TEXT NOT NULL,
+    page_size INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (repo_org, repo_name)
+);
+
+CREATE TABLE IF NOT EXISTS snapshot_cache (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    created_at TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS nicknames (
     login TEXT PRIMARY KEY,
     nickname TEXT NOT NULL
@@ -96,6 +188,80 @@ def _migrate_schema(conn: sqlite3.Connection) -> None:
         conn.execute("DROP TABLE synced_months_old")
 
 
+def _epoch_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild `prs` and `reviews` with ISO-string timestamps as INTEGER epoch seconds.
+
+    Runs as one script inside a single transaction, so a failed upgrade leaves the
+    old tables untouched.
+    """
+    copies: list[str] = []
+    for table, stamps in _TIMESTAMP_COLUMNS.items():
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        select = [
+            f"CAST(strftime('%s', {col}) AS INTEGER)" if col in stamps else col for col in columns
+        ]
+        copies.append(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(select)} FROM {table}_v0;\n"
+            f"DROP TABLE {table}_v0;\n"
+        )
+    renames = "".join(
+        f"ALTER TABLE {table} RENAME TO {table}_v0;\n" for table in _TIMESTAMP_COLUMNS
+    )
+    script = (
+        "BEGIN;\n"
+        + renames
+        + "DROP INDEX IF EXISTS idx_reviews_scope;\n"
+        + _SCHEMA
+        + "".join(copies)
+        + f"PRAGMA user_version = {SCHEMA_VERSION};\n"
+        + "COMMIT;"
+    )
+    try:
+        conn.executescript(script)
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+
+def _upgrade(conn: sqlite3.Connection) -> None:
+    """Bring a cache written by an older version up to `SCHEMA_VERSION`, in place."""
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version >= SCHEMA_VERSION:
+        return
+    has_prs = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='prs'"
+    ).fetchone()
+    if has_prs:
+        _epoch_timestamps(conn)
+    else:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+# Columns added after a table first shipped, by table, with their declarations.
+_ADDED_COLUMNS = {
+    "synced_months": {"profile": "TEXT NOT NULL DEFAULT 'full'", "agg_version": "INTEGER"},
+    "prs": {
+        "start_at": "INTEGER",
+        "first_approval_at": "INTEGER",
+        "cycle_hours": "REAL",
+        "pickup_hours": "REAL",
+        "review_hours": "REAL",
+        "size": "INTEGER",
+        "is_ai": "INTEGER",
+        "metrics_version": "INTEGER",
+    },
+}
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> None:
+    for table, added in _ADDED_COLUMNS.items():
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, declaration in added.items():
+            if name not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {declaration}")
+
+
 def open_connection(db_path: Path | None = None) -> sqlite3.Connection:
     path = db_path or default_db_path()
     if path in _connections:
@@ -105,7 +271,9 @@ def open_connection(db_path: Path | None = None) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
     _migrate_schema(conn)
+    _upgrade(conn)
     conn.executescript(_SCHEMA)
+    _add_missing_columns(conn)
     _connections[path] = conn
     return conn
 
@@ -117,10 +285,13 @@ def close_connection(db_path: Path | None = None) -> None:
         conn.close()
 
 
-def _iso(value: datetime | None) -> str | None:
+def _epoch(value: datetime | None) -> int | None:
+    """UTC epoch seconds; naive datetimes are taken as UTC."""
     if value is None:
         return None
-    return value.isoformat()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp())
 
 
 def _pr_row(pr: Mapping[str, Any], org: str, repo: str, year: int, month: int) -> tuple:
@@ -133,19 +304,101 @@ def _pr_row(pr: Mapping[str, Any], org: str, repo: str, year: int, month: int) -
         pr.get("state"),
         pr.get("title"),
         (pr.get("user") or {}).get("login"),
-        _iso(pr.get("created_at")),
-        _iso(pr.get("merged_at")),
-        _iso(pr.get("closed_at")),
+        _epoch(pr.get("created_at")),
+        _epoch(pr.get("merged_at")),
+        _epoch(pr.get("closed_at")),
         pr.get("additions"),
         pr.get("deletions"),
         pr.get("changed_files"),
-        _iso(pr.get("first_commit_at")),
-        _iso(pr.get("ready_for_review_at")),
+        _epoch(pr.get("first_commit_at")),
+        _epoch(pr.get("ready_for_review_at")),
         pr.get("body"),
         json.dumps(pr.get("commit_messages") or []),
+        *_metric_values(pr),
+    )
+
+
+def _metric_values(pr: Mapping[str, Any]) -> tuple:
+    """The derived metric columns of `pr`, ending with the definition version."""
+    metrics = derive_pr_metrics(cast(PullRequest, pr))
+    return (
+        _epoch(metrics["start_at"]),
+        _epoch(metrics["first_approval_at"]),
+        metrics["cycle_hours"],
+        metrics["pickup_hours"],
+        metrics["review_hours"],
+        metrics["size"],
+        int(metrics["is_ai"]),
+        METRICS_VERSION,
     )
 
 
+def save_pr_metrics(
+    conn: sqlite3.Connection, rows: Sequence[tuple[str, str, int, int, PullRequest]]
+) -> None:
+    """Store freshly derived metrics for `(org, repo, year, month, pr)` of older versions."""
+    with conn:
+        conn.executemany(
+            """
+            UPDATE prs SET
+                start_at = ?, first_approval_at = ?, cycle_hours = ?, pickup_hours = ?,
+                review_hours = ?, size = ?, is_ai = ?, metrics_version = ?
+            WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ? AND number = ?
+            """,
+            [
+                (*_metric_values(pr), org, repo, year, month, pr["number"])
+                for org, repo, year, month, pr in rows
+            ],
+        )
+
+
+def save_dev_month_aggregates(
+    conn: sqlite3.Connection,
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    aggregates: Mapping[str, DevAggregate],
+) -> None:
+    """Replace a synced month's per-dev aggregates and stamp them with `METRICS_VERSION`."""
+    scope = (org, repo, year, month)
+    with conn:
+        conn.execute(
+            "DELETE FROM dev_month_agg "
+            "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+            scope,
+        )
+        conn.executemany(
+            """
+            INSERT INTO dev_month_agg (
+                repo_org, repo_name, year, month, login,
+                pr_count, ai_count, size_sum, reviews_given,
+                cycle_hours_json, pickup_hours_json, review_hours_json, sizes_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    *scope,
+                    login,
+                    agg["pr_count"],
+                    agg["ai_count"],
+                    agg["size_sum"],
+                    agg["reviews_given"],
+                    json.dumps(agg["cycle_hours"]),
+                    json.dumps(agg["pickup_hours"]),
+                    json.dumps(agg["review_hours"]),
+                    json.dumps(agg["sizes"]),
+                )
+                for login, agg in aggregates.items()
+            ],
+        )
+        conn.execute(
+            "UPDATE synced_months SET agg_version = ? "
+            "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+            (METRICS_VERSION, *scope),
+        )
+
+
 def _review_rows(pr: Mapping[str, Any], org: str, repo: str, year: int, month: int) -> list[tuple]:
     return [
         (
@@ -156,7 +409,7 @@ def _review_rows(pr: Mapping[str, Any], org: str, repo: str, year: int, month: i
             month,
             (review.get("user") or {}).get("login"),
             review.get("state"),
-            _iso(review.get("submitted_at")),
+            _epoch(review.get("submitted_at")),
         )
         for review in pr.get("reviews") or []
     ]
@@ -190,21 +443,161 @@ def insert_prs(
     year: int,
     month: int,
     db_path: Path | None = None,
+    *,
+    checkpoint: tuple[str, str | None] | None = None,
 ) -> None:
+    """Upsert one batch of PRs and replace their reviews, in a single transaction.
+
+    PRs carrying `files` (the `files` fetch profile) also replace their file rows. The
+    month's per-dev aggregates, if it was synced before, are marked out of date.
+
+    `checkpoint` is the `(search query, end cursor)` the batch came from; it is saved in
+    the same transaction, so a resumed pull never skips a page that was not stored.
+    """
     conn = open_connection(db_path)
     with conn:
-        conn.executemany(
-            """
-            INSERT OR REPLACE INTO prs (
-                repo_org, repo_name, year, month, number, state, title,
-                author_login, created_at, merged_at, closed_at,
-                additions, deletions, changed_files,
-                first_commit_at, ready_for_review_at, body, commit_messages_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [_pr_row(pr, org, repo, year, month) for pr in prs],
+        _upsert_prs(conn, prs, org, repo, year, month)
+        if checkpoint is not None:
+            _save_checkpoint(conn, org, repo, year, month, *checkpoint, len(prs))
+
+
+def insert_prs_by_month(
+    prs_by_month: Mapping[tuple[int, int], Sequence[Mapping[str, Any]]],
+    org: str,
+    repo: str,
+    checkpoint_month: tuple[int, int],
+    checkpoint: tuple[str, str | None],
+    rows: int,
+    db_path: Path | None = None,
+) -> None:
+    """`insert_prs` for one page of a search spanning several months, in a single transaction.
+
+    The checkpoint, covering `rows` fetched rows, is kept under `checkpoint_month`.
+    """
+    conn = open_connection(db_path)
+    with conn:
+        for (year, month), prs in prs_by_month.items():
+            _upsert_prs(conn, prs, org, repo, year, month)
+        _save_checkpoint(conn, org, repo, *checkpoint_month, *checkpoint, rows)
+
+
+def _upsert_prs(
+    conn: sqlite3.Connection,
+    prs: Sequence[Mapping[str, Any]],
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+) -> None:
+    conn.executemany(
+        "DELETE FROM reviews WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ? "
+        "AND pr_number = ?",
+        [(org, repo, year, month, pr.get("number")) for pr in prs],
+    )
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO prs (
+            repo_org, repo_name, year, month, number, state, title,
+            author_login, created_at, merged_at, closed_at,
+            additions, deletions, changed_files,
+            first_commit_at, ready_for_review_at, body, commit_messages_json,
+            start_at, first_approval_at, cycle_hours, pickup_hours, review_hours,
+            size, is_ai, metrics_version
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
         )
-        _insert_reviews(conn, prs, org, repo, year, month)
+        """,
+        [_pr_row(pr, org, repo, year, month) for pr in prs],
+    )
+    _insert_reviews(conn, prs, org, repo, year, month)
+    conn.execute(
+        "UPDATE synced_months SET agg_version = NULL "
+        "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+        (org, repo, year, month),
+    )
+    _insert_files(conn, [pr for pr in prs if "files" in pr], org, repo, year, month)
+
+
+def _save_checkpoint(
+    conn: sqlite3.Connection,
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    search_query: str,
+    end_cursor: str | None,
+    rows: int,
+) -> None:
+    conn.execute(
+        """
+        INSERT INTO pull_checkpoints (
+            repo_org, repo_name, year, month, search_query,
+            end_cursor, rows_ingested, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (repo_org, repo_name, year, month, search_query) DO UPDATE SET
+            end_cursor = excluded.end_cursor,
+            rows_ingested = rows_ingested + excluded.rows_ingested,
+            updated_at = excluded.updated_at
+        """,
+        (org, repo, year, month, search_query, end_cursor, rows, datetime.now(UTC).isoformat()),
+    )
+
+
+def save_checkpoint(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    search_query: str,
+    end_cursor: str | None,
+    rows: int,
+    db_path: Path | None = None,
+) -> None:
+    """Checkpoint a search on its own; write it after the rows it covers are stored."""
+    conn = open_connection(db_path)
+    with conn:
+        _save_checkpoint(conn, org, repo, year, month, search_query, end_cursor, rows)
+
+
+def load_checkpoints(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> tuple[dict[str, str | None], int]:
+    """Saved `search query → end cursor` (None: search finished) and rows already ingested."""
+    conn = open_connection(db_path)
+    rows = conn.execute(
+        "SELECT search_query, end_cursor, rows_ingested FROM pull_checkpoints "
+        "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+        (org, repo, year, month),
+    ).fetchall()
+    cursors = {row["search_query"]: row["end_cursor"] for row in rows}
+    return cursors, sum(row["rows_ingested"] for row in rows)
+
+
+def _clear_checkpoints(
+    conn: sqlite3.Connection, org: str, repo: str, year: int, month: int
+) -> None:
+    conn.execute(
+        "DELETE FROM pull_checkpoints "
+        "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+        (org, repo, year, month),
+    )
+
+
+def clear_checkpoints(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> None:
+    """Drop checkpoints that no seal covers (e.g. org-wide searches)."""
+    conn = open_connection(db_path)
+    with conn:
+        _clear_checkpoints(conn, org, repo, year, month)
 
 
 def seal_month(
@@ -213,15 +606,19 @@ def seal_month(
     year: int,
     month: int,
     db_path: Path | None = None,
+    *,
+    profile: str = "full",
 ) -> None:
+    """Record a complete month; `profile` names the fetch profile its PRs were pulled with."""
     conn = open_connection(db_path)
     with conn:
         conn.execute(
             "INSERT OR REPLACE INTO synced_months "
-            "(year, month, repo_org, repo_name, synced_at, partial) "
-            "VALUES (?, ?, ?, ?, ?, 0)",
-            (year, month, org, repo, datetime.now(UTC).isoformat()),
+            "(year, month, repo_org, repo_name, synced_at, partial, profile) "
+            "VALUES (?, ?, ?, ?, ?, 0, ?)",
+            (year, month, org, repo, datetime.now(UTC).isoformat(), profile),
         )
+        _clear_checkpoints(conn, org, repo, year, month)
 
 
 def mark_partial(
@@ -230,15 +627,126 @@ def mark_partial(
     year: int,
     month: int,
     db_path: Path | None = None,
+    *,
+    synced_at: datetime | None = None,
+    profile: str = "full",
 ) -> None:
+    """Record an incomplete month. `synced_at` (default now) is the next incremental watermark,
+    so pass the time the pull started."""
     conn = open_connection(db_path)
     with conn:
         conn.execute(
             "INSERT OR REPLACE INTO synced_months "
-            "(year, month, repo_org, repo_name, synced_at, partial) "
-            "VALUES (?, ?, ?, ?, ?, 1)",
-            (year, month, org, repo, datetime.now(UTC).isoformat()),
+            "(year, month, repo_org, repo_name, synced_at, partial, profile) "
+            "VALUES (?, ?, ?, ?, ?, 1, ?)",
+            (year, month, org, repo, (synced_at or datetime.now(UTC)).isoformat(), profile),
+        )
+        _clear_checkpoints(conn, org, repo, year, month)
+
+
+def _file_rows(pr: Mapping[str, Any], org: str, repo: str, year: int, month: int) -> list[tuple]:
+    return [
+        (
+            org,
+            repo,
+            year,
+            month,
+            pr.get("number"),
+            (pr.get("user") or {}).get("login"),
+            f.get("path"),
+            f.get("additions"),
+            f.get("deletions"),
         )
+        for f in pr.get("files") or []
+    ]
+
+
+def _insert_files(
+    conn: sqlite3.Connection,
+    prs: Sequence[Mapping[str, Any]],
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+) -> None:
+    if not prs:
+        return
+    conn.executemany(
+        "DELETE FROM pr_files WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ? "
+        "AND pr_number = ?",
+        [(org, repo, year, month, pr.get("number")) for pr in prs],
+    )
+    conn.executemany(
+        """
+        INSERT INTO pr_files (
+            repo_org, repo_name, year, month, pr_number,
+            author_login, path, additions, deletions
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [row for pr in prs for row in _file_rows(pr, org, repo, year, month)],
+    )
+
+
+def _mark_files_synced(
+    conn: sqlite3.Connection, org: str, repo: str, year: int, month: int
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO file_syncs (repo_org, repo_name, year, month, synced_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (org, repo, year, month, datetime.now(UTC).isoformat()),
+    )
+
+
+def replace_pr_files(
+    prs: Sequence[Mapping[str, Any]],
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> None:
+    """Replace a month's file-level PR data and record when it was captured."""
+    conn = open_connection(db_path)
+    with conn:
+        conn.execute(
+            "DELETE FROM pr_files WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ?",
+            (org, repo, year, month),
+        )
+        _insert_files(conn, prs, org, repo, year, month)
+        _mark_files_synced(conn, org, repo, year, month)
+
+
+def mark_files_synced(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> None:
+    """Record that a month's PRs were stored with their files; call after sealing it."""
+    conn = open_connection(db_path)
+    with conn:
+        _mark_files_synced(conn, org, repo, year, month)
+
+
+def has_pr_files(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> bool:
+    """Whether the month's file data was captured after its latest pull."""
+    conn = open_connection(db_path)
+    row = conn.execute(
+        "SELECT 1 FROM file_syncs f JOIN synced_months s "
+        "ON s.repo_org = f.repo_org AND s.repo_name = f.repo_name "
+        "AND s.year = f.year AND s.month = f.month "
+        "WHERE f.repo_org = ? AND f.repo_name = ? AND f.year = ? AND f.month = ? "
+        "AND f.synced_at >= s.synced_at",
+        (org, repo, year, month),
+    ).fetchone()
+    return row is not None
 
 
 def is_sealed(
@@ -273,6 +781,40 @@ def is_partial(
     return row is not None
 
 
+def get_partial_synced_at(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> datetime | None:
+    """When a partial month was last synced; None if it is sealed or was never pulled."""
+    conn = open_connection(db_path)
+    row = conn.execute(
+        "SELECT synced_at FROM synced_months WHERE year = ? AND month = ? "
+        "AND repo_org = ? AND repo_name = ? AND partial = 1",
+        (year, month, org, repo),
+    ).fetchone()
+    return datetime.fromisoformat(row["synced_at"]) if row else None
+
+
+def get_synced_profile(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None = None,
+) -> str | None:
+    """Fetch profile a synced month was pulled with; None if it was never pulled."""
+    conn = open_connection(db_path)
+    row = conn.execute(
+        "SELECT profile FROM synced_months WHERE year = ? AND month = ? "
+        "AND repo_org = ? AND repo_name = ?",
+        (year, month, org, repo),
+    ).fetchone()
+    return row["profile"] if row else None
+
+
 def is_synced(
     org: str,
     repo: str,
@@ -319,6 +861,25 @@ def count_prs(
     return row["n"] if row else 0
 
 
+def get_page_size(org: str, repo: str, db_path: Path | None = None) -> int | None:
+    """Page size the last pull of the repo settled on; None if it was never pulled."""
+    conn = open_connection(db_path)
+    row = conn.execute(
+        "SELECT page_size FROM page_sizes WHERE repo_org = ? AND repo_name = ?", (org, repo)
+    ).fetchone()
+    return row["page_size"] if row else None
+
+
+def save_page_size(org: str, repo: str, page_size: int, db_path: Path | None = None) -> None:
+    conn = open_connection(db_path)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO page_sizes (repo_org, repo_name, page_size, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            (org, repo, page_size, datetime.now(UTC).isoformat()),
+        )
+
+
 def get_all_dev_logins(db_path: Path | None = None) -> set[str]:
     """All unique developer logins across cached PRs and reviews."""
     conn = open_connection(db_path)
@@ -337,6 +898,28 @@ def get_all_dev_logins(db_path: Path | None = None) -> set[str]:
     return result
 
 
+def get_cached_snapshot(key: str, db_path: Path | None = None) -> bytes | None:
+    """Serialized snapshot stored under `key`; None if there is none."""
+    conn = open_connection(db_path)
+    row = conn.execute("SELECT body FROM snapshot_cache WHERE key = ?", (key,)).fetchone()
+    return row["body"] if row else None
+
+
+def save_cached_snapshot(key: str, body: bytes, db_path: Path | None = None) -> None:
+    """Store a serialized snapshot, keeping only the `SNAPSHOT_CACHE_SIZE` newest."""
+    conn = open_connection(db_path)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshot_cache (key, body, created_at) VALUES (?, ?, ?)",
+            (key, body, datetime.now(UTC).isoformat()),
+        )
+        conn.execute(
+            "DELETE FROM snapshot_cache WHERE key NOT IN "
+            "(SELECT key FROM snapshot_cache ORDER BY created_at DESC LIMIT ?)",
+            (SNAPSHOT_CACHE_SIZE,),
+        )
+
+
 def get_nicknames(db_path: Path | None = None) -> dict[str, str]:
     """All login → nickname mappings."""
     conn = open_connection(db_path)
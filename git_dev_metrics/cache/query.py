@@ -1,44 +1,68 @@
+import hashlib
 import json
 import sqlite3
 from collections import defaultdict
 from collections.abc import Iterator
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import cast
 
-from ..models import PullRequest, Review
-from ..utils.date_utils import parse_iso_datetime
-from .db import open_connection
+from ..models import DevAggregate, PullRequest, PullRequestMetrics, Review
+from ..pr_metrics import METRICS_VERSION, aggregate_prs, merge_aggregates
+from .db import open_connection, save_dev_month_aggregates, save_pr_metrics
+
+
+def _from_epoch(seconds: int | None) -> datetime | None:
+    return None if seconds is None else datetime.fromtimestamp(seconds, UTC)
 
 
 def _review(row: sqlite3.Row) -> Review:
     return {
         "user": {"login": row["user_login"] or ""},
         "state": row["state"] or "",
-        "submitted_at": parse_iso_datetime(row["submitted_at"]),
+        "submitted_at": _from_epoch(row["submitted_at"]),
+    }
+
+
+def _stored_metrics(row: sqlite3.Row) -> PullRequestMetrics | None:
+    """The row's derived metrics, unless they predate the current definitions."""
+    if row["metrics_version"] != METRICS_VERSION:
+        return None
+    return {
+        "start_at": _from_epoch(row["start_at"]),
+        "first_approval_at": _from_epoch(row["first_approval_at"]),
+        "cycle_hours": row["cycle_hours"],
+        "pickup_hours": row["pickup_hours"],
+        "review_hours": row["review_hours"],
+        "size": row["size"],
+        "is_ai": bool(row["is_ai"]),
     }
 
 
 def _pr(row: sqlite3.Row, reviews: list[Review]) -> PullRequest:
-    return cast(
+    pr = cast(
         PullRequest,
         {
             "number": row["number"],
             "state": row["state"] or "",
             "title": row["title"] or "",
             "user": {"login": row["author_login"] or ""},
-            "created_at": parse_iso_datetime(row["created_at"]),
-            "merged_at": parse_iso_datetime(row["merged_at"]),
-            "closed_at": parse_iso_datetime(row["closed_at"]),
+            "created_at": _from_epoch(row["created_at"]),
+            "merged_at": _from_epoch(row["merged_at"]),
+            "closed_at": _from_epoch(row["closed_at"]),
             "additions": row["additions"] or 0,
             "deletions": row["deletions"] or 0,
             "changed_files": row["changed_files"] or 0,
-            "first_commit_at": parse_iso_datetime(row["first_commit_at"]),
-            "ready_for_review_at": parse_iso_datetime(row["ready_for_review_at"]),
+            "first_commit_at": _from_epoch(row["first_commit_at"]),
+            "ready_for_review_at": _from_epoch(row["ready_for_review_at"]),
             "body": row["body"],
             "commit_messages": json.loads(row["commit_messages_json"] or "[]"),
             "reviews": reviews,
         },
     )
+    if (metrics := _stored_metrics(row)) is not None:
+        pr["metrics"] = metrics
+    return pr
 
 
 def load_prs(
@@ -59,7 +83,43 @@ def load_prs(
     for row in review_rows:
         by_pr[row["pr_number"]].append(_review(row))
 
-    return [_pr(row, by_pr.get(row["number"], [])) for row in pr_rows]
+    prs = [_pr(row, by_pr.get(row["number"], [])) for row in pr_rows]
+    stale = [(org, repo, year, month, pr) for pr in prs if "metrics" not in pr]
+    if stale:
+        save_pr_metrics(conn, stale)
+    return prs
+
+
+def load_pr_files(
+    org: str, repo: str, year: int, month: int, db_path: Path | None = None
+) -> list[dict]:
+    """Cached PRs of one month as `{number, user, files}` dicts for the skill/lang reports."""
+    conn = open_connection(db_path)
+    rows = conn.execute(
+        "SELECT pr_number, author_login, path, additions, deletions FROM pr_files "
+        "WHERE repo_org = ? AND repo_name = ? AND year = ? AND month = ? "
+        "ORDER BY pr_number, rowid",
+        (org, repo, year, month),
+    ).fetchall()
+
+    by_pr: dict[int, dict] = {}
+    for row in rows:
+        pr = by_pr.setdefault(
+            row["pr_number"],
+            {
+                "number": row["pr_number"],
+                "user": {"login": row["author_login"] or ""},
+                "files": [],
+            },
+        )
+        pr["files"].append(
+            {
+                "path": row["path"],
+                "additions": row["additions"] or 0,
+                "deletions": row["deletions"] or 0,
+            }
+        )
+    return list(by_pr.values())
 
 
 def load_prs_for_range(
@@ -74,15 +134,66 @@ def load_prs_for_range(
     }
 
 
-def _iter_synced_prs(
+# Newest month first, then repo, then PR: the order both range scans share.
+_RANGE_ORDER = "s.year DESC, s.month DESC, s.repo_org, s.repo_name"
+
+
+def _wanted(months: list[tuple[int, int]]) -> tuple[str, list[int]]:
+    """A `wanted(year, month)` CTE over `months` and its parameters."""
+    wanted = sorted(set(months))
+    values = ", ".join("(?, ?)" for _ in wanted)
+    return f"WITH wanted(year, month) AS (VALUES {values}) ", [p for ym in wanted for p in ym]
+
+
+def _range_scan(
+    conn: sqlite3.Connection, months: list[tuple[int, int]], table: str, order: str
+) -> sqlite3.Cursor:
+    """Rows of `table` for every synced (org, repo) in `months`, in `_RANGE_ORDER` then `order`."""
+    cte, params = _wanted(months)
+    return conn.execute(
+        cte + "SELECT t.* FROM synced_months s "
+        "JOIN wanted w ON w.year = s.year AND w.month = s.month "
+        f"JOIN {table} t ON t.repo_org = s.repo_org AND t.repo_name = s.repo_name "
+        "AND t.year = s.year AND t.month = s.month "
+        f"ORDER BY {_RANGE_ORDER}, {order}",
+        params,
+    )
+
+
+def _range_key(row: sqlite3.Row, number: int) -> tuple[int, int, str, str, int]:
+    return (-row["year"], -row["month"], row["repo_org"], row["repo_name"], number)
+
+
+def _iter_range_prs(
     months: list[tuple[int, int]],
     db_path: Path | None = None,
-) -> Iterator[tuple[str, str, int, int, list[PullRequest]]]:
-    wanted = set(months)
-    for org, repo, year, month in list_synced_months(db_path=db_path):
-        if (year, month) not in wanted:
-            continue
-        yield org, repo, year, month, load_prs(org, repo, year, month, db_path=db_path)
+) -> Iterator[tuple[str, str, int, int, PullRequest]]:
+    """Every cached PR of the synced (org, repo) months in `months`, in two SQL scans.
+
+    PRs and reviews are read in the same order and stitched with a merge join, so the
+    whole range costs two queries however many repos and months it spans. PRs whose
+    stored metrics predate `METRICS_VERSION` get them rewritten once the scan is done.
+    """
+    if not months:
+        return
+    conn = open_connection(db_path)
+    reviews = _range_scan(conn, months, "reviews", "t.pr_number, t.rowid")
+    pending = next(reviews, None)
+    stale: list[tuple[str, str, int, int, PullRequest]] = []
+    for row in _range_scan(conn, months, "prs", "t.number"):
+        key = _range_key(row, row["number"])
+        while pending is not None and _range_key(pending, pending["pr_number"]) < key:
+            pending = next(reviews, None)
+        attached: list[Review] = []
+        while pending is not None and _range_key(pending, pending["pr_number"]) == key:
+            attached.append(_review(pending))
+            pending = next(reviews, None)
+        loaded = (row["repo_org"], row["repo_name"], row["year"], row["month"], _pr(row, attached))
+        if "metrics" not in loaded[4]:
+            stale.append(loaded)
+        yield loaded
+    if stale:
+        save_pr_metrics(conn, stale)
 
 
 def load_all_repos_for_range(
@@ -91,8 +202,8 @@ def load_all_repos_for_range(
 ) -> dict[str, list[PullRequest]]:
     """All cached PRs per `"org/repo"` for sealed (org, repo, year, month) tuples in the range."""
     out: dict[str, list[PullRequest]] = {}
-    for org, repo, _year, _month, prs in _iter_synced_prs(months, db_path):
-        out.setdefault(f"{org}/{repo}", []).extend(prs)
+    for org, repo, _year, _month, pr in _iter_range_prs(months, db_path):
+        out.setdefault(f"{org}/{repo}", []).append(pr)
     return out
 
 
@@ -102,11 +213,122 @@ def load_all_repos_by_month(
 ) -> dict[tuple[int, int], list[PullRequest]]:
     """All cached PRs grouped by (year, month), aggregated across every sealed repo."""
     out: dict[tuple[int, int], list[PullRequest]] = {ym: [] for ym in months}
-    for _org, _repo, year, month, prs in _iter_synced_prs(months, db_path):
-        out[(year, month)].extend(prs)
+    for _org, _repo, year, month, pr in _iter_range_prs(months, db_path):
+        out[(year, month)].append(pr)
     return out
 
 
+def refresh_dev_month_aggregates(
+    org: str, repo: str, year: int, month: int, db_path: Path | None = None
+) -> None:
+    """Rebuild a synced month's per-dev aggregates from its cached PRs; call after sealing it."""
+    conn = open_connection(db_path)
+    prs = load_prs(org, repo, year, month, db_path=db_path)
+    save_dev_month_aggregates(conn, org, repo, year, month, aggregate_prs(prs))
+
+
+def _aggregate(row: sqlite3.Row) -> DevAggregate:
+    return {
+        "pr_count": row["pr_count"],
+        "ai_count": row["ai_count"],
+        "size_sum": row["size_sum"],
+        "reviews_given": row["reviews_given"],
+        "cycle_hours": json.loads(row["cycle_hours_json"]),
+        "pickup_hours": json.loads(row["pickup_hours_json"]),
+        "review_hours": json.loads(row["review_hours_json"]),
+        "sizes": json.loads(row["sizes_json"]),
+    }
+
+
+def _iter_range_aggregates(
+    months: list[tuple[int, int]],
+    db_path: Path | None = None,
+) -> Iterator[tuple[str, str, int, int, str, DevAggregate]]:
+    """Per-dev aggregates of every synced (org, repo) month in `months`.
+
+    Months synced before aggregates existed, or whose aggregates predate
+    `METRICS_VERSION`, are rebuilt from their PRs first; every other month is
+    answered without reading a single PR row.
+    """
+    if not months:
+        return
+    conn = open_connection(db_path)
+    cte, params = _wanted(months)
+    stale = conn.execute(
+        cte + "SELECT s.repo_org, s.repo_name, s.year, s.month FROM synced_months s "
+        "JOIN wanted w ON w.year = s.year AND w.month = s.month "
+        "WHERE s.agg_version IS NOT ?",
+        [*params, METRICS_VERSION],
+    ).fetchall()
+    for org, repo, year, month in stale:
+        refresh_dev_month_aggregates(org, repo, year, month, db_path=db_path)
+    for row in _range_scan(conn, months, "dev_month_agg", "t.login"):
+        yield (
+            row["repo_org"],
+            row["repo_name"],
+            row["year"],
+            row["month"],
+            row["login"],
+            _aggregate(row),
+        )
+
+
+def load_repo_aggregates_for_range(
+    months: list[tuple[int, int]],
+    db_path: Path | None = None,
+) -> dict[str, dict[str, DevAggregate]]:
+    """Per-login aggregates per `"org/repo"`, merged over the synced months in the range."""
+    grouped: dict[str, dict[str, list[DevAggregate]]] = {}
+    for org, repo, _year, _month, login, agg in _iter_range_aggregates(months, db_path):
+        grouped.setdefault(f"{org}/{repo}", {}).setdefault(login, []).append(agg)
+    return {
+        name: {login: merge_aggregates(aggs) for login, aggs in logins.items()}
+        for name, logins in grouped.items()
+    }
+
+
+def load_aggregates_by_month(
+    months: list[tuple[int, int]],
+    db_path: Path | None = None,
+) -> dict[tuple[int, int], dict[str, DevAggregate]]:
+    """Per-login aggregates per (year, month), merged across every synced repo."""
+    grouped: dict[tuple[int, int], dict[str, list[DevAggregate]]] = {ym: {} for ym in months}
+    for _org, _repo, year, month, login, agg in _iter_range_aggregates(months, db_path):
+        grouped[(year, month)].setdefault(login, []).append(agg)
+    return {
+        ym: {login: merge_aggregates(aggs) for login, aggs in logins.items()}
+        for ym, logins in grouped.items()
+    }
+
+
+def snapshot_cache_key(
+    months: list[tuple[int, int]], version: int, db_path: Path | None = None
+) -> str | None:
+    """Fingerprint of everything a snapshot of `months` is computed from.
+
+    Covers the sorted months, the `synced_at`, partial flag and profile of every synced
+    repo-month in them, `METRICS_VERSION` and the caller's snapshot `version`, so a
+    re-pull or a newer partial sync yields a new key. None while any of those months
+    has PRs its aggregates do not reflect yet.
+    """
+    if not months:
+        return None
+    conn = open_connection(db_path)
+    cte, params = _wanted(months)
+    rows = conn.execute(
+        cte + "SELECT s.repo_org, s.repo_name, s.year, s.month, s.synced_at, s.partial, "
+        "s.profile, s.agg_version FROM synced_months s "
+        "JOIN wanted w ON w.year = s.year AND w.month = s.month "
+        "ORDER BY s.year, s.month, s.repo_org, s.repo_name",
+        params,
+    ).fetchall()
+    if any(row["agg_version"] != METRICS_VERSION for row in rows):
+        return None
+    synced = [tuple(row)[:-1] for row in rows]
+    material = json.dumps([sorted(set(months)), synced, METRICS_VERSION, version])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
 def list_synced_months(db_path: Path | None = None) -> list[tuple[str, str, int, int]]:
     """All (org, repo, year, month) tuples with data, newest first."""
     conn = open_connection(db_path)
@@ -134,3 +356,23 @@ def has_partial_for_range(months: list[tuple[int, int]], db_path: Path | None =
         if (year, month) in wanted:
             return True
     return False
+
+
+def has_timing_profile_for_range(
+    months: list[tuple[int, int]], db_path: Path | None = None
+) -> bool:
+    """True if any synced (repo, month) in the range was pulled with the `timing` profile.
+
+    That profile skips the PR body and commit messages, so its PRs never count as AI.
+    """
+    if not months:
+        return False
+    conn = open_connection(db_path)
+    cte, params = _wanted(months)
+    row = conn.execute(
+        cte + "SELECT 1 FROM synced_months s "
+        "JOIN wanted w ON w.year = s.year AND w.month = s.month "
+        "WHERE s.profile = 'timing' LIMIT 1",
+        params,
+    ).fetchone()
+    return row is not None
@@ -3,20 +3,34 @@ from pathlib import Path
 
 import typer
 
-from ...cache import is_sealed
+from ...cache import default_db_path, is_partial
 from ...github import get_github_token
-from ...utils.date_utils import month_range
+from ...github.graphql_client import set_hedging, set_response_cache
+from ...github.graphql_queries import DEFAULT_PROFILE, FETCH_PROFILES
+from ...utils.date_utils import month_iter, month_range
 from .._month_arg import parse_month_arg
 from .._options import DB_OPTION
-from ..runners.pull_runner import fetch_and_seal_month
+from ..runners.pull_runner import (
+    fetch_and_seal_month,
+    is_sealed_for,
+    pull_month_range,
+    pull_org_month,
+)
 from ..wizards.pull_wizard import pull_wizard
 
 
-def _pull_direct(month: str, org: str, repo: str, db: Path | None, re_pull: bool = False) -> None:
+def _pull_direct(
+    month: str,
+    org: str,
+    repo: str,
+    db: Path | None,
+    re_pull: bool = False,
+    profile: str = DEFAULT_PROFILE,
+) -> None:
     year, month_num = parse_month_arg(month)
     period = month_range(year, month_num)
 
-    if not re_pull and is_sealed(org, repo, year, month_num, db_path=db):
+    if not re_pull and is_sealed_for(org, repo, year, month_num, profile, db):
         typer.secho(
             f"Month {month} for {org}/{repo} is already sealed.",
             fg=typer.colors.RED,
@@ -25,30 +39,150 @@ def _pull_direct(month: str, org: str, repo: str, db: Path | None, re_pull: bool
         raise typer.Exit(code=1)
 
     incomplete = period.until > datetime.now(UTC)
+    refresh = not re_pull and is_partial(org, repo, year, month_num, db_path=db)
 
     token = get_github_token()
-    n = fetch_and_seal_month(org, repo, year, month_num, period, token, db, partial=incomplete)
+    n = fetch_and_seal_month(
+        org,
+        repo,
+        year,
+        month_num,
+        period,
+        token,
+        db,
+        partial=incomplete,
+        incremental=refresh,
+        profile=profile,
+    )
 
     tag = ""
-    if incomplete:
+    if refresh:
+        tag = " (refreshed)"
+    elif incomplete:
         tag = " (partial)"
     elif re_pull:
         tag = " (re-pulled)"
     typer.echo(f"Pulled {n} PRs for {org}/{repo} {month}.{tag}")
 
 
+def _pull_org(month: str, org: str, db: Path | None, profile: str = DEFAULT_PROFILE) -> None:
+    year, month_num = parse_month_arg(month)
+    period = month_range(year, month_num)
+    incomplete = period.until > datetime.now(UTC)
+
+    counts = pull_org_month(
+        org, year, month_num, period, get_github_token(), db, partial=incomplete, profile=profile
+    )
+
+    tag = " (partial)" if incomplete else ""
+    for full_name, n in sorted(counts.items()):
+        typer.echo(f"Pulled {n} PRs for {full_name} {month}.{tag}")
+    typer.echo(f"Done. Pulled {sum(counts.values())} PRs across {len(counts)} repos.")
+
+
+def _pull_range(
+    from_: str,
+    to: str,
+    org: str,
+    repo: str,
+    db: Path | None,
+    re_pull: bool = False,
+    profile: str = DEFAULT_PROFILE,
+) -> None:
+    start = parse_month_arg(from_, "--from")
+    end = parse_month_arg(to, "--to")
+    if end < start:
+        typer.secho("--to must be >= --from.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    months = []
+    for year, month_num in month_iter(start, end):
+        if not re_pull and is_sealed_for(org, repo, year, month_num, profile, db):
+            typer.echo(f"Skipped {year:04d}-{month_num:02d}: already sealed.")
+            continue
+        months.append((year, month_num))
+    if not months:
+        typer.echo(f"Nothing to pull for {org}/{repo} {from_} to {to}.")
+        return
+
+    counts = pull_month_range(org, repo, months, get_github_token(), db, profile=profile)
+
+    for (year, month_num), n in counts.items():
+        typer.echo(f"Pulled {n} PRs for {org}/{repo} {year:04d}-{month_num:02d}.")
+    typer.echo(f"Done. Pulled {sum(counts.values())} PRs over {len(counts)} months.")
+
+
 def pull(
     month: str | None = typer.Option(None, "--month", help="Month to pull, YYYY-MM"),
+    from_: str | None = typer.Option(
+        None, "--from", help="First month of a range to pull in one search, YYYY-MM"
+    ),
+    to: str | None = typer.Option(None, "--to", help="Last month of the range, YYYY-MM"),
     org: str | None = typer.Option(None, "--org", help="GitHub organization or user"),
     repo: str | None = typer.Option(None, "--repo", help="GitHub repository name"),
     re_pull: bool = typer.Option(
-        False, "--re-pull", help="Re-fetch even if month is already sealed"
+        False,
+        "--re-pull",
+        help="Re-fetch even if month is already sealed; partial months are re-fetched in full",
+    ),
+    jobs: int = typer.Option(
+        4, "--jobs", "-j", min=1, help="Repos to fetch in parallel (wizard mode)"
+    ),
+    org_wide: bool = typer.Option(
+        False, "--org-wide", help="One search for the whole org instead of one per repo"
+    ),
+    profile: str = typer.Option(
+        DEFAULT_PROFILE,
+        "--profile",
+        help="Fields to fetch: timing (no body/commit messages), full, or files (adds files)",
+    ),
+    hedge: bool = typer.Option(
+        False, "--hedge", help="Re-send page requests that stall past the usual latency"
+    ),
+    response_cache: bool = typer.Option(
+        False,
+        "--response-cache",
+        help="Replay GitHub responses seen in the last day from disk (next to the cache DB)",
     ),
     db: Path | None = DB_OPTION,
 ) -> None:
-    """Pull a month of PRs for one repository into the cache."""
-    if month is None and org is None and repo is None:
-        pull_wizard(db_path=db, re_pull=re_pull)
+    """Pull a month (or a --from/--to range) of PRs for one repository into the cache."""
+    if profile not in FETCH_PROFILES:
+        typer.secho(
+            f"--profile must be one of: {', '.join(FETCH_PROFILES)}.",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    set_hedging(hedge)
+    set_response_cache(
+        (db or default_db_path()).parent / "responses.db" if response_cache else None
+    )
+
+    if month is None and from_ is None and to is None and org is None and repo is None:
+        pull_wizard(db_path=db, re_pull=re_pull, jobs=jobs, org_wide=org_wide, profile=profile)
+        return
+
+    if org_wide:
+        if month is None or org is None or repo is not None or from_ is not None or to is not None:
+            typer.secho(
+                "--org-wide takes --month and --org (without --repo).",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        _pull_org(month, org, db, profile=profile)
+        return
+
+    if from_ is not None or to is not None:
+        if from_ is None or to is None or month is not None or org is None or repo is None:
+            typer.secho(
+                "Provide --from, --to, --org and --repo together (without --month).",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        _pull_range(from_, to, org, repo, db, re_pull=re_pull, profile=profile)
         return
 
     if month is None or org is None or repo is None:
@@ -59,4 +193,4 @@ def pull(
         )
         raise typer.Exit(code=1)
 
-    _pull_direct(month, org, repo, db, re_pull=re_pull)
+    _pull_direct(month, org, repo, db, re_pull=re_pull, profile=profile)
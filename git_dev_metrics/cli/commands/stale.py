@@ -4,9 +4,18 @@ from pathlib import Path
 import typer
 
 from ...cache import get_targets, list_synced_months
-from ...github import GitHubNotFoundError, fetch_open_prs, get_github_token
+from ...github import (
+    GitHubError,
+    GitHubNotFoundError,
+    TokenPool,
+    extra_tokens,
+    fetch_open_prs,
+    fetch_open_prs_many,
+    get_github_token,
+)
 from ...metrics._stale_pr import StalePr, get_stale_prs
 from ...metrics.printer.stale import FileStaleHtmlPrinter
+from ...models import OpenPullRequest
 from .._browser import open_in_browser
 from .._options import DB_OPTION
 
@@ -16,8 +25,27 @@ def _default_output() -> Path:
     return Path(f"./metrics_results/stale_{today}.html")
 
 
+def _fetch_all_open(
+    tokens: TokenPool, repos: list[tuple[str, str]], jobs: int
+) -> dict[tuple[str, str], list[OpenPullRequest] | GitHubError]:
+    if jobs > 1:
+        return fetch_open_prs_many(tokens, repos, jobs)
+    out: dict[tuple[str, str], list[OpenPullRequest] | GitHubError] = {}
+    for org, repo in repos:
+        try:
+            out[(org, repo)] = tokens.call(
+                lambda token, org=org, repo=repo: fetch_open_prs(token, org, repo, quiet=True)
+            )
+        except GitHubNotFoundError as e:
+            out[(org, repo)] = e
+    return out
+
+
 def stale(
     output: Path | None = typer.Option(None, "--output", help="Output HTML path"),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j", min=1, help="Repos to scan concurrently (>1 uses the asyncio backend)"
+    ),
     db: Path | None = DB_OPTION,
 ) -> None:
     """Find stale open PRs across all cached repos."""
@@ -30,18 +58,18 @@ def stale(
     threshold_days = targets.get("stale_threshold_days", 7)
     threshold_hours = threshold_days * 24
 
-    token = get_github_token()
+    tokens = TokenPool([get_github_token(), *extra_tokens()])
     all_stale: list[StalePr] = []
-    for org, repo in repos:
-        try:
-            opens = fetch_open_prs(token, org, repo, quiet=True)
-        except GitHubNotFoundError:
+    for (org, repo), opens in _fetch_all_open(tokens, repos, jobs).items():
+        if isinstance(opens, GitHubNotFoundError):
             typer.secho(
                 f"Skipping {org}/{repo} — not found on GitHub",
                 fg=typer.colors.YELLOW,
                 err=True,
             )
             continue
+        if isinstance(opens, GitHubError):
+            raise opens
         all_stale.extend(get_stale_prs(opens, f"{org}/{repo}", threshold_hours=threshold_hours))
     all_stale.sort(key=lambda x: x.age_hours, reverse=True)
 
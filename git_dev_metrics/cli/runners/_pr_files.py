@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import typer
+
+from ...cache import has_pr_files, list_synced_months, load_pr_files, replace_pr_files
+from ...github.auth_cache import load_token
+from ...github.queries import fetch_skill_report_prs
+
+YearMonth = tuple[int, int]
+
+
+def load_report_prs(months: list[YearMonth], db_path: Path | None) -> list[dict]:
+    """File-level PRs of every synced repo in `months`, read from the cache.
+
+    Months pulled before their file data was captured are backfilled from GitHub
+    once; after that the skill and lang reports never touch the network.
+    """
+    wanted = set(months)
+    synced = [
+        (org, repo, year, month)
+        for org, repo, year, month in list_synced_months(db_path=db_path)
+        if (year, month) in wanted
+    ]
+    missing = [scope for scope in synced if not has_pr_files(*scope, db_path=db_path)]
+    if missing:
+        token = load_token()
+        if not token:
+            typer.secho("No GitHub token found. Run login first.", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        for org, repo, year, month in missing:
+            typer.echo(f"Fetching file data for {org}/{repo} {year}-{month:02d}...")
+            prs = fetch_skill_report_prs(token, org, repo, year, month)
+            replace_pr_files(prs, org, repo, year, month, db_path=db_path)
+
+    return [pr for scope in synced for pr in load_pr_files(*scope, db_path=db_path)]
@@ -1,10 +1,109 @@
-from collections.abc import Callable
+import functools
+import queue
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
-from ...cache import insert_prs, mark_partial, seal_month
-from ...github.queries import fetch_repo_metrics
-from ...models import PullRequest
-from ...utils.date_utils import TimePeriod
+from ...cache import (
+    clear_checkpoints,
+    count_prs,
+    get_page_size,
+    get_partial_synced_at,
+    get_synced_profile,
+    insert_prs,
+    insert_prs_by_month,
+    is_sealed,
+    load_checkpoints,
+    mark_files_synced,
+    mark_partial,
+    refresh_dev_month_aggregates,
+    save_checkpoint,
+    save_page_size,
+    seal_month,
+)
+from ...github import GitHubAuthError, GitHubError, GitHubRateLimitError, TokenPool
+from ...github.graphql_queries import DEFAULT_PROFILE, profile_covers
+from ...github.queries import iter_org_metrics, iter_repo_metrics
+from ...models import OrgPullRequestPage, PullRequest, PullRequestPage
+from ...utils.date_utils import TimePeriod, month_range, range_period
+
+# (token, org, repo, period, resume=checkpointed cursors, updated_since=watermark,
+#  page_size=size to start from) -> pages
+PageFetch = Callable[..., Iterable[PullRequestPage]]
+
+_PAGES_IN_FLIGHT_PER_JOB = 2
+
+# Search indexing lags merges a little; re-read this much before the last sync.
+WATERMARK_MARGIN = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class RepoPullResult:
+    full_name: str
+    count: int = 0
+    error: str | None = None
+
+
+def is_sealed_for(
+    org: str, repo: str, year: int, month: int, profile: str, db_path: Path | None
+) -> bool:
+    """Sealed with every field `profile` needs; a narrower seal is worth pulling again."""
+    if not is_sealed(org, repo, year, month, db_path=db_path):
+        return False
+    have = get_synced_profile(org, repo, year, month, db_path=db_path)
+    return have is not None and profile_covers(have, profile)
+
+
+def _remember_page_size(org: str, repo: str, size: int | None, db_path: Path | None) -> None:
+    """Keep the size a stream settled on (even a failed one) to start the next pull from."""
+    if size is not None:
+        save_page_size(org, repo, size, db_path=db_path)
+
+
+def _finish_month(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None,
+    *,
+    partial: bool,
+    started_at: datetime,
+    profile: str = DEFAULT_PROFILE,
+) -> None:
+    if partial:
+        mark_partial(org, repo, year, month, db_path=db_path, synced_at=started_at, profile=profile)
+    else:
+        seal_month(org, repo, year, month, db_path=db_path, profile=profile)
+    refresh_dev_month_aggregates(org, repo, year, month, db_path=db_path)
+    if profile_covers(profile, "files"):
+        mark_files_synced(org, repo, year, month, db_path=db_path)
+
+
+def _watermark(
+    org: str,
+    repo: str,
+    year: int,
+    month: int,
+    db_path: Path | None,
+    *,
+    incremental: bool,
+    profile: str = DEFAULT_PROFILE,
+) -> datetime | None:
+    """Fetch only PRs updated after this; None means fetch the whole month.
+
+    A month synced with a narrower profile is fetched whole, so no PR misses fields.
+    """
+    if not incremental:
+        return None
+    have = get_synced_profile(org, repo, year, month, db_path=db_path)
+    if have is None or not profile_covers(have, profile):
+        return None
+    synced_at = get_partial_synced_at(org, repo, year, month, db_path=db_path)
+    return synced_at - WATERMARK_MARGIN if synced_at else None
 
 
 def fetch_and_seal_month(
@@ -15,15 +114,380 @@ def fetch_and_seal_month(
     period: TimePeriod,
     token: str,
     db_path: Path | None,
-    fetch: Callable[..., list[PullRequest]] | None = None,
+    fetch: PageFetch | None = None,
     *,
     partial: bool = False,
+    incremental: bool = False,
+    profile: str = DEFAULT_PROFILE,
 ) -> int:
-    """Fetch a month of PRs for one repo, upsert, seal or mark partial, return PR count."""
-    prs = (fetch or fetch_repo_metrics)(token, org, repo, period)
-    insert_prs(prs, org, repo, year, month, db_path=db_path)
-    if partial:
-        mark_partial(org, repo, year, month, db_path=db_path)
+    """Upsert a repo-month page by page as it streams in, seal or mark partial, return PR count.
+
+    Each page is checkpointed with its cursor, so a rerun after a failure resumes where the
+    last stored page ended; sealing clears the checkpoints. With `incremental`, a month
+    already marked partial only fetches PRs updated since its last sync. `profile` picks
+    the fields fetched and is recorded with the month.
+    """
+    started_at = datetime.now(UTC)
+    since = _watermark(org, repo, year, month, db_path, incremental=incremental, profile=profile)
+    resume, count = load_checkpoints(org, repo, year, month, db_path=db_path)
+    pages = (fetch or functools.partial(iter_repo_metrics, profile=profile))(
+        token,
+        org,
+        repo,
+        period,
+        resume=resume,
+        updated_since=since,
+        page_size=get_page_size(org, repo, db_path=db_path),
+    )
+    size = None
+    try:
+        for page in pages:
+            _store_page(page, org, repo, year, month, db_path)
+            count += len(page["prs"])
+            size = page.get("page_size", size)
+    finally:
+        _remember_page_size(org, repo, size, db_path)
+    _finish_month(
+        org, repo, year, month, db_path, partial=partial, started_at=started_at, profile=profile
+    )
+    return count
+
+
+def _store_page(
+    page: PullRequestPage, org: str, repo: str, year: int, month: int, db_path: Path | None
+) -> None:
+    checkpoint = (page["query"], page["cursor"])
+    insert_prs(page["prs"], org, repo, year, month, db_path=db_path, checkpoint=checkpoint)
+
+
+def _bucket_by_month(prs: list[PullRequest]) -> dict[tuple[int, int], list[PullRequest]]:
+    buckets: dict[tuple[int, int], list[PullRequest]] = {}
+    for pr in prs:
+        merged_at = pr["merged_at"]
+        if merged_at is not None:
+            merged_at = merged_at.astimezone(UTC)
+            buckets.setdefault((merged_at.year, merged_at.month), []).append(pr)
+    return buckets
+
+
+def pull_month_range(
+    org: str,
+    repo: str,
+    months: list[tuple[int, int]],
+    token: str,
+    db_path: Path | None,
+    fetch: PageFetch | None = None,
+    *,
+    profile: str = DEFAULT_PROFILE,
+) -> dict[tuple[int, int], int]:
+    """Pull several months of one repo with a single search over the whole `merged:` range.
+
+    Pages are bucketed by `merged_at` month and upserted as they arrive; PRs of months
+    not in `months` (e.g. already sealed ones inside the range) are dropped. Every month
+    is sealed, or marked partial if not over yet, only once the search has finished.
+    The checkpoint is kept under the first month and stored with each page's rows.
+    Returns the PRs stored per month, those of an earlier, resumed run included.
+    """
+    started_at = datetime.now(UTC)
+    first = months[0]
+    wanted = set(months)
+    resume, _ = load_checkpoints(org, repo, *first, db_path=db_path)
+    period = range_period(first, months[-1])
+    pages = (fetch or functools.partial(iter_repo_metrics, profile=profile))(
+        token,
+        org,
+        repo,
+        period,
+        resume=resume,
+        updated_since=None,
+        page_size=get_page_size(org, repo, db_path=db_path),
+    )
+    size = None
+    try:
+        for page in pages:
+            by_month = {
+                ym: prs for ym, prs in _bucket_by_month(page["prs"]).items() if ym in wanted
+            }
+            checkpoint = (page["query"], page["cursor"])
+            rows = len(page["prs"])
+            insert_prs_by_month(by_month, org, repo, first, checkpoint, rows, db_path=db_path)
+            size = page.get("page_size", size)
+    finally:
+        _remember_page_size(org, repo, size, db_path)
+    for year, month in [*months[1:], first]:  # the first month's seal drops the checkpoint
+        partial = month_range(year, month).until > started_at
+        _finish_month(
+            org, repo, year, month, db_path, partial=partial, started_at=started_at, profile=profile
+        )
+    return {
+        (year, month): count_prs(org, repo, year, month, db_path=db_path) for year, month in months
+    }
+
+
+ORG_WIDE = "*"
+
+
+def pull_org_month(
+    org: str,
+    year: int,
+    month: int,
+    period: TimePeriod,
+    token: str | TokenPool,
+    db_path: Path | None,
+    fetch: Callable[..., Iterable[OrgPullRequestPage]] | None = None,
+    *,
+    repos: Iterable[str] | None = None,
+    partial: bool = False,
+    profile: str = DEFAULT_PROFILE,
+) -> dict[str, int]:
+    """Pull a month for a whole org with one `org:` search and split it into repo rows.
+
+    Every repo that appeared is sealed (or marked partial). With `repos`, only those
+    `"org/repo"` names are stored, and the ones that did not appear are sealed empty: the
+    org-wide search proves they merged nothing. Returns PR counts per repo.
+    Given a `TokenPool`, a token that is rejected or runs out of budget is taken out
+    and the search carries on from its last page with the next one.
+    """
+    started_at = datetime.now(UTC)
+    tokens = token if isinstance(token, TokenPool) else TokenPool([token])
+    wanted = set(repos) if repos is not None else None
+    counts: dict[str, int] = dict.fromkeys(wanted or (), 0)
+    resume, _ = load_checkpoints(org, ORG_WIDE, year, month, db_path=db_path)
+    cursors = dict(resume)
+    fetch_fn = fetch or functools.partial(iter_org_metrics, profile=profile)
+    size = get_page_size(org, ORG_WIDE, db_path=db_path)
+    try:
+        while True:
+            current = tokens.acquire()
+            try:
+                for page in fetch_fn(current, org, period, resume=cursors, page_size=size):
+                    for full_name, prs in page["prs_by_repo"].items():
+                        if wanted is not None and full_name not in wanted:
+                            continue
+                        repo_org, repo = full_name.split("/", 1)
+                        insert_prs(prs, repo_org, repo, year, month, db_path=db_path)
+                        counts[full_name] = counts.get(full_name, 0) + len(prs)
+                    rows = sum(len(prs) for prs in page["prs_by_repo"].values())
+                    save_checkpoint(
+                        org,
+                        ORG_WIDE,
+                        year,
+                        month,
+                        page["query"],
+                        page["cursor"],
+                        rows,
+                        db_path=db_path,
+                    )
+                    cursors[page["query"]] = page["cursor"]
+                    size = page.get("page_size", size)
+            except (GitHubAuthError, GitHubRateLimitError) as e:
+                if not tokens.take_out(current, e):
+                    raise
+            else:
+                break
+    finally:
+        _remember_page_size(org, ORG_WIDE, size, db_path)
+    for full_name in counts:
+        repo_org, repo = full_name.split("/", 1)
+        _finish_month(
+            repo_org,
+            repo,
+            year,
+            month,
+            db_path,
+            partial=partial,
+            started_at=started_at,
+            profile=profile,
+        )
+    clear_checkpoints(org, ORG_WIDE, year, month, db_path=db_path)
+    return counts
+
+
+def pull_repos_org_wide(
+    full_names: list[str],
+    year: int,
+    month: int,
+    period: TimePeriod,
+    token: str | TokenPool,
+    db_path: Path | None,
+    *,
+    partial: bool = False,
+    profile: str = DEFAULT_PROFILE,
+    on_result: Callable[[RepoPullResult], None] | None = None,
+) -> list[RepoPullResult]:
+    """`pull_repos_concurrently` over one org-wide search; a failed search fails every repo."""
+    by_org: dict[str, list[str]] = {}
+    for full_name in full_names:
+        by_org.setdefault(full_name.split("/", 1)[0], []).append(full_name)
+    results: list[RepoPullResult] = []
+    for org, names in by_org.items():
+        try:
+            counts = pull_org_month(
+                org,
+                year,
+                month,
+                period,
+                token,
+                db_path,
+                repos=names,
+                partial=partial,
+                profile=profile,
+            )
+        except GitHubError as e:
+            batch = [RepoPullResult(name, error=str(e)) for name in names]
+        else:
+            batch = [RepoPullResult(name, count=counts[name]) for name in names]
+        for result in batch:
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+@dataclass(frozen=True)
+class _Page:
+    full_name: str
+    page: PullRequestPage
+
+
+@dataclass(frozen=True)
+class _Done:
+    full_name: str
+    error: BaseException | None = None
+
+
+def _put(out: queue.Queue, item: _Page | _Done, stop: threading.Event) -> bool:
+    """Block until the writer takes `item`; give up once the writer has stopped."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _produce(
+    fetch: PageFetch,
+    tokens: TokenPool,
+    full_name: str,
+    period: TimePeriod,
+    resume: Mapping[str, str | None],
+    since: datetime | None,
+    page_size: int | None,
+    out: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Stream one repo's pages to the writer.
+
+    A token that is rejected or runs out of budget is taken out of the pool, and the
+    repo carries on from its last page with the next token.
+    """
+    org, repo = full_name.split("/", 1)
+    cursors = dict(resume)
+    try:
+        while True:
+            token = tokens.acquire()
+            try:
+                pages = fetch(
+                    token,
+                    org,
+                    repo,
+                    period,
+                    resume=cursors,
+                    updated_since=since,
+                    page_size=page_size,
+                )
+                for page in pages:
+                    if not _put(out, _Page(full_name, page), stop):
+                        return
+                    cursors[page["query"]] = page["cursor"]
+                    page_size = page.get("page_size", page_size)
+            except (GitHubAuthError, GitHubRateLimitError) as e:
+                if not tokens.take_out(token, e):
+                    raise
+            else:
+                break
+    except BaseException as e:  # handed to the writer, which decides what is fatal
+        _put(out, _Done(full_name, e), stop)
     else:
-        seal_month(org, repo, year, month, db_path=db_path)
-    return len(prs)
+        _put(out, _Done(full_name), stop)
+
+
+def pull_repos_concurrently(
+    full_names: list[str],
+    year: int,
+    month: int,
+    period: TimePeriod,
+    token: str | TokenPool,
+    db_path: Path | None,
+    fetch: PageFetch | None = None,
+    *,
+    partial: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
+    profile: str = DEFAULT_PROFILE,
+    on_result: Callable[[RepoPullResult], None] | None = None,
+) -> list[RepoPullResult]:
+    """Fetch `"org/repo"` months on a pool of `jobs` workers; the caller's thread does every write.
+
+    Workers hand over pages through a bounded queue, and each page is upserted in its own
+    transaction as it arrives, so writes overlap with network waits and memory stays at a
+    few pages per worker. Checkpoints and `incremental` work as in `fetch_and_seal_month`.
+    A repo whose fetch raises `GitHubError` is reported as failed (its month stays
+    unsealed, resumable) and the batch carries on. Given a `TokenPool`, each repo
+    starts on the token with the most budget left.
+    """
+    tokens = token if isinstance(token, TokenPool) else TokenPool([token])
+    fetch_fn = fetch or functools.partial(iter_repo_metrics, profile=profile)
+    started_at = datetime.now(UTC)
+    workers = max(1, jobs)
+    out: queue.Queue = queue.Queue(maxsize=workers * _PAGES_IN_FLIGHT_PER_JOB)
+    stop = threading.Event()
+    counts: dict[str, int] = {}
+    sizes: dict[str, int] = {}
+    results: list[RepoPullResult] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for full_name in full_names:
+            org, repo = full_name.split("/", 1)
+            resume, counts[full_name] = load_checkpoints(org, repo, year, month, db_path=db_path)
+            since = _watermark(
+                org, repo, year, month, db_path, incremental=incremental, profile=profile
+            )
+            size = get_page_size(org, repo, db_path=db_path)
+            pool.submit(
+                _produce, fetch_fn, tokens, full_name, period, resume, since, size, out, stop
+            )
+        try:
+            while len(results) < len(full_names):
+                item = out.get()
+                org, repo = item.full_name.split("/", 1)
+                if isinstance(item, _Page):
+                    _store_page(item.page, org, repo, year, month, db_path)
+                    counts[item.full_name] += len(item.page["prs"])
+                    if "page_size" in item.page:
+                        sizes[item.full_name] = item.page["page_size"]
+                    continue
+                _remember_page_size(org, repo, sizes.get(item.full_name), db_path)
+                if item.error is not None and not isinstance(item.error, GitHubError):
+                    raise item.error
+                if item.error is None:
+                    _finish_month(
+                        org,
+                        repo,
+                        year,
+                        month,
+                        db_path,
+                        partial=partial,
+                        started_at=started_at,
+                        profile=profile,
+                    )
+                    result = RepoPullResult(item.full_name, count=counts[item.full_name])
+                else:
+                    result = RepoPullResult(item.full_name, error=str(item.error))
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            stop.set()
+    return results
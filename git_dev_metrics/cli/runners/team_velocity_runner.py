@@ -3,9 +3,9 @@ from pathlib import Path
 
 import typer
 
-from ...cache import load_all_repos_by_month
+from ...cache import load_aggregates_by_month
 from ...metrics.printer.team_velocity import FileTeamVelocityPrinter
-from ...metrics.team_velocity_calculator import build_team_velocity_dataset
+from ...metrics.team_velocity_calculator import team_velocity_from_aggregates
 from ...utils.date_utils import month_iter
 from .._browser import open_in_browser
 
@@ -30,8 +30,8 @@ def perform_team_velocity(
         raise typer.Exit(code=1)
 
     months = month_iter(from_ym, to_ym)
-    prs_per_month = load_all_repos_by_month(months, db_path=db_path)
-    if not any(prs_per_month.values()):
+    aggregates_per_month = load_aggregates_by_month(months, db_path=db_path)
+    if not any(aggregates_per_month.values()):
         typer.secho(
             "No synced data for selected range. Run pull first.",
             fg=typer.colors.RED,
@@ -39,7 +39,7 @@ def perform_team_velocity(
         )
         raise typer.Exit(code=1)
 
-    dataset = build_team_velocity_dataset(months, prs_per_month)
+    dataset = team_velocity_from_aggregates(months, aggregates_per_month)
     first, last = months[0], months[-1]
     period_range = (
         f"{datetime(first[0], first[1], 1).strftime('%b %Y')}"
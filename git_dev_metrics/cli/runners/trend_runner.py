@@ -2,9 +2,9 @@ from pathlib import Path
 
 import typer
 
-from ...cache import load_all_repos_by_month
+from ...cache import has_timing_profile_for_range, load_aggregates_by_month
 from ...metrics.printer.trend import FileTrendPrinter
-from ...metrics.trend_calculator import build_trend_dataset
+from ...metrics.trend_calculator import trend_dataset_from_aggregates
 from ...utils.date_utils import month_iter
 from .._browser import open_in_browser
 
@@ -24,14 +24,14 @@ def perform_trend(
     output: Path | None,
     db_path: Path | None,
 ) -> None:
-    """Validate range, aggregate PRs across every cached repo, render HTML, open browser."""
+    """Validate range, merge cached per-dev aggregates, render HTML, open browser."""
     if to_ym < from_ym:
         typer.secho("--to must be >= --from.", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
 
     months = month_iter(from_ym, to_ym)
-    prs_per_month = load_all_repos_by_month(months, db_path=db_path)
-    if not any(prs_per_month.values()):
+    aggregates_per_month = load_aggregates_by_month(months, db_path=db_path)
+    if not any(aggregates_per_month.values()):
         typer.secho(
             "No synced data for selected range. Run pull first.",
             fg=typer.colors.RED,
@@ -39,7 +39,14 @@ def perform_trend(
         )
         raise typer.Exit(code=1)
 
-    dataset = build_trend_dataset(months, prs_per_month)
+    if has_timing_profile_for_range(months, db_path=db_path):
+        typer.secho(
+            "Some months were pulled with --profile timing; their AI % reads as 0.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+
+    dataset = trend_dataset_from_aggregates(months, aggregates_per_month)
     out_path = output or _default_output(from_ym, to_ym)
     FileTrendPrinter(out_path).render(dataset)
     typer.echo(f"Trend written to {out_path}.")
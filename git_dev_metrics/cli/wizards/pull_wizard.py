@@ -5,19 +5,27 @@ from pathlib import Path
 import questionary
 import typer
 
-from ...cache import is_sealed
 from ...github import (
+    TokenPool,
+    extra_tokens,
     fetch_org_repositories,
     fetch_repositories,
     get_github_token,
     load_last_org,
     save_last_org,
 )
-from ...github.queries import fetch_repo_metrics
-from ...models import PullRequest, Repository
+from ...github.graphql_client import connection_stats
+from ...github.graphql_queries import DEFAULT_PROFILE
+from ...models import Repository
 from ...utils.date_utils import TimePeriod, month_range
 from .._month_arg import parse_month_arg
-from ..runners.pull_runner import fetch_and_seal_month
+from ..runners.pull_runner import (
+    PageFetch,
+    RepoPullResult,
+    is_sealed_for,
+    pull_repos_concurrently,
+    pull_repos_org_wide,
+)
 from ._wizard import _STYLE
 from .prompts import prompt_org_name, prompt_repo_selection
 
@@ -82,14 +90,18 @@ def pull_wizard(
     ask_month: Callable[[list[MonthChoice]], str | None] = _prompt_month_pick,
     ask_repos: Callable[[dict[str, str]], list[str]] = prompt_repo_selection,
     clock: Callable[[], datetime] = lambda: datetime.now(UTC),
-    fetch: Callable[..., list[PullRequest]] = fetch_repo_metrics,
+    fetch: PageFetch | None = None,
     fetch_repos: Callable[[str, str | None], list[Repository]] = _default_fetch_repos,
     get_token: Callable[[], str] = get_github_token,
     re_pull: bool = False,
+    jobs: int = 1,
+    org_wide: bool = False,
+    profile: str = DEFAULT_PROFILE,
 ) -> None:
     org, picked, year, month_num, period = _select_org_month(ask_org, ask_month, clock)
 
     token = get_token()
+    tokens = TokenPool([token, *extra_tokens()])
     active = _filter_active(fetch_repos(token, org), period.since)
     if not active:
         typer.secho(f"No active repos for {org} in {picked}.", fg=typer.colors.RED, err=True)
@@ -100,7 +112,26 @@ def pull_wizard(
     if not selected:
         raise typer.Exit(code=1)
 
-    _pull_each(selected, year, month_num, period, token, fetch, db_path, re_pull=re_pull)
+    _pull_each(
+        selected,
+        year,
+        month_num,
+        period,
+        tokens,
+        fetch,
+        db_path,
+        re_pull=re_pull,
+        jobs=jobs,
+        org_wide=org_wide,
+        profile=profile,
+    )
+
+
+def _report(result: RepoPullResult, tag: str) -> None:
+    if result.error is not None:
+        typer.secho(f"Failed {result.full_name}: {result.error}", fg=typer.colors.RED, err=True)
+        return
+    typer.echo(f"Pulled {result.count} PRs for {result.full_name}.{tag}")
 
 
 def _pull_each(
@@ -108,37 +139,76 @@ def _pull_each(
     year: int,
     month_num: int,
     period: TimePeriod,
-    token: str,
-    fetch: Callable[..., list[PullRequest]],
+    tokens: TokenPool,
+    fetch: PageFetch | None,
     db_path: Path | None,
     *,
     re_pull: bool = False,
+    jobs: int = 1,
+    org_wide: bool = False,
+    profile: str = DEFAULT_PROFILE,
 ) -> None:
-    pulled = 0
     skipped = 0
+    to_pull: list[str] = []
     partial = period.until > datetime.now(UTC)
     for full_name in selected:
         org, repo = full_name.split("/", 1)
-        if not re_pull and is_sealed(org, repo, year, month_num, db_path=db_path):
+        if not re_pull and is_sealed_for(org, repo, year, month_num, profile, db_path):
             typer.echo(f"Skipped {full_name}: already sealed.")
             skipped += 1
             continue
-        n = fetch_and_seal_month(
-            org,
-            repo,
+        to_pull.append(full_name)
+
+    tag = ""
+    if partial:
+        tag = " (partial)"
+    elif re_pull:
+        tag = " (re-pulled)"
+    if org_wide:
+        results = pull_repos_org_wide(
+            to_pull,
             year,
             month_num,
             period,
-            token,
+            tokens,
+            db_path,
+            partial=partial,
+            profile=profile,
+            on_result=lambda result: _report(result, tag),
+        )
+    else:
+        results = pull_repos_concurrently(
+            to_pull,
+            year,
+            month_num,
+            period,
+            tokens,
             db_path,
             fetch=fetch,
             partial=partial,
+            jobs=jobs,
+            incremental=not re_pull,
+            profile=profile,
+            on_result=lambda result: _report(result, tag),
+        )
+    failed = sum(1 for r in results if r.error is not None)
+    pulled = len(results) - failed
+    if failed:
+        typer.echo(f"Done. Pulled {pulled}, skipped {skipped}, failed {failed}.")
+    else:
+        typer.echo(f"Done. Pulled {pulled}, skipped {skipped}.")
+    stats = connection_stats()
+    if stats.opened:
+        typer.echo(f"Connections: {stats.opened} opened, {stats.reused} reused.")
+    _report_usage(tokens)
+
+
+def _report_usage(tokens: TokenPool) -> None:
+    for usage in tokens.usage():
+        if not usage.requests and usage.state == "ok":
+            continue
+        left = "" if usage.remaining is None else f", {usage.remaining} left"
+        state = "" if usage.state == "ok" else f" ({usage.state})"
+        typer.echo(
+            f"Token {usage.label}: {usage.requests} requests, {usage.points} points{left}.{state}"
         )
-        tag = ""
-        if partial:
-            tag = " (partial)"
-        elif re_pull:
-            tag = " (re-pulled)"
-        typer.echo(f"Pulled {n} PRs for {full_name}.{tag}")
-        pulled += 1
-    typer.echo(f"Done. Pulled {pulled}, skipped {skipped}.")
@@ -1,6 +1,6 @@
 """Github auth and data fetching."""
 
-from .auth import get_github_token
+from .auth import extra_tokens, get_github_token
 from .exceptions import (
     GitHubAPIError,
     GitHubAuthError,
@@ -11,10 +11,12 @@ from .exceptions import (
 from .org_cache import load_last_org, save_last_org
 from .queries import (
     fetch_open_prs,
+    fetch_open_prs_many,
     fetch_org_repositories,
     fetch_repo_metrics,
     fetch_repositories,
 )
+from .token_pool import TokenPool, TokenUsage
 
 __all__ = [
     "GitHubAPIError",
@@ -22,7 +24,11 @@ __all__ = [
     "GitHubError",
     "GitHubNotFoundError",
     "GitHubRateLimitError",
+    "TokenPool",
+    "TokenUsage",
+    "extra_tokens",
     "fetch_open_prs",
+    "fetch_open_prs_many",
     "fetch_org_repositories",
     "fetch_repo_metrics",
     "fetch_repositories",
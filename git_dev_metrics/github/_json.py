@@ -0,0 +1,22 @@
+"""JSON decoding for GraphQL responses.
+
+Uses orjson when it is installed (`uv sync --extra fast`); large search pages with PR
+bodies and commit messages decode several times faster. Falls back to the stdlib.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # the stdlib decoder gives the same result, only slower
+    orjson = None
+
+FAST_JSON = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
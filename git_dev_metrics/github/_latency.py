@@ -0,0 +1,84 @@
+"""Per-endpoint latency tracking for adaptive timeouts and request hedging.
+
+Latencies are kept per GraphQL operation name over a sliding window. Once an
+endpoint has enough samples, its timeout follows the observed p99 rather than
+the fixed `DEFAULT_TIMEOUT`, and its p95 tells when a page request has stalled
+long enough to be worth hedging.
+"""
+
+import threading
+from collections import deque
+
+from gql.graphql_request import GraphQLRequest
+from graphql import OperationDefinitionNode, OperationType
+
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_FACTOR = 2.0
+MIN_TIMEOUT = 10.0
+HEDGE_PERCENTILE = 0.95
+
+
+def _operation(request: GraphQLRequest) -> OperationDefinitionNode | None:
+    for definition in request.document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            return definition
+    return None
+
+
+def endpoint_name(request: GraphQLRequest) -> str:
+    """The operation name a request's latency is tracked under."""
+    operation = _operation(request)
+    if operation is None or operation.name is None:
+        return "anonymous"
+    return operation.name.value
+
+
+def is_idempotent(request: GraphQLRequest) -> bool:
+    """Queries are read-only and safe to send twice; mutations are not."""
+    operation = _operation(request)
+    return operation is not None and operation.operation == OperationType.QUERY
+
+
+class LatencyTracker:
+    """Sliding window of request latencies per endpoint. Thread-safe."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_SAMPLES) -> None:
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, q: float) -> float | None:
+        """Nearest-rank `q` percentile (0..1), or None until the endpoint has enough samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint) or ())
+        if len(samples) < self._min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def timeout(self, endpoint: str, default: float) -> float:
+        """A multiple of the endpoint's p99, kept within `[MIN_TIMEOUT, default]`."""
+        p99 = self.percentile(endpoint, TIMEOUT_PERCENTILE)
+        if p99 is None:
+            return default
+        return min(default, max(MIN_TIMEOUT, p99 * TIMEOUT_FACTOR))
+
+    def hedge_delay(self, endpoint: str) -> float | None:
+        """How long to wait on a request before sending a duplicate; None: not enough data."""
+        return self.percentile(endpoint, HEDGE_PERCENTILE)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+latency = LatencyTracker()
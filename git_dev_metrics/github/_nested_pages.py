@@ -0,0 +1,116 @@
+"""Second-phase paging of PR connections that overflow their inline limits.
+
+The first-phase queries keep `reviews`, `commits` and `files` small so pages stay
+fast. Any PR whose connection reports another page is revisited here. Aliased
+`node(id:)` lookups are batched into one request, each with its own cursor, and
+the batches run concurrently until every connection is complete.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import gql
+from gql import Client
+from gql.graphql_request import GraphQLRequest
+
+from .graphql_client import execute_query
+
+NESTED_PAGE_SIZE = 100
+NESTED_BATCH_SIZE = 20
+NESTED_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class _Connection:
+    """How to page one PR connection: its size/cursor arguments and selected fields."""
+
+    size_arg: str
+    cursor_arg: str
+    has_more: str
+    cursor: str
+    fields: str
+
+
+CONNECTIONS: dict[str, _Connection] = {
+    "reviews": _Connection(
+        "first", "after", "hasNextPage", "endCursor", "author { login } state submittedAt"
+    ),
+    # `commits(last:)` pages backwards; earlier commits go in front.
+    "commits": _Connection(
+        "last", "before", "hasPreviousPage", "startCursor", "commit { committedDate message }"
+    ),
+    "files": _Connection("first", "after", "hasNextPage", "endCursor", "path additions deletions"),
+}
+
+
+@dataclass(frozen=True)
+class _Overflow:
+    pr: dict[str, Any]
+    name: str
+    cursor: str
+
+
+def _overflows(prs: list[dict[str, Any]], names: tuple[str, ...]) -> list[_Overflow]:
+    out: list[_Overflow] = []
+    for pr in prs:
+        for name in names:
+            spec = CONNECTIONS[name]
+            page_info = (pr.get(name) or {}).get("pageInfo") or {}
+            if pr.get("id") and page_info.get(spec.has_more) and page_info.get(spec.cursor):
+                out.append(_Overflow(pr, name, page_info[spec.cursor]))
+    return out
+
+
+def _batch_query(batch: list[_Overflow]) -> tuple[GraphQLRequest, dict[str, Any]]:
+    params: list[str] = []
+    lookups: list[str] = []
+    variables: dict[str, Any] = {}
+    for i, overflow in enumerate(batch):
+        spec = CONNECTIONS[overflow.name]
+        params.append(f"$id{i}: ID!, $c{i}: String")
+        variables[f"id{i}"] = overflow.pr["id"]
+        variables[f"c{i}"] = overflow.cursor
+        lookups.append(
+            f"o{i}: node(id: $id{i}) {{ ... on PullRequest {{ "
+            f"{overflow.name}({spec.size_arg}: {NESTED_PAGE_SIZE}, {spec.cursor_arg}: $c{i}) {{ "
+            f"nodes {{ {spec.fields} }} pageInfo {{ {spec.has_more} {spec.cursor} }} }} }} }}"
+        )
+    query = gql.gql(
+        f"query NestedPages({', '.join(params)}) {{\n"
+        "    rateLimit { cost remaining resetAt }\n"
+        + "\n".join(f"    {lookup}" for lookup in lookups)
+        + "\n}"
+    )
+    return query, variables
+
+
+def _fetch_batch(client: Client, batch: list[_Overflow]) -> dict[str, Any]:
+    query, variables = _batch_query(batch)
+    return execute_query(client, query, variables)
+
+
+def _merge(overflow: _Overflow, page: dict[str, Any]) -> None:
+    """Fold one fetched page into the raw PR node, updating its pageInfo for the next round."""
+    connection = overflow.pr[overflow.name]
+    nodes = page.get("nodes") or []
+    if CONNECTIONS[overflow.name].cursor_arg == "before":
+        connection["nodes"] = nodes + (connection.get("nodes") or [])
+    else:
+        connection["nodes"] = (connection.get("nodes") or []) + nodes
+    connection["pageInfo"] = page.get("pageInfo") or {}
+
+
+def complete_nested(client: Client, prs: list[dict[str, Any]], names: tuple[str, ...]) -> None:
+    """Page every overflowing `names` connection of the raw PR nodes to the end, in place."""
+    with ThreadPoolExecutor(max_workers=NESTED_WORKERS) as pool:
+        while pending := _overflows(prs, names):
+            batches = [
+                pending[i : i + NESTED_BATCH_SIZE]
+                for i in range(0, len(pending), NESTED_BATCH_SIZE)
+            ]
+            results = pool.map(lambda batch: _fetch_batch(client, batch), batches)
+            for batch, result in zip(batches, results, strict=True):
+                for i, overflow in enumerate(batch):
+                    node = result.get(f"o{i}") or {}
+                    _merge(overflow, node.get(overflow.name) or {})
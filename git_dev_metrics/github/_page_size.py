@@ -0,0 +1,41 @@
+"""Adaptive `first` for paginated streams."""
+
+import threading
+from typing import Any
+
+MIN_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 100
+TARGET_PAGE_SECONDS = 4.0
+GROWTH = 1.5
+
+
+class PageSizer:
+    """Page size of one stream: grows while pages come back fast, halves on overload.
+
+    Shared by every request of the stream (split windows fetch on a pool), so thread-safe.
+    """
+
+    def __init__(self, size: int, *, target: float = TARGET_PAGE_SECONDS) -> None:
+        self._min = min(MIN_PAGE_SIZE, size)
+        self._max = max(MAX_PAGE_SIZE, size)
+        self._size = size
+        self._target = target
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record(self, seconds: float) -> None:
+        """Tune the size from how long a page of the current size took."""
+        with self._lock:
+            if seconds < self._target:
+                self._size = min(self._max, max(self._size + 1, int(self._size * GROWTH)))
+            elif seconds > 2 * self._target:
+                self._size = max(self._min, self._size * 3 // 4)
+
+    def back_off(self, variables: dict[str, Any]) -> None:
+        """Halve the size and apply it to `variables` before a failed page is retried."""
+        with self._lock:
+            self._size = max(self._min, self._size // 2)
+            variables["first"] = self._size
@@ -0,0 +1,120 @@
+"""Content-addressed, on-disk cache of GraphQL responses.
+
+Re-pulls and retried batches often ask GitHub for pages it already answered. With
+the cache on, `execute_query` looks each request up by a hash of its query text,
+variables and token identity, and only goes to the network on a miss or once the
+entry is older than the TTL. Open months and watermark searches use a live client
+and always go to the network: a replayed page there would hide PRs merged since.
+The file is bounded by size; the least recently used entries go first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gql.graphql_request import GraphQLRequest
+
+from . import _json
+
+DEFAULT_TTL = 24 * 3600.0
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_used_at ON responses(used_at);
+"""
+
+
+def token_identity(token: str) -> str:
+    """A stable fingerprint of `token` that does not reveal it."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def response_key(query: GraphQLRequest, variables: dict[str, Any] | None, identity: str) -> str:
+    """Hash of (query hash, variables, token identity).
+
+    `first` is left out: the page size adapts from run to run, and a page of any size
+    from the same cursor is a valid answer.
+    """
+    query_hash = hashlib.sha256(query.payload["query"].encode()).hexdigest()
+    keyed = {name: value for name, value in (variables or {}).items() if name != "first"}
+    material = json.dumps([query_hash, keyed, identity], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite file of response bodies with a TTL and a size-bounded LRU.
+
+    One connection is shared by every worker thread behind a lock; writes are small
+    and rare next to the network round trips they replace.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """The cached response, or None if missing or past its TTL."""
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND fetched_at > ?",
+                (key, now - self._ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+        return _json.loads(row[0])
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        body = json.dumps(result, separators=(",", ":")).encode()
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, fetched_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used until under `max_bytes`."""
+        self._conn.execute("DELETE FROM responses WHERE fetched_at <= ?", (now - self._ttl,))
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        doomed: list[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY used_at"):
+            if excess <= 0:
+                break
+            doomed.append(key)
+            excess -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in doomed])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
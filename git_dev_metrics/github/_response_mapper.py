@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import cast
 
-from ..models import PullRequest, Repository, Review
+from ..models import PullRequest, PullRequestFile, Repository, Review
 from ..utils.date_utils import parse_iso_datetime
 
 
@@ -41,12 +41,21 @@ def _extract_ready_for_review(pr: dict) -> datetime | None:
     )
 
 
+def map_pull_request_file(file: dict) -> PullRequestFile:
+    """Map GraphQL changed-file response to internal model."""
+    return {
+        "path": file.get("path") or "",
+        "additions": file.get("additions") or 0,
+        "deletions": file.get("deletions") or 0,
+    }
+
+
 def map_pull_request(pr: dict) -> PullRequest:
     """Map GraphQL PR response to internal model."""
     first_commit_date, commit_messages = _extract_commit_info(pr)
     ready_for_review = _extract_ready_for_review(pr)
 
-    return cast(
+    mapped = cast(
         PullRequest,
         {
             "number": pr.get("number"),
@@ -64,6 +73,9 @@ def map_pull_request(pr: dict) -> PullRequest:
             "reviews": [],
         },
     )
+    if "files" in pr:
+        mapped["files"] = [map_pull_request_file(f) for f in (pr["files"] or {}).get("nodes") or []]
+    return mapped
 
 
 def map_review(review: dict) -> Review:
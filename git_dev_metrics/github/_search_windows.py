@@ -0,0 +1,270 @@
+"""Split `merged:` search ranges that overflow GitHub's 1000-result search cap."""
+
+import logging
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any
+
+from gql import Client
+from gql.graphql_request import GraphQLRequest
+
+from ..utils import TimePeriod
+from ._page_size import PageSizer
+from .graphql_client import (
+    _extract_nodes,
+    _fetch_result,
+    _get_page_info,
+    execute_paginated_query,
+    iter_pages,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_RESULT_CAP = 1000
+SPLIT_WORKERS = 4
+MIN_WINDOW = timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """Nodes of one page, the search they came from, and the cursor after them (None: done)."""
+
+    nodes: list[dict[str, Any]]
+    query: str
+    cursor: str | None
+
+
+@dataclass(frozen=True)
+class _Probe:
+    """First page of one search window, plus the total GitHub says the window holds."""
+
+    since: datetime
+    until: datetime
+    query: str
+    issue_count: int
+    nodes: list[dict[str, Any]]
+    cursor: str | None
+
+
+def window_query(prefix: str, since: datetime, until: datetime) -> str:
+    """`merged:` qualifier for `[since, until)` at one-second resolution."""
+    last = until - timedelta(seconds=1)
+    return f"{prefix} merged:{since:%Y-%m-%dT%H:%M:%SZ}..{last:%Y-%m-%dT%H:%M:%SZ}"
+
+
+def _probe(
+    client: Client,
+    query: GraphQLRequest,
+    search: str,
+    since: datetime,
+    until: datetime,
+    sizer: PageSizer,
+) -> _Probe:
+    result = _fetch_result(client, query, {"query": search}, None, sizer)
+    page_info = _get_page_info(result, "search")
+    return _Probe(
+        since=since,
+        until=until,
+        query=search,
+        issue_count=int((result.get("search") or {}).get("issueCount") or 0),
+        nodes=_extract_nodes(result, "search"),
+        cursor=page_info.get("endCursor") if page_info.get("hasNextPage") else None,
+    )
+
+
+def _rest_of_window(
+    client: Client,
+    query: GraphQLRequest,
+    probe: _Probe,
+    sizer: PageSizer,
+    quiet: bool,
+    repo_id: str,
+) -> list[dict[str, Any]]:
+    """All nodes of the probed window."""
+    if probe.cursor is None:
+        return probe.nodes
+    return execute_paginated_query(
+        client,
+        query,
+        {"query": probe.query, "first": sizer.size},
+        "search",
+        repo_id=repo_id,
+        quiet=quiet,
+        resume_from=(probe.nodes, probe.cursor),
+        sizer=sizer,
+    )
+
+
+def _split_leaves(
+    client: Client,
+    query: GraphQLRequest,
+    prefix: str,
+    top: _Probe,
+    sizer: PageSizer,
+    pool: ThreadPoolExecutor,
+) -> list[_Probe]:
+    """Halve overflowing windows level by level until each fits under the cap."""
+
+    def probe_window(window: tuple[datetime, datetime]) -> _Probe:
+        since, until = window
+        return _probe(client, query, window_query(prefix, since, until), since, until, sizer)
+
+    leaves: list[_Probe] = []
+    level = [top]
+    while level:
+        halves: list[tuple[datetime, datetime]] = []
+        for probe in level:
+            if probe.issue_count <= SEARCH_RESULT_CAP or probe.until - probe.since <= MIN_WINDOW:
+                if probe.issue_count > SEARCH_RESULT_CAP:
+                    logger.warning(
+                        "%s still holds %d results; keeping the first %d",
+                        probe.query,
+                        probe.issue_count,
+                        SEARCH_RESULT_CAP,
+                    )
+                leaves.append(probe)
+                continue
+            mid = probe.since + (probe.until - probe.since) / 2
+            mid = mid.replace(microsecond=0)
+            halves += [(probe.since, mid), (mid, probe.until)]
+        level = list(pool.map(probe_window, halves))
+    return leaves
+
+
+def _node_key(node: dict[str, Any]) -> tuple[Any, Any]:
+    """PR identity across repos (org-wide searches return clashing numbers)."""
+    return (node.get("repository") or {}).get("nameWithOwner"), node.get("number")
+
+
+def _iter_leaf(
+    client: Client, query: GraphQLRequest, leaf: _Probe, sizer: PageSizer, after: str | None
+) -> Iterator[SearchPage]:
+    """One leaf window page by page; with `after`, only the pages past that saved cursor."""
+    if after is None:
+        yield SearchPage(leaf.nodes, leaf.query, leaf.cursor)
+        after = leaf.cursor
+    if after is not None:
+        yield from _iter_window(client, query, leaf.query, sizer, after)
+
+
+def _next_page(stream: Iterator[SearchPage]) -> SearchPage | None:
+    return next(stream, None)
+
+
+def _iter_split(
+    client: Client,
+    query: GraphQLRequest,
+    prefix: str,
+    top: _Probe,
+    sizer: PageSizer,
+    repo_id: str,
+    resume: Mapping[str, str | None],
+) -> Iterator[SearchPage]:
+    """Yield the leaf windows' new PRs page by page, `SPLIT_WORKERS` leaves at a time.
+
+    Each round fetches the next page of every open leaf on the pool, so at most one
+    page per leaf is held, and every page carries its leaf's cursor for checkpoints.
+    Leaves that `resume` marks finished are skipped; the rest continue from their cursor.
+    """
+    logger.info("%s: %d results, splitting the merged range", repo_id, top.issue_count)
+    seen: set[Any] = set()
+    with ThreadPoolExecutor(max_workers=SPLIT_WORKERS) as pool:
+        pending = iter(
+            [
+                leaf
+                for leaf in _split_leaves(client, query, prefix, top, sizer, pool)
+                if leaf.query not in resume or resume[leaf.query] is not None
+            ]
+        )
+        streams: list[Iterator[SearchPage]] = []
+        while True:
+            streams += [
+                _iter_leaf(client, query, leaf, sizer, resume.get(leaf.query))
+                for leaf in islice(pending, SPLIT_WORKERS - len(streams))
+            ]
+            if not streams:
+                return
+            pages = list(pool.map(_next_page, streams))
+            streams = [s for s, page in zip(streams, pages, strict=True) if page is not None]
+            for page in pages:
+                if page is None:
+                    continue
+                fresh = [node for node in page.nodes if _node_key(node) not in seen]
+                seen.update(_node_key(node) for node in fresh)
+                yield SearchPage(fresh, page.query, page.cursor)
+
+
+def _period_query(prefix: str, period: TimePeriod) -> str:
+    since_s = period.since.strftime("%Y-%m-%d")
+    until_s = period.until.strftime("%Y-%m-%d")
+    return f"{prefix} merged:{since_s}..{until_s}"
+
+
+def search_merged(
+    client: Client,
+    query: GraphQLRequest,
+    prefix: str,
+    period: TimePeriod,
+    first: int,
+    *,
+    repo_id: str,
+    quiet: bool = False,
+    sizer: PageSizer | None = None,
+) -> list[dict[str, Any]]:
+    """All search nodes for `prefix` merged in `period`, past the 1000-result cap.
+
+    The first page doubles as a probe of `issueCount`. A range that overflows the
+    cap is halved until every sub-window fits, and the sub-windows are fetched on
+    a small pool. Nodes are deduplicated by repository and PR number. Every request
+    shares one `sizer`, starting at `first`.
+    """
+    sizer = sizer or PageSizer(first)
+    search = _period_query(prefix, period)
+    top = _probe(client, query, search, period.since, period.until, sizer)
+    if top.issue_count <= SEARCH_RESULT_CAP:
+        return _rest_of_window(client, query, top, sizer, quiet, repo_id)
+    pages = _iter_split(client, query, prefix, top, sizer, repo_id, {})
+    return [node for page in pages for node in page.nodes]
+
+
+def _iter_window(
+    client: Client, query: GraphQLRequest, search: str, sizer: PageSizer, after: str
+) -> Iterator[SearchPage]:
+    variables = {"query": search, "first": sizer.size}
+    for nodes, cursor in iter_pages(client, query, variables, "search", after=after, sizer=sizer):
+        yield SearchPage(nodes, search, cursor)
+
+
+def iter_search_merged(
+    client: Client,
+    query: GraphQLRequest,
+    prefix: str,
+    period: TimePeriod,
+    first: int,
+    *,
+    repo_id: str,
+    resume: Mapping[str, str | None] | None = None,
+    sizer: PageSizer | None = None,
+) -> Iterator[SearchPage]:
+    """Streaming `search_merged`: yields one page at a time, past the cap as well.
+
+    `resume` maps searches of an earlier, interrupted run to the cursor they stopped at
+    (None for searches that finished); those pages are not fetched again.
+    """
+    sizer = sizer or PageSizer(first)
+    resume = resume or {}
+    search = _period_query(prefix, period)
+    if search in resume:
+        if (after := resume[search]) is not None:
+            yield from _iter_window(client, query, search, sizer, after)
+        return
+    top = _probe(client, query, search, period.since, period.until, sizer)
+    if top.issue_count > SEARCH_RESULT_CAP:
+        yield from _iter_split(client, query, prefix, top, sizer, repo_id, resume)
+        return
+    yield SearchPage(top.nodes, top.query, top.cursor)
+    if top.cursor is not None:
+        yield from _iter_window(client, query, top.query, sizer, top.cursor)
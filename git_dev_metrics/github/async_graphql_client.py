@@ -0,0 +1,142 @@
+"""Optional asyncio backend for the GraphQL client.
+
+Needs aiohttp (`uv sync --extra async`). Retries and error mapping are shared
+with the sync client, so both raise the same `GitHubError` subclasses; aiohttp's
+timeouts and dropped connections are retried like their requests counterparts.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from gql import Client
+from gql.client import AsyncClientSession
+from gql.graphql_request import GraphQLRequest
+
+from .exceptions import GitHubAPIError, GitHubRateLimitError
+from .graphql_client import (
+    DEFAULT_TIMEOUT,
+    GITHUB_GRAPHQL_URL,
+    RATE_LIMIT_RETRY_ATTEMPTS,
+    TRANSIENT_RETRY_ATTEMPTS,
+    _extract_nodes,
+    _get_page_info,
+    _is_transient,
+    _network_cause,
+    _rate_limit_pause,
+    _retry_delay,
+    bind_scheduler,
+    scheduler_for,
+)
+
+try:
+    from aiohttp import ClientError
+
+    _NETWORK_ERRORS: tuple[type[BaseException], ...] = (TimeoutError, ClientError)
+except ImportError:  # without aiohttp no session opens, so none of its errors can occur
+    _NETWORK_ERRORS = (TimeoutError,)
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient_async(exc: BaseException) -> bool:
+    """`_is_transient`, plus aiohttp's timeouts and dropped connections, bare or wrapped."""
+    return _is_transient(exc) or isinstance(_network_cause(exc), _NETWORK_ERRORS)
+
+
+def _transport(token: str, url: str):
+    try:
+        from gql.transport.aiohttp import AIOHTTPTransport
+    except ImportError as e:
+        raise GitHubAPIError(
+            "The asyncio backend needs aiohttp. Install it with `uv sync --extra async`."
+        ) from e
+    return AIOHTTPTransport(
+        url=url, headers={"Authorization": f"Bearer {token}"}, timeout=DEFAULT_TIMEOUT
+    )
+
+
+@asynccontextmanager
+async def async_session(
+    token: str, url: str = GITHUB_GRAPHQL_URL
+) -> AsyncIterator[AsyncClientSession]:
+    """One aiohttp session (and connection pool) shared by every query run inside the block."""
+    client = Client(transport=_transport(token, url))
+    bind_scheduler(client, token)
+    async with client as session:
+        yield session
+
+
+async def execute_query_async(
+    session: AsyncClientSession, query: GraphQLRequest, variables: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Async twin of `execute_query`: same retries, same error mapping, same rate-limit budget."""
+    scheduler = scheduler_for(session.client)
+    last_exc: Exception | None = None
+    attempt = 0
+    rate_limited = 0
+    while attempt < TRANSIENT_RETRY_ATTEMPTS:
+        while (wait := scheduler.reserve()) > 0:
+            await asyncio.sleep(wait)
+        try:
+            result = await session.execute(GraphQLRequest(query, variable_values=variables))
+        except Exception as e:
+            pause = _rate_limit_pause(e, scheduler)
+            if pause is not None:
+                if rate_limited >= RATE_LIMIT_RETRY_ATTEMPTS:
+                    raise GitHubRateLimitError("Rate limit exceeded") from e
+                logger.warning("GitHub rate limit hit; pausing all workers for %.0fs", pause)
+                scheduler.pause(pause)
+                rate_limited += 1
+                continue
+            delay = _retry_delay(e, attempt, _is_transient_async)
+            logger.warning("Transient GitHub error (%s); retrying in %.0fs", e, delay)
+            await asyncio.sleep(delay)
+            last_exc = e
+            attempt += 1
+        else:
+            scheduler.observe((result or {}).get("rateLimit"))
+            return result if result is not None else {}
+    raise GitHubAPIError(f"GitHub API error after retries: {last_exc}") from last_exc
+
+
+async def execute_paginated_query_async(
+    session: AsyncClientSession,
+    query: GraphQLRequest,
+    variables: dict[str, Any],
+    path: str,
+    page_size: int | None = None,
+    stop_if: Callable[[dict[str, Any]], bool] | None = None,
+) -> list[dict[str, Any]]:
+    """Async twin of `execute_paginated_query` (always quiet)."""
+    variables_copy = {**variables}
+    if page_size is not None:
+        variables_copy["first"] = page_size
+    variables_copy.pop("after", None)
+
+    all_nodes: list[dict[str, Any]] = []
+    while True:
+        result = await execute_query_async(session, query, variables_copy)
+        for node in _extract_nodes(result, path):
+            all_nodes.append(node)
+            if stop_if and stop_if(node):
+                return all_nodes
+        page_info = _get_page_info(result, path)
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            return all_nodes
+        variables_copy["after"] = page_info["endCursor"]
+
+
+async def gather_bounded[T](
+    factories: Iterable[Callable[[], Awaitable[T]]], limit: int
+) -> list[T | BaseException]:
+    """Run the coroutines with at most `limit` in flight; failures are returned, not raised."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(f) for f in factories), return_exceptions=True)
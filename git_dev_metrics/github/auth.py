@@ -1,3 +1,4 @@
+import os
 from getpass import getpass
 
 import typer
@@ -5,6 +6,9 @@ import typer
 from .auth_cache import is_token_valid, load_token, save_token
 from .exceptions import GitHubAuthError
 
+# Extra tokens for the pool, comma separated; the keyring token is always used first.
+TOKENS_ENV = "GDM_GITHUB_TOKENS"
+
 
 def _prompt_for_token() -> str:
     """Prompt user to input their GitHub PAT."""
@@ -34,3 +38,9 @@ def get_github_token() -> str:
 
     save_token(token)
     return token
+
+
+def extra_tokens() -> list[str]:
+    """Additional tokens listed in `GDM_GITHUB_TOKENS`, for spreading work across them."""
+    raw = os.environ.get(TOKENS_ENV, "")
+    return [token.strip() for token in raw.split(",") if token.strip()]
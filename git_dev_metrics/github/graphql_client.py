@@ -1,21 +1,40 @@
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable
-from typing import Any
+import weakref
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NoReturn, cast
 
 import requests
 from gql import Client
+from gql.client import SyncClientSession
 from gql.graphql_request import GraphQLRequest
 from gql.transport import exceptions as transport_exceptions
 from gql.transport.requests import RequestsHTTPTransport
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.live import Live
 
+from ..utils.date_utils import parse_iso_datetime
+from . import _json
+from ._latency import endpoint_name, is_idempotent, latency
+from ._page_size import PageSizer
+from ._response_cache import ResponseCache, response_key, token_identity
 from .exceptions import GitHubAPIError, GitHubAuthError, GitHubNotFoundError, GitHubRateLimitError
 
 TRANSIENT_RETRY_ATTEMPTS = 4
 TRANSIENT_RETRY_BASE_DELAY = 2.0
 
+RATE_LIMIT_RETRY_ATTEMPTS = 3
+RATE_LIMIT_RESERVE = 50
+RATE_LIMIT_THROTTLE_BELOW = 500
+SECONDARY_RATE_LIMIT_WAIT = 60.0
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -25,22 +44,243 @@ GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 DEFAULT_TIMEOUT = 60
 
+POOL_MAXSIZE = 16
+
+# Pages fetched ahead of the caller while it works on the current one.
+PREFETCH_PAGES = 2
+
+_clients: dict[tuple[str, bool], Client] = {}
+_clients_lock = threading.Lock()
+# Clients whose requests never go through the response cache.
+_live_clients: weakref.WeakSet[Client] = weakref.WeakSet()
+
+
+class RateLimitScheduler:
+    """Token bucket over one token's GraphQL point budget, shared by all its workers.
+
+    The bucket is refilled from the `rateLimit { cost remaining resetAt }` block of
+    every response. Each request takes the last observed cost out of the bucket
+    before it is sent. Below `throttle_below` points, requests are spread evenly
+    until `resetAt`. At `reserve` points every worker waits for the reset, unless
+    another token is ready to take over (see `hand_off_to`). A secondary limit
+    pauses every worker for its `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        reserve: int = RATE_LIMIT_RESERVE,
+        throttle_below: int = RATE_LIMIT_THROTTLE_BELOW,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._reserve = reserve
+        self._throttle_below = throttle_below
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+        self._cost = 1
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._requests = 0
+        self._spent = 0
+        self._others_ready: Callable[[], bool] | None = None
+
+    @property
+    def remaining(self) -> int | None:
+        return self._remaining
+
+    @property
+    def requests(self) -> int:
+        """Responses observed so far."""
+        return self._requests
+
+    @property
+    def spent(self) -> int:
+        """Points those responses cost."""
+        return self._spent
+
+    def seconds_until_reset(self) -> float:
+        return max(0.0, self._reset_at - self._clock())
+
+    def reserve(self) -> float:
+        """Take budget for one request. Returns 0.0, or the seconds to wait before asking again."""
+        now = self._clock()
+        with self._lock:
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._remaining is None or now >= self._reset_at:
+                self._remaining = None
+                return 0.0
+            if self._remaining - self._cost < self._reserve:
+                return self._reset_at - now
+            if self._remaining < self._throttle_below and now < self._next_slot:
+                return self._next_slot - now
+            self._remaining -= self._cost
+            if self._remaining < self._throttle_below:
+                spare = max(self._remaining - self._reserve, self._cost)
+                self._next_slot = now + (self._reset_at - now) * self._cost / spare
+            return 0.0
+
+    def observe(self, rate_limit: Mapping[str, Any] | None) -> None:
+        """Fold a response's `rateLimit` block into the bucket."""
+        if not rate_limit or rate_limit.get("remaining") is None:
+            return
+        reset = parse_iso_datetime(rate_limit.get("resetAt"))
+        reset_at = reset.timestamp() if reset else self._clock() + 3600
+        remaining = int(rate_limit["remaining"])
+        with self._lock:
+            self._cost = max(1, int(rate_limit.get("cost") or 1))
+            self._requests += 1
+            self._spent += self._cost
+            if self._remaining is None or reset_at > self._reset_at:
+                self._remaining = remaining
+            else:
+                self._remaining = min(self._remaining, remaining)
+            self._reset_at = reset_at
+
+    def pause(self, seconds: float) -> None:
+        """Hold every worker for `seconds` (secondary limits, exhausted budget)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def hand_off_to(self, others_ready: Callable[[], bool] | None) -> None:
+        """Let requests give up rather than wait for the reset while `others_ready()` holds."""
+        self._others_ready = others_ready
+
+    def should_hand_off(self) -> bool:
+        """Whether the bucket is down to `reserve` and another token can take over."""
+        now = self._clock()
+        with self._lock:
+            exhausted = (
+                self._remaining is not None
+                and now < self._reset_at
+                and self._remaining - self._cost < self._reserve
+            )
+        return exhausted and self._others_ready is not None and self._others_ready()
+
+
+_schedulers: dict[str, RateLimitScheduler] = {}
+_client_schedulers: weakref.WeakKeyDictionary[Client, RateLimitScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+_schedulers_lock = threading.Lock()
+_client_identities: weakref.WeakKeyDictionary[Client, str] = weakref.WeakKeyDictionary()
+
+
+def rate_limit_scheduler(token: str) -> RateLimitScheduler:
+    """The scheduler for a token; every client using the token shares its budget."""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(token)
+        if scheduler is None:
+            scheduler = _schedulers[token] = RateLimitScheduler()
+        return scheduler
+
+
+def bind_scheduler(client: Client, token: str) -> None:
+    """Make `client` draw from the token's shared budget (and its cached responses)."""
+    scheduler = rate_limit_scheduler(token)
+    with _schedulers_lock:
+        _client_schedulers[client] = scheduler
+        _client_identities[client] = token_identity(token)
+
+
+def scheduler_for(client: Client) -> RateLimitScheduler:
+    with _schedulers_lock:
+        scheduler = _client_schedulers.get(client)
+        if scheduler is None:
+            scheduler = _client_schedulers[client] = RateLimitScheduler()
+        return scheduler
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    opened: int
+    requests: int
 
-def get_client(token: str) -> Client:
-    """Create a GraphQL client with the given token."""
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.opened)
+
+
+def _connect(token: str) -> Client:
     transport = RequestsHTTPTransport(
         url=GITHUB_GRAPHQL_URL,
         headers={"Authorization": f"Bearer {token}"},
         timeout=DEFAULT_TIMEOUT,
+        json_deserialize=_json.loads,
     )
-    return Client(transport=transport)
+    client = Client(transport=transport)
+    client.connect_sync()
+    bind_scheduler(client, token)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+    session = cast(requests.Session, transport.session)
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, adapter)
+    return client
+
+
+def get_client(token: str, *, live: bool = False) -> Client:
+    """Shared GraphQL client for the token. Keeps one keep-alive connection pool per token.
+
+    A `live` client skips the response cache, for queries whose answer may still change
+    (an open month, a search since a watermark); it shares the token's budget.
+    """
+    with _clients_lock:
+        client = _clients.get((token, live))
+        if client is None:
+            client = _connect(token)
+            _clients[(token, live)] = client
+            if live:
+                _live_clients.add(client)
+        return client
+
+
+def close_clients() -> None:
+    """Close every pooled client and its connections, and forget their rate-limit budgets."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close_sync()
+        _clients.clear()
+    with _schedulers_lock:
+        _schedulers.clear()
+
+
+def connection_stats() -> ConnectionStats:
+    """TCP connections opened vs. HTTP requests sent across all pooled clients."""
+    opened = 0
+    sent = 0
+    with _clients_lock:
+        for client in _clients.values():
+            session = cast(RequestsHTTPTransport, client.transport).session
+            if session is None:
+                continue
+            adapters = {id(a): a for a in session.adapters.values()}
+            for adapter in adapters.values():
+                pools = cast(HTTPAdapter, adapter).poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools[key]
+                    opened += pool.num_connections
+                    sent += pool.num_requests
+    return ConnectionStats(opened=opened, requests=sent)
 
 
 _TRANSIENT_STATUSES = (500, 502, 503, 504)
 
 
+def _network_cause(exc: BaseException) -> BaseException:
+    """The error under gql's `TransportConnectionFailed`, which wraps every network failure."""
+    if isinstance(exc, transport_exceptions.TransportConnectionFailed) and exc.__cause__:
+        return exc.__cause__
+    return exc
+
+
+def _timed_out(exc: BaseException) -> bool:
+    return isinstance(_network_cause(exc), requests.Timeout)
+
+
 def _is_transient(exc: BaseException) -> bool:
-    """Detect transient errors worth retrying (gateway timeouts, 5xx)."""
+    """Detect transient errors worth retrying (timeouts, dropped connections, 5xx)."""
+    exc = _network_cause(exc)
     if isinstance(exc, transport_exceptions.TransportServerError):
         status = getattr(exc, "code", None)
         return status in _TRANSIENT_STATUSES
@@ -49,33 +289,224 @@ def _is_transient(exc: BaseException) -> bool:
     return isinstance(exc, requests.Timeout | requests.ConnectionError)
 
 
+def _execute(
+    client: Client, request: GraphQLRequest, timeout: float = DEFAULT_TIMEOUT
+) -> dict[str, Any]:
+    """Run on the client's open session when it has one, so the connection is kept alive."""
+    session = getattr(client, "session", None)
+    if isinstance(session, SyncClientSession):
+        return session.execute(request, timeout=timeout)
+    return client.execute(request, timeout=timeout)
+
+
+HEDGE_WORKERS = 2 * POOL_MAXSIZE
+
+_hedging = False
+_hedge_pool: ThreadPoolExecutor | None = None
+_hedge_lock = threading.Lock()
+
+
+def set_hedging(enabled: bool) -> None:
+    """Re-issue stalled read-only requests once their endpoint's p95 has passed."""
+    global _hedging
+    _hedging = enabled
+
+
+_response_cache: ResponseCache | None = None
+
+
+def set_response_cache(path: Path | None) -> None:
+    """Serve repeated queries from the response cache at `path`; None turns it off."""
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+    _response_cache = ResponseCache(path) if path is not None else None
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _hedge_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS, thread_name_prefix="gdm-hedge"
+            )
+        return _hedge_pool
+
+
+def _execute_hedged(
+    client: Client, request: GraphQLRequest, timeout: float, delay: float
+) -> tuple[dict[str, Any], float]:
+    """Send a duplicate if the first request has not answered after `delay`; first success wins.
+
+    Returns the winner's response and its own round trip. The slower request is left
+    to finish in the background and its response is dropped.
+    """
+    pool = _hedge_executor()
+    start = time.perf_counter()
+    primary = pool.submit(_execute, client, request, timeout)
+    try:
+        return primary.result(timeout=delay), time.perf_counter() - start
+    except FutureTimeout:
+        pass
+    logger.info("%s slower than %.1fs; hedging the request", endpoint_name(request), delay)
+    started = {primary: start}
+    backup = pool.submit(_execute, client, request, timeout)
+    started[backup] = time.perf_counter()
+    for future in as_completed((primary, backup)):
+        if future.exception() is None:
+            return future.result(), time.perf_counter() - started[future]
+    return primary.result(), time.perf_counter() - start
+
+
+def _timed_execute(client: Client, request: GraphQLRequest) -> tuple[dict[str, Any], float]:
+    """`_execute` with the endpoint's adaptive timeout, recording how long it took.
+
+    Returns the response and the seconds its HTTP round trip took; for a hedged
+    request, the winning request's own.
+    """
+    endpoint = endpoint_name(request)
+    timeout = latency.timeout(endpoint, DEFAULT_TIMEOUT)
+    delay = latency.hedge_delay(endpoint) if _hedging and is_idempotent(request) else None
+    start = time.perf_counter()
+    try:
+        if delay is None:
+            result = _execute(client, request, timeout)
+            round_trip = time.perf_counter() - start
+        else:
+            result, round_trip = _execute_hedged(client, request, timeout, delay)
+    except Exception as e:
+        if _timed_out(e):
+            latency.observe(endpoint, timeout)  # a lower bound, so a slow spell widens the timeout
+        raise
+    latency.observe(endpoint, time.perf_counter() - start)
+    return result, round_trip
+
+
+def _retry_delay(
+    exc: Exception, attempt: int, is_transient: Callable[[BaseException], bool] = _is_transient
+) -> float:
+    """Backoff before retrying a failed attempt, or raise the mapped GitHub error."""
+    if isinstance(exc, transport_exceptions.TransportQueryError):
+        _handle_graphql_error(exc)
+    if is_transient(exc) and attempt < TRANSIENT_RETRY_ATTEMPTS - 1:
+        return TRANSIENT_RETRY_BASE_DELAY * (2**attempt)
+    if isinstance(exc, transport_exceptions.TransportConnectionFailed):
+        raise GitHubAPIError(f"Network error: {exc}") from exc
+    raise GitHubAPIError(f"GitHub API error: {exc}") from exc
+
+
+def _header_seconds(headers: Mapping[str, str], now: float) -> float | None:
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+        return max(0.0, float(headers["X-RateLimit-Reset"]) - now)
+    return None
+
+
+def _rate_limit_pause(exc: Exception, scheduler: RateLimitScheduler) -> float | None:
+    """Seconds to pause when `exc` is a primary or secondary rate limit, else None."""
+    if isinstance(exc, transport_exceptions.TransportQueryError):
+        limited = any(
+            error.get("type") == "RATE_LIMITED" or "rate limit" in error.get("message", "").lower()
+            for error in exc.errors or []
+        )
+        return scheduler.seconds_until_reset() or SECONDARY_RATE_LIMIT_WAIT if limited else None
+    if not isinstance(exc, transport_exceptions.TransportServerError) or exc.code not in (403, 429):
+        return None
+    cause = exc.__cause__
+    response = cause.response if isinstance(cause, requests.HTTPError) else None
+    if response is None:
+        return SECONDARY_RATE_LIMIT_WAIT if exc.code == 429 else None
+    seconds = _header_seconds(response.headers, time.time())
+    if seconds is not None:
+        return seconds
+    if exc.code == 403 and "rate limit" not in response.text.lower():
+        return None
+    return SECONDARY_RATE_LIMIT_WAIT
+
+
+def _wait_for_budget(scheduler: RateLimitScheduler) -> None:
+    while (delay := scheduler.reserve()) > 0:
+        if scheduler.should_hand_off():
+            raise GitHubRateLimitError("Rate-limit budget exhausted; switching tokens")
+        logger.info("Pacing GitHub requests; waiting %.1fs for rate-limit budget", delay)
+        time.sleep(delay)
+
+
 def execute_query(
-    client: Client, query: GraphQLRequest, variables: dict[str, Any] | None = None
+    client: Client,
+    query: GraphQLRequest,
+    variables: dict[str, Any] | None = None,
+    on_transient: Callable[[dict[str, Any]], None] | None = None,
+    on_round_trip: Callable[[float], None] | None = None,
+) -> dict[str, Any]:
+    """Execute a GraphQL query and handle errors.
+
+    Retries timeouts, dropped connections and transient 5xx with backoff, and waits out
+    rate limits via the client's scheduler.
+    Timeouts adapt to the endpoint's observed latency; see `set_hedging` for hedged requests.
+    `on_transient` may rewrite `variables` (e.g. a smaller page) before a transient retry.
+    `on_round_trip` gets the seconds the successful request took on the wire, leaving out
+    rate-limit waits, failed attempts and backoff.
+    With `set_response_cache`, a fresh cached response is returned without a request,
+    unless `client` is a live one (see `get_client`).
+    """
+    cache = _response_cache
+    if cache is None or client in _live_clients:
+        return _execute_with_retries(client, query, variables, on_transient, on_round_trip)
+    with _schedulers_lock:
+        identity = _client_identities.get(client, "anonymous")
+    key = response_key(query, variables, identity)
+    if (cached := cache.get(key)) is not None:
+        return cached
+    result = _execute_with_retries(client, query, variables, on_transient, on_round_trip)
+    cache.put(key, result)
+    return result
+
+
+def _execute_with_retries(
+    client: Client,
+    query: GraphQLRequest,
+    variables: dict[str, Any] | None,
+    on_transient: Callable[[dict[str, Any]], None] | None,
+    on_round_trip: Callable[[float], None] | None,
 ) -> dict[str, Any]:
-    """Execute a GraphQL query and handle errors. Retries transient 5xx with backoff."""
+    scheduler = scheduler_for(client)
     last_exc: Exception | None = None
-    for attempt in range(TRANSIENT_RETRY_ATTEMPTS):
+    attempt = 0
+    rate_limited = 0
+    while attempt < TRANSIENT_RETRY_ATTEMPTS:
+        _wait_for_budget(scheduler)
         try:
-            result = client.execute(GraphQLRequest(query, variable_values=variables))
-        except transport_exceptions.TransportQueryError as e:
-            _handle_graphql_error(e)
-            return {}  # unreachable but needed for type checker
-        except transport_exceptions.TransportConnectionFailed as e:
-            raise GitHubAPIError(f"Network error: {e}") from e
+            result, round_trip = _timed_execute(
+                client, GraphQLRequest(query, variable_values=variables)
+            )
         except Exception as e:
-            if _is_transient(e) and attempt < TRANSIENT_RETRY_ATTEMPTS - 1:
-                delay = TRANSIENT_RETRY_BASE_DELAY * (2**attempt)
-                logger.warning("Transient GitHub error (%s); retrying in %.0fs", e, delay)
-                time.sleep(delay)
-                last_exc = e
+            pause = _rate_limit_pause(e, scheduler)
+            if pause is not None:
+                if rate_limited >= RATE_LIMIT_RETRY_ATTEMPTS:
+                    raise GitHubRateLimitError("Rate limit exceeded") from e
+                logger.warning("GitHub rate limit hit; pausing all workers for %.0fs", pause)
+                scheduler.pause(pause)
+                rate_limited += 1
                 continue
-            raise GitHubAPIError(f"GitHub API error: {e}") from e
+            delay = _retry_delay(e, attempt)
+            logger.warning("Transient GitHub error (%s); retrying in %.0fs", e, delay)
+            if on_transient is not None and variables is not None:
+                on_transient(variables)
+            time.sleep(delay)
+            last_exc = e
+            attempt += 1
         else:
+            scheduler.observe((result or {}).get("rateLimit"))
+            if on_round_trip is not None:
+                on_round_trip(round_trip)
             return result if result is not None else {}
     raise GitHubAPIError(f"GitHub API error after retries: {last_exc}") from last_exc
 
 
-def _handle_graphql_error(e: transport_exceptions.TransportQueryError) -> None:
+def _handle_graphql_error(e: transport_exceptions.TransportQueryError) -> NoReturn:
     """Map GraphQL errors to custom exceptions."""
     if not e.errors:
         raise GitHubAPIError("Unknown GraphQL error") from e
@@ -123,20 +554,37 @@ def _get_page_info(result: dict[str, Any], path: str) -> dict[str, Any]:
     return page_info if isinstance(page_info, dict) else {}
 
 
-def _fetch_page(
+def _fetch_result(
     client: Client,
     query: GraphQLRequest,
     variables_copy: dict[str, Any],
     cursor: str | None,
-    path: str,
-) -> tuple[list[dict[str, Any]], str | None]:
-    """Fetch a single page and return nodes + next cursor."""
+    sizer: PageSizer | None = None,
+) -> dict[str, Any]:
+    """Fetch the page after `cursor`; with `sizer`, at its size, which then learns from it."""
     if cursor:
         variables_copy["after"] = cursor
     else:
         variables_copy.pop("after", None)
+    if sizer is None:
+        return execute_query(client, query, variables_copy)
+
+    variables_copy["first"] = sizer.size
+    return execute_query(
+        client, query, variables_copy, on_transient=sizer.back_off, on_round_trip=sizer.record
+    )
 
-    result = execute_query(client, query, variables_copy)
+
+def _fetch_page(
+    client: Client,
+    query: GraphQLRequest,
+    variables_copy: dict[str, Any],
+    cursor: str | None,
+    path: str,
+    sizer: PageSizer | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Fetch a single page and return nodes + next cursor."""
+    result = _fetch_result(client, query, variables_copy, cursor, sizer)
     nodes = _extract_nodes(result, path)
     page_info = _get_page_info(result, path)
 
@@ -144,6 +592,86 @@ def _fetch_page(
     return nodes, next_cursor
 
 
+_Page = tuple[list[dict[str, Any]], str | None]
+
+
+def _offer(out: queue.Queue, item: _Page | BaseException, stop: threading.Event) -> bool:
+    """Block until the consumer takes `item`; give up once it has stopped reading."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _prefetch_pages(
+    client: Client,
+    query: GraphQLRequest,
+    variables_copy: dict[str, Any],
+    path: str,
+    cursor: str | None,
+    out: queue.Queue,
+    stop: threading.Event,
+    sizer: PageSizer | None,
+) -> None:
+    try:
+        while True:
+            nodes, cursor = _fetch_page(client, query, variables_copy, cursor, path, sizer)
+            if not _offer(out, (nodes, cursor), stop) or not cursor:
+                return
+    except BaseException as e:  # re-raised in the consumer's thread
+        _offer(out, e, stop)
+
+
+def iter_pages(
+    client: Client,
+    query: GraphQLRequest,
+    variables: dict[str, Any],
+    path: str,
+    page_size: int | None = None,
+    after: str | None = None,
+    prefetch: int = PREFETCH_PAGES,
+    sizer: PageSizer | None = None,
+) -> Iterator[_Page]:
+    """Yield `(nodes, cursor after them)` per page as it arrives; the last cursor is None.
+
+    A background thread requests the next page as soon as the cursor is known and holds up
+    to `prefetch` pages, so whatever the caller does with a page overlaps the next request.
+    With `prefetch=0` pages are fetched strictly in turn, never one past where the caller stops.
+    With `sizer`, `first` follows it from page to page.
+    """
+    variables_copy = {**variables}
+    if page_size is not None:
+        variables_copy["first"] = page_size
+    if prefetch <= 0:
+        cursor = after
+        while True:
+            nodes, cursor = _fetch_page(client, query, variables_copy, cursor, path, sizer)
+            yield nodes, cursor
+            if not cursor:
+                return
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    threading.Thread(
+        target=_prefetch_pages,
+        args=(client, query, variables_copy, path, after, pages, stop, sizer),
+        daemon=True,
+    ).start()
+    try:
+        while True:
+            item = pages.get()
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+            if not item[1]:
+                return
+    finally:
+        stop.set()
+
+
 def execute_paginated_query(
     client: Client,
     query: GraphQLRequest,
@@ -153,25 +681,35 @@ def execute_paginated_query(
     stop_if: Callable[[dict[str, Any]], bool] | None = None,
     repo_id: str | None = None,
     quiet: bool = False,
+    resume_from: tuple[list[dict[str, Any]], str] | None = None,
+    sizer: PageSizer | None = None,
 ) -> list[dict[str, Any]]:
-    """Execute a paginated GraphQL query and return all results."""
+    """Execute a paginated GraphQL query and return all results.
+
+    `resume_from` is `(nodes already fetched, cursor after them)` to carry on from a page
+    the caller fetched itself. The page size adapts as the stream goes (see `PageSizer`),
+    starting from `page_size` or the requested `first`; pass `sizer` to share or read it.
+    """
     if repo_id is None:
         owner = variables.get("owner", "")
         name = variables.get("name", "")
         repo_id = f"{owner}/{name}" if owner and name else path
 
-    all_nodes = []
+    all_nodes: list[dict[str, Any]] = list(resume_from[0]) if resume_from else []
+    cursor = resume_from[1] if resume_from else None
     variables_copy = {**variables}
     requested_first = variables_copy.get("first", 100)
     effective_page_size = page_size if page_size is not None else requested_first
     variables_copy["first"] = effective_page_size
-    cursor = None
+    sizer = sizer or PageSizer(effective_page_size)
 
     if quiet:
-        return _paginate_quiet(client, query, variables_copy, path, stop_if, all_nodes, cursor)
+        return _paginate_quiet(
+            client, query, variables_copy, path, stop_if, all_nodes, cursor, sizer
+        )
 
     return _paginate_with_progress(
-        client, query, variables_copy, path, stop_if, all_nodes, cursor, repo_id
+        client, query, variables_copy, path, stop_if, all_nodes, cursor, repo_id, sizer
     )
 
 
@@ -183,16 +721,19 @@ def _paginate_quiet(
     stop_if: Callable[[dict[str, Any]], bool] | None,
     all_nodes: list[dict[str, Any]],
     cursor: str | None,
+    sizer: PageSizer,
 ) -> list[dict[str, Any]]:
-    while True:
-        nodes, cursor = _fetch_page(client, query, variables_copy, cursor, path)
+    prefetch = 0 if stop_if else PREFETCH_PAGES  # never pay for a page past the stop
+    pages = iter_pages(
+        client, query, variables_copy, path, after=cursor, prefetch=prefetch, sizer=sizer
+    )
+    for nodes, _ in pages:
         for node in nodes:
             if stop_if and stop_if(node):
                 all_nodes.append(node)
                 return all_nodes
             all_nodes.append(node)
-        if not cursor:
-            return all_nodes
+    return all_nodes
 
 
 def _paginate_with_progress(
@@ -204,14 +745,18 @@ def _paginate_with_progress(
     all_nodes: list[dict[str, Any]],
     cursor: str | None,
     repo_id: str,
+    sizer: PageSizer,
 ) -> list[dict[str, Any]]:
     page_num = 0
     spinner_idx = 0
+    prefetch = 0 if stop_if else PREFETCH_PAGES
+    pages = iter_pages(
+        client, query, variables_copy, path, after=cursor, prefetch=prefetch, sizer=sizer
+    )
     with Live(console=console, transient=True, refresh_per_second=10) as live:
         live.update(f"[bold blue]{SPINNER_FRAMES[0]}[/bold blue] {repo_id}...")
-        while True:
-            start = time.perf_counter()
-            nodes, cursor = _fetch_page(client, query, variables_copy, cursor, path)
+        start = time.perf_counter()
+        for nodes, _ in pages:
             elapsed = time.perf_counter() - start
             page_num += 1
             spinner_idx = (spinner_idx + 1) % len(SPINNER_FRAMES)
@@ -225,8 +770,7 @@ def _paginate_with_progress(
                     console.print(f"[green]✓[/green] {repo_id}: {len(all_nodes)} PRs")
                     return all_nodes
                 all_nodes.append(node)
-            if not cursor:
-                break
+            start = time.perf_counter()
 
     console.print(f"[green]✓[/green] {repo_id}: {len(all_nodes)} items")
     return all_nodes
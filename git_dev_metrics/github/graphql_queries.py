@@ -1,8 +1,13 @@
+from collections.abc import Iterable
+from functools import cache
+
 import gql
+from gql.graphql_request import GraphQLRequest
 
 REPOSITORIES_QUERY = gql.gql(
     """
     query FetchRepositories($first: Int!, $after: String) {
+        rateLimit { cost remaining resetAt }
         viewer {
             repositories(
                 first: $first
@@ -27,6 +32,7 @@ REPOSITORIES_QUERY = gql.gql(
 ORG_REPOSITORIES_QUERY = gql.gql(
     """
     query FetchOrgRepositories($login: String!, $first: Int!, $after: String) {
+        rateLimit { cost remaining resetAt }
         organization(login: $login) {
             repositories(
                 first: $first
@@ -56,6 +62,7 @@ REPO_METRICS_QUERY = gql.gql(
         $first: Int!
         $after: String
     ) {
+        rateLimit { cost remaining resetAt }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first
@@ -83,7 +90,7 @@ REPO_METRICS_QUERY = gql.gql(
                             }
                         }
                     }
-                    # Note: max 10 reviews per PR - truncates if more
+                    # Note: max 10 reviews per PR; only the search queries page past that
                     reviews(first: 10) {
                         nodes {
                             author {
@@ -114,6 +121,7 @@ REPO_METRICS_QUERY = gql.gql(
 OPEN_PRS_QUERY = gql.gql(
     """
     query FetchOpenPRs($owner: String!, $name: String!, $first: Int!, $after: String) {
+        rateLimit { cost remaining resetAt }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first
@@ -148,13 +156,17 @@ OPEN_PRS_QUERY = gql.gql(
 SKILL_REPORT_QUERY = gql.gql(
     """
     query SkillReportQuery($query: String!, $first: Int!, $after: String) {
+        rateLimit { cost remaining resetAt }
         search(query: $query, type: ISSUE, first: $first, after: $after) {
+            issueCount
             nodes {
                 ... on PullRequest {
+                    id
                     number
                     author { login }
                     files(first: 100) {
                         nodes { path additions deletions }
+                        pageInfo { hasNextPage endCursor }
                     }
                 }
             }
@@ -164,31 +176,63 @@ SKILL_REPORT_QUERY = gql.gql(
     """
 )
 
-LANG_REPORT_QUERY = gql.gql(
-    """
-    query LangReportQuery($query: String!, $first: Int!, $after: String) {
-        search(query: $query, type: ISSUE, first: $first, after: $after) {
-            nodes {
-                ... on PullRequest {
-                    number
-                    author { login }
+# Fetch profiles, each selecting everything the one before it does, and more.
+FETCH_PROFILES = ("timing", "full", "files")
+DEFAULT_PROFILE = "full"
+
+_TIMING_FIELDS = """
+                    commits(last: 1) {
+                        nodes {
+                            commit {
+                                committedDate
+                            }
+                        }
+                    }"""
+
+# Body and commit messages feed AI detection, and dominate the response size.
+_FULL_FIELDS = """
+                    body
+                    commits(last: 20) {
+                        nodes {
+                            commit {
+                                committedDate
+                                message
+                            }
+                        }
+                        pageInfo { hasPreviousPage startCursor }
+                    }"""
+
+_FILES_FIELDS = (
+    _FULL_FIELDS
+    + """
                     files(first: 100) {
                         nodes { path additions deletions }
-                    }
-                }
-            }
-            pageInfo { hasNextPage endCursor }
-        }
-    }
-    """
+                        pageInfo { hasNextPage endCursor }
+                    }"""
 )
 
-SEARCH_MERGED_PRS_QUERY = gql.gql(
-    """
-    query SearchMergedPRs($query: String!, $first: Int!, $after: String) {
-        search(query: $query, type: ISSUE, first: $first, after: $after) {
-            nodes {
-                ... on PullRequest {
+_PROFILE_FIELDS = {"timing": _TIMING_FIELDS, "full": _FULL_FIELDS, "files": _FILES_FIELDS}
+
+
+def profile_covers(have: str, want: str) -> bool:
+    """Whether data fetched with profile `have` holds every field of profile `want`."""
+    return FETCH_PROFILES.index(have) >= FETCH_PROFILES.index(want)
+
+
+@cache
+def search_merged_query(profile: str = DEFAULT_PROFILE) -> GraphQLRequest:
+    """Merged-PR search selecting the fields of one fetch profile."""
+    if profile not in _PROFILE_FIELDS:
+        raise ValueError(f"Unknown fetch profile {profile!r}; use one of {FETCH_PROFILES}")
+    return gql.gql(
+        f"""
+    query SearchMergedPRs($query: String!, $first: Int!, $after: String) {{
+        rateLimit {{ cost remaining resetAt }}
+        search(query: $query, type: ISSUE, first: $first, after: $after) {{
+            issueCount
+            nodes {{
+                ... on PullRequest {{
+                    id
                     number
                     title
                     createdAt
@@ -196,41 +240,74 @@ SEARCH_MERGED_PRS_QUERY = gql.gql(
                     additions
                     deletions
                     changedFiles
-                    author {
+                    author {{
                         login
-                    }
-                    body
-                    commits(last: 20) {
-                        nodes {
-                            commit {
-                                committedDate
-                                message
-                            }
-                        }
-                    }
-                    reviews(first: 10) {
-                        nodes {
-                            author {
+                    }}
+                    repository {{
+                        nameWithOwner
+                    }}{_PROFILE_FIELDS[profile]}
+                    reviews(first: 10) {{
+                        nodes {{
+                            author {{
                                 login
-                            }
+                            }}
                             state
                             submittedAt
-                        }
-                    }
-                    timelineItems(itemTypes: [READY_FOR_REVIEW_EVENT], first: 1) {
-                        nodes {
-                            ... on ReadyForReviewEvent {
+                        }}
+                        pageInfo {{ hasNextPage endCursor }}
+                    }}
+                    timelineItems(itemTypes: [READY_FOR_REVIEW_EVENT], first: 1) {{
+                        nodes {{
+                            ... on ReadyForReviewEvent {{
                                 createdAt
-                            }
-                        }
-                    }
-                }
-            }
-            pageInfo {
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+            pageInfo {{
                 hasNextPage
                 endCursor
-            }
-        }
-    }
+            }}
+        }}
+    }}
     """
-)
+    )
+
+
+SEARCH_MERGED_PRS_QUERY = search_merged_query(DEFAULT_PROFILE)
+
+
+def reviews_by_number_query(numbers: Iterable[int]) -> GraphQLRequest:
+    """Reviews of exactly these PRs, one aliased `prN: pullRequest(number: N)` lookup each."""
+    lookups = "\n".join(
+        f"pr{n}: pullRequest(number: {n}) {{ ...PullRequestReviews }}" for n in map(int, numbers)
+    )
+    return gql.gql(
+        f"""
+        query ReviewsByNumber($owner: String!, $name: String!) {{
+            rateLimit {{ cost remaining resetAt }}
+            repository(owner: $owner, name: $name) {{
+                {lookups}
+            }}
+        }}
+
+        fragment PullRequestReviews on PullRequest {{
+            id
+            number
+            reviews(first: 100) {{
+                nodes {{
+                    author {{
+                        login
+                    }}
+                    state
+                    submittedAt
+                }}
+                pageInfo {{
+                    hasNextPage
+                    endCursor
+                }}
+            }}
+        }}
+        """
+    )
@@ -1,26 +1,53 @@
-from ..models import OpenPullRequest, PullRequest, Repository, Review
+import asyncio
+from collections.abc import Iterator, Mapping
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+
+from ..models import (
+    OpenPullRequest,
+    OrgPullRequestPage,
+    PullRequest,
+    PullRequestPage,
+    Repository,
+    Review,
+)
 from ..utils import TimePeriod
 from ..utils.date_utils import parse_iso_datetime
+from ._nested_pages import complete_nested
+from ._page_size import PageSizer
 from ._response_mapper import (
     map_author_login,
     map_pull_request,
     map_repository,
     map_review,
 )
-from .graphql_client import execute_paginated_query, get_client
+from ._search_windows import iter_search_merged, search_merged
+from .exceptions import GitHubError
+from .graphql_client import execute_paginated_query, execute_query, get_client
 from .graphql_queries import (
-    LANG_REPORT_QUERY,
+    DEFAULT_PROFILE,
     OPEN_PRS_QUERY,
     ORG_REPOSITORIES_QUERY,
-    REPO_METRICS_QUERY,
     REPOSITORIES_QUERY,
     SEARCH_MERGED_PRS_QUERY,
     SKILL_REPORT_QUERY,
+    reviews_by_number_query,
+    search_merged_query,
 )
+from .token_pool import TokenPool
 
 PAGE_SIZE = 50
 SEARCH_PAGE_SIZE = 25
 
+# Connections cut short by the inline limits of the search queries, paged to the end.
+# Ones a fetch profile does not select are skipped.
+PR_CONNECTIONS = ("reviews", "commits", "files")
+FILE_CONNECTIONS = ("files",)
+REVIEW_CONNECTIONS = ("reviews",)
+
+# GitHub charges 1 point per 100 connections requested, so 100 lookups cost one point.
+REVIEW_BATCH_SIZE = 100
+
 
 def _build_merged_prs_query(org: str, repo: str, period: TimePeriod) -> str:
     """Build GitHub search query for PRs merged within a TimePeriod."""
@@ -68,29 +95,27 @@ def fetch_pull_requests(token: str, org: str, repo: str, period: TimePeriod) ->
 
 
 def fetch_reviews(
-    token: str, org: str, repo: str, pr_numbers: list[int], period: TimePeriod
+    token: str, org: str, repo: str, pr_numbers: list[int]
 ) -> dict[int, list[Review]]:
-    """Fetch all reviews for the given PRs."""
+    """Fetch all reviews for the given PRs, looking up only those PRs in aliased batches.
+
+    PRs with more reviews than one lookup returns are paged to the end.
+    """
     if not pr_numbers:
         return {}
 
     client = get_client(token)
-    prs = execute_paginated_query(
-        client,
-        REPO_METRICS_QUERY,
-        {"owner": org, "name": repo, "first": PAGE_SIZE},
-        "repository.pullRequests",
-    )
-
     reviews_by_pr: dict[int, list[Review]] = {pr_num: [] for pr_num in pr_numbers}
-
-    for pr in prs:
-        pr_number = pr.get("number")
-        if pr_number not in pr_numbers:
-            continue
-
-        reviews = pr.get("reviews", {}).get("nodes", [])
-        reviews_by_pr[pr_number] = [map_review(r) for r in reviews]
+    numbers = list(reviews_by_pr)
+    for start in range(0, len(numbers), REVIEW_BATCH_SIZE):
+        batch = numbers[start : start + REVIEW_BATCH_SIZE]
+        result = execute_query(client, reviews_by_number_query(batch), {"owner": org, "name": repo})
+        found = result.get("repository") or {}
+        prs = {number: found.get(f"pr{number}") or {} for number in batch}
+        complete_nested(client, list(prs.values()), REVIEW_CONNECTIONS)
+        for number, pr in prs.items():
+            reviews = (pr.get("reviews") or {}).get("nodes") or []
+            reviews_by_pr[number] = [map_review(r) for r in reviews]
 
     return reviews_by_pr
 
@@ -112,21 +137,108 @@ def _filter_and_map_pr(prs: list[dict], period: TimePeriod) -> list[PullRequest]
     return mapped_prs
 
 
-def fetch_repo_metrics(token: str, org: str, repo: str, period: TimePeriod) -> list[PullRequest]:
-    """Fetch PRs (with attached reviews) in a single query using search API."""
+def fetch_repo_metrics(
+    token: str, org: str, repo: str, period: TimePeriod, quiet: bool = False
+) -> list[PullRequest]:
+    """Fetch PRs (with attached reviews) using the search API, splitting months over the cap."""
     client = get_client(token)
-    search_query = _build_merged_prs_query(org, repo, period)
-    prs = execute_paginated_query(
+    prs = search_merged(
         client,
         SEARCH_MERGED_PRS_QUERY,
-        {"query": search_query, "first": SEARCH_PAGE_SIZE},
-        "search",
+        f"repo:{org}/{repo} is:pr",
+        period,
+        SEARCH_PAGE_SIZE,
         repo_id=f"{org}/{repo}",
+        quiet=quiet,
     )
+    complete_nested(client, prs, PR_CONNECTIONS)
 
     return _filter_and_map_pr(prs, period)
 
 
+def _is_open(period: TimePeriod) -> bool:
+    """Whether PRs can still merge into `period`, so cached answers for it go stale."""
+    return period.until > datetime.now(UTC)
+
+
+def iter_repo_metrics(
+    token: str,
+    org: str,
+    repo: str,
+    period: TimePeriod,
+    resume: Mapping[str, str | None] | None = None,
+    updated_since: datetime | None = None,
+    profile: str = DEFAULT_PROFILE,
+    page_size: int | None = None,
+) -> Iterator[PullRequestPage]:
+    """Yield mapped PRs (with reviews) page by page, so callers can store them as they arrive.
+
+    Each page carries the search and cursor to checkpoint; pass them back as `resume`.
+    With `updated_since`, only PRs merged or changed (e.g. reviewed) since then are fetched.
+    `profile` picks the fields fetched (see `FETCH_PROFILES`). The page size starts at
+    `page_size` and adapts; each page reports the current one to start from next time.
+    """
+    prefix = f"repo:{org}/{repo} is:pr"
+    if updated_since is not None:
+        prefix += f" updated:>={updated_since.astimezone(UTC):%Y-%m-%dT%H:%M:%SZ}"
+    client = get_client(token, live=updated_since is not None or _is_open(period))
+    sizer = PageSizer(page_size or SEARCH_PAGE_SIZE)
+    for page in iter_search_merged(
+        client,
+        search_merged_query(profile),
+        prefix,
+        period,
+        sizer.size,
+        repo_id=f"{org}/{repo}",
+        resume=resume,
+        sizer=sizer,
+    ):
+        complete_nested(client, page.nodes, PR_CONNECTIONS)
+        prs = _filter_and_map_pr(page.nodes, period)
+        yield {"prs": prs, "query": page.query, "cursor": page.cursor, "page_size": sizer.size}
+
+
+def iter_org_metrics(
+    token: str,
+    org: str,
+    period: TimePeriod,
+    resume: Mapping[str, str | None] | None = None,
+    profile: str = DEFAULT_PROFILE,
+    page_size: int | None = None,
+) -> Iterator[OrgPullRequestPage]:
+    """Yield every repo's merged PRs in `org` from one search, grouped by `nameWithOwner`.
+
+    One stream covers the whole org, so quiet repos cost no round trip of their own.
+    """
+    client = get_client(token, live=_is_open(period))
+    sizer = PageSizer(page_size or SEARCH_PAGE_SIZE)
+    for page in iter_search_merged(
+        client,
+        search_merged_query(profile),
+        f"org:{org} is:pr",
+        period,
+        sizer.size,
+        repo_id=org,
+        resume=resume,
+        sizer=sizer,
+    ):
+        complete_nested(client, page.nodes, PR_CONNECTIONS)
+        nodes_by_repo: dict[str, list[dict]] = {}
+        for node in page.nodes:
+            full_name = (node.get("repository") or {}).get("nameWithOwner")
+            if full_name:
+                nodes_by_repo.setdefault(full_name, []).append(node)
+        yield {
+            "prs_by_repo": {
+                full_name: _filter_and_map_pr(nodes, period)
+                for full_name, nodes in nodes_by_repo.items()
+            },
+            "query": page.query,
+            "cursor": page.cursor,
+            "page_size": sizer.size,
+        }
+
+
 def _map_open_prs(prs: list[dict]) -> list[OpenPullRequest]:
     """Map raw GraphQL PR nodes to OpenPullRequest model."""
     result: list[OpenPullRequest] = []
@@ -156,54 +268,15 @@ def fetch_skill_report_prs(token: str, org: str, repo: str, year: int, month: in
     from ..utils.date_utils import month_range
 
     client = get_client(token)
-    period = month_range(year, month)
-    since_s = period.since.strftime("%Y-%m-%d")
-    until_s = period.until.strftime("%Y-%m-%d")
-    query_str = f"repo:{org}/{repo} is:pr merged:{since_s}..{until_s}"
-    nodes = execute_paginated_query(
+    nodes = search_merged(
         client,
         SKILL_REPORT_QUERY,
-        {"query": query_str, "first": 25},
-        "search",
-        repo_id=f"{org}/{repo}",
-    )
-
-    result: list[dict] = []
-    for node in nodes:
-        files_raw = (node.get("files") or {}).get("nodes") or []
-        result.append(
-            {
-                "number": node.get("number"),
-                "user": {"login": map_author_login(node.get("author"))},
-                "files": [
-                    {
-                        "path": f["path"],
-                        "additions": f.get("additions", 0),
-                        "deletions": f.get("deletions", 0),
-                    }
-                    for f in files_raw
-                ],
-            }
-        )
-    return result
-
-
-def fetch_lang_report_prs(token: str, org: str, repo: str, year: int, month: int) -> list[dict]:
-    """Fetch merged PRs with file paths for a given month. Returns lightweight dicts."""
-    from ..utils.date_utils import month_range
-
-    client = get_client(token)
-    period = month_range(year, month)
-    since_s = period.since.strftime("%Y-%m-%d")
-    until_s = period.until.strftime("%Y-%m-%d")
-    query_str = f"repo:{org}/{repo} is:pr merged:{since_s}..{until_s}"
-    nodes = execute_paginated_query(
-        client,
-        LANG_REPORT_QUERY,
-        {"query": query_str, "first": 25},
-        "search",
+        f"repo:{org}/{repo} is:pr",
+        month_range(year, month),
+        25,
         repo_id=f"{org}/{repo}",
     )
+    complete_nested(client, nodes, FILE_CONNECTIONS)
 
     result: list[dict] = []
     for node in nodes:
@@ -238,3 +311,44 @@ def fetch_open_prs(token: str, org: str, repo: str, quiet: bool = False) -> list
     )
 
     return _map_open_prs(prs)
+
+
+def fetch_open_prs_many(
+    token: str | TokenPool, repos: list[tuple[str, str]], jobs: int
+) -> dict[tuple[str, str], list[OpenPullRequest] | GitHubError]:
+    """Fetch open PRs for many `(org, repo)` on the asyncio backend, `jobs` repos at a time.
+
+    A repo that fails with a `GitHubError` maps to that error; anything else is raised.
+    Given a `TokenPool`, each repo goes to the token with the most budget left.
+    """
+    from .async_graphql_client import (
+        async_session,
+        execute_paginated_query_async,
+        gather_bounded,
+    )
+
+    tokens = token if isinstance(token, TokenPool) else TokenPool([token])
+
+    async def fetch_all() -> list[list[OpenPullRequest] | BaseException]:
+        async with AsyncExitStack() as stack:
+            sessions = {t: await stack.enter_async_context(async_session(t)) for t in tokens.tokens}
+
+            async def fetch_one(org: str, repo: str) -> list[OpenPullRequest]:
+                prs = await execute_paginated_query_async(
+                    sessions[tokens.acquire()],
+                    OPEN_PRS_QUERY,
+                    {"owner": org, "name": repo, "first": PAGE_SIZE},
+                    "repository.pullRequests",
+                )
+                return _map_open_prs(prs)
+
+            return await gather_bounded(
+                [lambda org=org, repo=repo: fetch_one(org, repo) for org, repo in repos], jobs
+            )
+
+    out: dict[tuple[str, str], list[OpenPullRequest] | GitHubError] = {}
+    for key, result in zip(repos, asyncio.run(fetch_all()), strict=True):
+        if isinstance(result, BaseException) and not isinstance(result, GitHubError):
+            raise result
+        out[key] = result
+    return out
@@ -0,0 +1,144 @@
+"""Spread concurrent work over several GitHub tokens by their remaining GraphQL budget."""
+
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from .exceptions import GitHubAuthError, GitHubError, GitHubRateLimitError
+from .graphql_client import rate_limit_scheduler
+
+# Budget assumed for a token GitHub has not reported on yet (the hourly GraphQL quota).
+FULL_BUDGET = 5000
+
+# How long an exhausted token sits out when GitHub gave no reset time.
+BENCH_SECONDS = 60.0
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """What one token of the pool has spent so far."""
+
+    label: str
+    requests: int
+    points: int
+    remaining: int | None
+    state: str  # "ok", "exhausted" or "rejected"
+
+
+def mask_token(token: str) -> str:
+    """Enough of `token` to tell it apart in a summary."""
+    return f"…{token[-4:]}"
+
+
+class TokenPool:
+    """Hands each worker the token with the most budget left.
+
+    Budgets come from each token's `RateLimitScheduler`. A token that GitHub rejects
+    is taken out for good; one that runs out of budget sits out until its reset. With
+    more than one token, a request that would wait for its token's reset raises
+    `GitHubRateLimitError` instead while another token is usable, so the worker
+    switches tokens mid-stream.
+    """
+
+    def __init__(self, tokens: Iterable[str], clock: Callable[[], float] = time.time) -> None:
+        self._tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not self._tokens:
+            raise GitHubAuthError("No token provided")
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._out_until: dict[str, float] = {}
+        self._handed_out = dict.fromkeys(self._tokens, 0)
+        if len(self._tokens) > 1:
+            for token in self._tokens:
+                rate_limit_scheduler(token).hand_off_to(functools.partial(self._has_other, token))
+
+    @property
+    def tokens(self) -> list[str]:
+        return list(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def _budget(self, token: str) -> int:
+        scheduler = rate_limit_scheduler(token)
+        if scheduler.remaining is None or scheduler.seconds_until_reset() == 0:
+            return FULL_BUDGET
+        return scheduler.remaining
+
+    def _usable(self, now: float) -> list[str]:
+        return [token for token in self._tokens if self._out_until.get(token, 0.0) <= now]
+
+    def acquire(self) -> str:
+        """The usable token with the most budget; ties go to the one handed out least.
+
+        With every token out, the one back soonest is returned (its scheduler waits for
+        the reset). Raises `GitHubAuthError` when every token was rejected.
+        """
+        with self._lock:
+            usable = self._usable(self._clock())
+            if usable:
+                token = max(usable, key=lambda t: (self._budget(t), -self._handed_out[t]))
+            else:
+                token = min(self._tokens, key=lambda t: self._out_until[t])
+                if self._out_until[token] == math.inf:
+                    raise GitHubAuthError("Every GitHub token was rejected")
+            self._handed_out[token] += 1
+            return token
+
+    def _has_other(self, token: str) -> bool:
+        with self._lock:
+            return any(other != token for other in self._usable(self._clock()))
+
+    def call(self, fn: Callable[[str], T]) -> T:
+        """`fn(token)` with the best token, moving on to the next if it is rejected or runs dry."""
+        while True:
+            token = self.acquire()
+            try:
+                return fn(token)
+            except (GitHubAuthError, GitHubRateLimitError) as e:
+                if not self.take_out(token, e):
+                    raise
+
+    def take_out(self, token: str, error: GitHubError) -> bool:
+        """Bench `token` after `error`: for good if rejected, else until its budget resets.
+
+        Returns whether another token is still usable.
+        """
+        now = self._clock()
+        if isinstance(error, GitHubAuthError):
+            until = math.inf
+        else:
+            until = now + (rate_limit_scheduler(token).seconds_until_reset() or BENCH_SECONDS)
+        with self._lock:
+            self._out_until[token] = max(self._out_until.get(token, 0.0), until)
+            return bool(self._usable(now))
+
+    def _state(self, token: str, now: float) -> str:
+        until = self._out_until.get(token, 0.0)
+        if until == math.inf:
+            return "rejected"
+        return "exhausted" if until > now else "ok"
+
+    def usage(self) -> list[TokenUsage]:
+        """Requests, points and remaining budget per token, in the order given."""
+        now = self._clock()
+        out: list[TokenUsage] = []
+        with self._lock:
+            for token in self._tokens:
+                scheduler = rate_limit_scheduler(token)
+                out.append(
+                    TokenUsage(
+                        label=mask_token(token),
+                        requests=scheduler.requests,
+                        points=scheduler.spent,
+                        remaining=scheduler.remaining,
+                        state=self._state(token, now),
+                    )
+                )
+        return out
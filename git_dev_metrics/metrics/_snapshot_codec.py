@@ -0,0 +1,34 @@
+"""msgpack encoding of `MetricsSnapshot` for the cache's snapshot table."""
+
+from dataclasses import asdict
+from typing import cast
+
+import msgpack
+
+from ..utils import TimePeriod
+from ._rows import Row, Summary
+from .snapshot import MetricsSnapshot
+
+# Part of every snapshot cache key. Bump it when the snapshot's fields, or how it is
+# computed from the aggregates, change; older entries are then never read again.
+SNAPSHOT_VERSION = 2
+
+
+def encode_snapshot(snapshot: MetricsSnapshot) -> bytes:
+    # Typed as optional because Packer.pack returns None without autoreset; packb never does.
+    return cast(bytes, msgpack.packb(asdict(snapshot), datetime=True))
+
+
+def decode_snapshot(body: bytes) -> MetricsSnapshot:
+    data = msgpack.unpackb(body, timestamp=3)
+    summary = data["summary"]
+    return MetricsSnapshot(
+        period=TimePeriod(**data["period"]),
+        team=Row(**data["team"]),
+        devs=tuple(Row(**row) for row in data["devs"]),
+        repos=tuple(Row(**row) for row in data["repos"]),
+        summary=Summary(**{**summary, "ai_per_dev": tuple(summary["ai_per_dev"])}),
+        reviewer_counts=data["reviewer_counts"],
+        has_partial=data["has_partial"],
+        ai_available=data["ai_available"],
+    )
@@ -1,7 +1,15 @@
 from pathlib import Path
 
-from ..cache import has_partial_for_range, load_all_repos_for_range
+from ..cache import (
+    get_cached_snapshot,
+    has_partial_for_range,
+    has_timing_profile_for_range,
+    load_repo_aggregates_for_range,
+    save_cached_snapshot,
+    snapshot_cache_key,
+)
 from ..utils.date_utils import month_iter, parse_year_month, range_period
+from ._snapshot_codec import SNAPSHOT_VERSION, decode_snapshot, encode_snapshot
 from .snapshot import MetricsSnapshot
 
 
@@ -12,12 +20,31 @@ class InvalidRangeError(ValueError):
 def load_snapshot_for_months(
     months: list[tuple[int, int]], db_path: Path | None
 ) -> MetricsSnapshot | None:
-    repo_prs = load_all_repos_for_range(months, db_path=db_path)
-    if not repo_prs:
+    """Snapshot of every cached repo over `months`; None if they hold no PRs.
+
+    Served from the cache's snapshot table while none of the months was re-pulled
+    since the snapshot was stored.
+    """
+    key = snapshot_cache_key(months, SNAPSHOT_VERSION, db_path=db_path)
+    if key is not None and (body := get_cached_snapshot(key, db_path=db_path)) is not None:
+        return decode_snapshot(body)
+
+    repo_aggregates = load_repo_aggregates_for_range(months, db_path=db_path)
+    if not repo_aggregates:
         return None
     period = range_period(months[0], months[-1])
-    partial = has_partial_for_range(months, db_path=db_path)
-    return MetricsSnapshot.from_repo_prs(repo_prs, period, has_partial=partial)
+    snapshot = MetricsSnapshot.from_aggregates(
+        repo_aggregates,
+        period,
+        has_partial=has_partial_for_range(months, db_path=db_path),
+        ai_available=not has_timing_profile_for_range(months, db_path=db_path),
+    )
+
+    # Aggregates of freshly pulled months were rebuilt above, so the key exists now.
+    key = snapshot_cache_key(months, SNAPSHOT_VERSION, db_path=db_path)
+    if key is not None:
+        save_cached_snapshot(key, encode_snapshot(snapshot), db_path=db_path)
+    return snapshot
 
 
 def load_snapshot_for_range(from_: str, to: str, db_path: Path | None) -> MetricsSnapshot | None:
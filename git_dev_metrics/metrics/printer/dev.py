@@ -52,7 +52,7 @@ class ConsoleDevPrinter:
                 f"{row.pr_count:.0f}",
                 f"{row.prs_per_week:.2f}",
                 f"{row.reviews_given:.0f}",
-                f"{row.ai_percentage:.0f}%",
+                f"{row.ai_percentage:.0f}%" if snapshot.ai_available else "n/a",
             )
 
         console.print(table)
@@ -104,6 +104,7 @@ class FileHtmlPrinter:
             period=period,
             date_range=date_range,
             has_partial=snapshot.has_partial,
+            ai_available=snapshot.ai_available,
             target_status=target_status,
         )
 
@@ -1,61 +1,67 @@
 """Frozen, fully-computed metrics for one period across one or more repos.
 
-Built once via `MetricsSnapshot.from_repo_prs`. Printers consume snapshots;
+Built once via `MetricsSnapshot.from_repo_prs`, or `from_aggregates` straight from the
+cached per-(repo, month, dev) aggregates. Printers consume snapshots;
 they do not recompute health, bands, sort orders, or aggregations.
 """
 
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from ..models import PullRequest
+from ..constants import is_bot_login
+from ..models import DevAggregate, PullRequest
+from ..pr_metrics import aggregate_prs, merge_aggregates, merge_by_login
 from ..utils import TimePeriod, period_days
-from ._ai_detection import calculate_ai_percentage
 from ._rows import Band, RawMetrics, Row, Summary
-from .calculator import (
-    calculate_avg_lines_per_pr,
-    calculate_cycle_time,
-    calculate_pickup_time,
-    calculate_pr_size,
-    calculate_prs_per_week,
-    calculate_review_time,
-    calculate_reviews_given,
-    calculate_throughput,
-    group_prs_by_devs,
-    median,
-)
+from .calculator import median
 from .health import calculate_dev_health_score, calculate_health_score
 
 
-def compute_raw(prs: list[PullRequest], days: int, reviews_given: int) -> RawMetrics:
+def _median_hours(values: list[float]) -> float:
+    return round(median(values), 2) if values else 0.0
+
+
+def compute_raw(agg: DevAggregate, days: int, reviews_given: int) -> RawMetrics:
+    pr_count = agg["pr_count"]
     return RawMetrics(
-        cycle_time=calculate_cycle_time(prs),
-        pr_size=calculate_pr_size(prs),
-        avg_lines_per_pr=calculate_avg_lines_per_pr(prs),
-        pr_count=calculate_throughput(prs),
-        pickup_time=calculate_pickup_time(prs),
-        review_time=calculate_review_time(prs),
-        prs_per_week=calculate_prs_per_week(prs, days),
+        cycle_time=_median_hours(agg["cycle_hours"]),
+        pr_size=round(median([float(size) for size in agg["sizes"]])),
+        avg_lines_per_pr=round(agg["size_sum"] / pr_count, 1) if pr_count else 0.0,
+        pr_count=pr_count,
+        pickup_time=_median_hours(agg["pickup_hours"]),
+        review_time=_median_hours(agg["review_hours"]),
+        prs_per_week=round(pr_count / max(days / 7, 1), 2),
         reviews_given=reviews_given,
-        ai_percentage=calculate_ai_percentage(prs),
+        ai_percentage=round(agg["ai_count"] / pr_count * 100, 1) if pr_count else 0.0,
     )
 
 
+def reviewer_counts_of(aggregates: dict[str, DevAggregate]) -> dict[str, int]:
+    """PRs reviewed per login, bots and logins without reviews left out."""
+    return {
+        login: agg["reviews_given"]
+        for login, agg in aggregates.items()
+        if agg["reviews_given"] and not is_bot_login(login)
+    }
+
+
 def compute_dev_metrics(
-    all_prs: list[PullRequest], days: int, reviewer_counts: dict[str, int]
+    aggregates: dict[str, DevAggregate], days: int, reviewer_counts: dict[str, int]
 ) -> dict[str, RawMetrics]:
     return {
-        dev: compute_raw(dev_prs, days, reviewer_counts.get(dev, 0))
-        for dev, dev_prs in group_prs_by_devs(all_prs).items()
+        dev: compute_raw(agg, days, reviewer_counts.get(dev, 0))
+        for dev, agg in aggregates.items()
+        if agg["pr_count"] and not is_bot_login(dev)
     }
 
 
 def compute_repo_metrics(
-    repo_prs: dict[str, list[PullRequest]], days: int
+    repo_aggregates: dict[str, dict[str, DevAggregate]], days: int
 ) -> dict[str, RawMetrics]:
     raws: dict[str, RawMetrics] = {}
-    for name, prs in repo_prs.items():
-        reviews_given = sum(calculate_reviews_given(prs).values())
-        raw = compute_raw(prs, days, reviews_given)
+    for name, aggregates in repo_aggregates.items():
+        reviews_given = sum(reviewer_counts_of(aggregates).values())
+        raw = compute_raw(merge_aggregates(aggregates.values()), days, reviews_given)
         if raw.pr_count > 0:
             raws[name] = raw
     return raws
@@ -107,13 +113,11 @@ _PER_DEV_AGGREGATED_KEYS = (
 
 
 def compute_team_row(
-    all_prs: list[PullRequest],
-    days: int,
+    pr_count: int,
     dev_raws: dict[str, RawMetrics],
     devs: tuple[Row, ...],
     reviewer_counts: dict[str, int],
 ) -> Row:
-    team_raw = compute_raw(all_prs, days, sum(reviewer_counts.values()))
     aggregated = {
         key: round(median([getattr(m, key) for m in dev_raws.values() if getattr(m, key, None)]), 2)
         for key in _PER_DEV_AGGREGATED_KEYS
@@ -125,8 +129,8 @@ def compute_team_row(
         "team",
         RawMetrics(
             **aggregated,
-            pr_count=team_raw.pr_count,
-            reviews_given=team_raw.reviews_given,
+            pr_count=pr_count,
+            reviews_given=sum(reviewer_counts.values()),
         ),
         team_health,
     )
@@ -141,6 +145,8 @@ class MetricsSnapshot:
     summary: Summary
     reviewer_counts: dict[str, int]
     has_partial: bool = False
+    # False when some month was pulled without the fields AI detection reads.
+    ai_available: bool = True
 
     @classmethod
     def from_repo_prs(
@@ -149,18 +155,37 @@ class MetricsSnapshot:
         period: TimePeriod,
         *,
         has_partial: bool = False,
+        ai_available: bool = True,
+    ) -> MetricsSnapshot:
+        return cls.from_aggregates(
+            {name: aggregate_prs(prs) for name, prs in repo_prs.items()},
+            period,
+            has_partial=has_partial,
+            ai_available=ai_available,
+        )
+
+    @classmethod
+    def from_aggregates(
+        cls,
+        repo_aggregates: dict[str, dict[str, DevAggregate]],
+        period: TimePeriod,
+        *,
+        has_partial: bool = False,
+        ai_available: bool = True,
     ) -> MetricsSnapshot:
+        """Snapshot from per-repo, per-login aggregates; no PR needs to be loaded."""
         days = period_days(period)
-        all_prs: list[PullRequest] = [pr for prs in repo_prs.values() for pr in prs]
-        reviewer_counts = calculate_reviews_given(all_prs)
+        team_aggregates = merge_by_login(repo_aggregates.values())
+        reviewer_counts = reviewer_counts_of(team_aggregates)
 
-        dev_raw_data = compute_dev_metrics(all_prs, days, reviewer_counts)
+        dev_raw_data = compute_dev_metrics(team_aggregates, days, reviewer_counts)
         devs = rank_rows(dev_raw_data, calculate_dev_health_score)
 
-        repo_raw_data = compute_repo_metrics(repo_prs, days)
+        repo_raw_data = compute_repo_metrics(repo_aggregates, days)
         repos = rank_rows(repo_raw_data, calculate_health_score)
 
-        team = compute_team_row(all_prs, days, dev_raw_data, devs, reviewer_counts)
+        pr_count = sum(agg["pr_count"] for agg in team_aggregates.values())
+        team = compute_team_row(pr_count, dev_raw_data, devs, reviewer_counts)
 
         return cls(
             period=period,
@@ -170,6 +195,7 @@ class MetricsSnapshot:
             summary=build_summary(devs, reviewer_counts, team),
             reviewer_counts=reviewer_counts,
             has_partial=has_partial,
+            ai_available=ai_available,
         )
 
 
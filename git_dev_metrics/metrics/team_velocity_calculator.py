@@ -1,8 +1,8 @@
-from collections.abc import Sequence
 from dataclasses import dataclass
 
 from ..constants import is_bot_login
-from ..models import PullRequest
+from ..models import DevAggregate, PullRequest
+from ..pr_metrics import aggregate_prs, empty_aggregate
 from ..utils.date_utils import month_key, month_label
 
 
@@ -21,37 +21,37 @@ class TeamVelocityDataset:
     dev_month_counts: list[dict[str, int]]
 
 
-def _count_active_devs(prs: Sequence[PullRequest]) -> int:
-    return len({pr["user"]["login"] for pr in prs if not is_bot_login(pr["user"]["login"])})
+def _active_logins(aggregates: dict[str, DevAggregate]) -> set[str]:
+    return {dev for dev, agg in aggregates.items() if agg["pr_count"] and not is_bot_login(dev)}
+
+
+def _pr_count(aggregates: dict[str, DevAggregate]) -> int:
+    return sum(agg["pr_count"] for agg in aggregates.values())
 
 
 def _latest_active_devs(
-    months: list[tuple[int, int]], prs_per_month: dict[tuple[int, int], list[PullRequest]]
+    months: list[tuple[int, int]],
+    aggregates_per_month: dict[tuple[int, int], dict[str, DevAggregate]],
 ) -> set[str]:
     for y, m in reversed(months):
-        month_prs = prs_per_month.get((y, m), [])
-        if month_prs:
-            return {
-                pr["user"]["login"] for pr in month_prs if not is_bot_login(pr["user"]["login"])
-            }
+        month_aggregates = aggregates_per_month.get((y, m), {})
+        if _pr_count(month_aggregates):
+            return _active_logins(month_aggregates)
     return set()
 
 
 def _dev_month_counts(
-    months: list[tuple[int, int]], prs_per_month: dict[tuple[int, int], list[PullRequest]]
+    months: list[tuple[int, int]],
+    aggregates_per_month: dict[tuple[int, int], dict[str, DevAggregate]],
 ) -> list[dict[str, int]]:
-    all_devs = sorted(_latest_active_devs(months, prs_per_month))
+    all_devs = sorted(_latest_active_devs(months, aggregates_per_month))
     result: list[dict[str, int]] = []
     for y, m in months:
-        month_prs = prs_per_month.get((y, m), [])
-        if not month_prs:
+        month_aggregates = aggregates_per_month.get((y, m), {})
+        if not _pr_count(month_aggregates):
             continue
-        counts: dict[str, int] = {dev: 0 for dev in all_devs}
-        for pr in month_prs:
-            login = pr["user"]["login"]
-            if login in counts:
-                counts[login] += 1
-        result.append(counts)
+        empty = empty_aggregate()
+        result.append({dev: month_aggregates.get(dev, empty)["pr_count"] for dev in all_devs})
     return result
 
 
@@ -60,13 +60,23 @@ def build_team_velocity_dataset(
     prs_per_month: dict[tuple[int, int], list[PullRequest]],
 ) -> TeamVelocityDataset:
     """Per-month total PR count, active developer count, and PRs per dev."""
+    return team_velocity_from_aggregates(
+        months, {ym: aggregate_prs(prs) for ym, prs in prs_per_month.items()}
+    )
+
+
+def team_velocity_from_aggregates(
+    months: list[tuple[int, int]],
+    aggregates_per_month: dict[tuple[int, int], dict[str, DevAggregate]],
+) -> TeamVelocityDataset:
+    """`build_team_velocity_dataset` from per-month, per-login aggregates."""
     rows: list[TeamVelocityMonth] = []
     for y, m in months:
-        month_prs = prs_per_month.get((y, m), [])
-        if not month_prs:
+        month_aggregates = aggregates_per_month.get((y, m), {})
+        pr_count = _pr_count(month_aggregates)
+        if not pr_count:
             continue
-        pr_count = len(month_prs)
-        active = _count_active_devs(month_prs)
+        active = len(_active_logins(month_aggregates))
         rows.append(
             TeamVelocityMonth(
                 month_label=month_label(y, m),
@@ -76,7 +86,7 @@ def build_team_velocity_dataset(
                 prs_per_dev=round(pr_count / active, 1) if active else 0.0,
             )
         )
-    dev_counts = _dev_month_counts(months, prs_per_month)
+    dev_counts = _dev_month_counts(months, aggregates_per_month)
     return TeamVelocityDataset(months=rows, dev_month_counts=dev_counts)
 
 
@@ -86,4 +96,5 @@ __all__ = [
     "_dev_month_counts",
     "_latest_active_devs",
     "build_team_velocity_dataset",
+    "team_velocity_from_aggregates",
 ]
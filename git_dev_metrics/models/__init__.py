@@ -1,19 +1,29 @@
 """Models"""
 
 from .types import (
+    DevAggregate,
     GitHubUser,
     OpenPullRequest,
+    OrgPullRequestPage,
     PullRequest,
+    PullRequestFile,
     PullRequestInfo,
+    PullRequestMetrics,
+    PullRequestPage,
     Repository,
     Review,
 )
 
 __all__ = [
+    "DevAggregate",
     "GitHubUser",
     "OpenPullRequest",
+    "OrgPullRequestPage",
     "PullRequest",
+    "PullRequestFile",
     "PullRequestInfo",
+    "PullRequestMetrics",
+    "PullRequestPage",
     "Repository",
     "Review",
 ]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class Repository(TypedDict):
@@ -23,6 +23,43 @@ class Review(TypedDict):
     submitted_at: datetime | None
 
 
+class PullRequestFile(TypedDict):
+    path: str
+    additions: int
+    deletions: int
+
+
+class PullRequestMetrics(TypedDict):
+    """Per-PR values the reports aggregate; stored with cached PRs."""
+
+    start_at: datetime | None
+    first_approval_at: datetime | None
+    cycle_hours: float | None
+    pickup_hours: float | None
+    review_hours: float | None
+    size: int
+    is_ai: bool
+
+
+class DevAggregate(TypedDict):
+    """One login's PRs and reviews over a scope (a repo-month, or a merge of several).
+
+    Counts and sums add up; the value lists are concatenated, so medians stay exact.
+    Exact medians were chosen over fixed-size sketches: a range load is O(PRs) in
+    values, not O(devs x months), but reads one number per PR and metric instead of
+    a PR row with its body, reviews and commit messages.
+    """
+
+    pr_count: int
+    ai_count: int
+    size_sum: int
+    reviews_given: int
+    cycle_hours: list[float]
+    pickup_hours: list[float]
+    review_hours: list[float]
+    sizes: list[int]
+
+
 class PullRequest(PullRequestInfo):
     id: int
     number: int
@@ -38,6 +75,22 @@ class PullRequest(PullRequestInfo):
     body: str | None
     commit_messages: list[str]
     reviews: list[Review]
+    files: NotRequired[list[PullRequestFile]]
+    metrics: NotRequired[PullRequestMetrics]
+
+
+class PullRequestPage(TypedDict):
+    prs: list[PullRequest]
+    query: str
+    cursor: str | None
+    page_size: NotRequired[int]
+
+
+class OrgPullRequestPage(TypedDict):
+    prs_by_repo: dict[str, list[PullRequest]]
+    query: str
+    cursor: str | None
+    page_size: NotRequired[int]
 
 
 class OpenPullRequest(TypedDict):
@@ -0,0 +1,157 @@
+"""Per-PR metric definitions and per-dev aggregates, shared by the calculators and the cache.
+
+The cache stores these values with every PR it writes, and the per-(repo, month,
+dev) aggregates of every month it syncs, tagged with `METRICS_VERSION`. Bump the
+version whenever a definition here changes; cached PRs and aggregates with an
+older version are recomputed the next time they are loaded.
+"""
+
+import re
+from collections.abc import Iterable
+from datetime import datetime
+
+from .models import DevAggregate, PullRequest, PullRequestMetrics
+
+METRICS_VERSION = 1
+
+AI_TRAILER_PATTERNS = [
+    r"Co-Authored-By:",
+    r"co-authored-by:",
+    r"Generated\s+(by|with|with\s+)?[\w\s]*AI",
+    r"Claude\s+Code",
+    r"Coding-Agent:",
+    r"AI-assistant:",
+    r"🤖\s*Generated",
+    r"Aider:",
+    r"Cursor:",
+    r"GitHub\s+Copilot:",
+    r"Devin:",
+]
+
+# One pass per text instead of one per pattern.
+_AI_TRAILER = re.compile("|".join(f"(?:{p})" for p in AI_TRAILER_PATTERNS), re.IGNORECASE)
+
+
+def pr_start_time(pr: PullRequest) -> datetime | None:
+    """Earlier of creation and first commit, moved up to ready-for-review for drafts."""
+    created = pr["created_at"]
+    if created is None:
+        return None
+    first_commit = pr.get("first_commit_at")
+    start = first_commit if first_commit is not None and first_commit < created else created
+    ready_for_review = pr.get("ready_for_review_at")
+    if ready_for_review is not None and ready_for_review > start:
+        start = ready_for_review
+    return start
+
+
+def first_approval_at(pr: PullRequest) -> datetime | None:
+    for review in pr.get("reviews", []):
+        if review.get("state") == "APPROVED":
+            return review.get("submitted_at")
+    return None
+
+
+def is_ai_coauthored(pr: PullRequest) -> bool:
+    texts = [pr.get("body") or "", *(pr.get("commit_messages") or [])]
+    return any(_AI_TRAILER.search(text) for text in texts if text)
+
+
+def _hours(start: datetime | None, end: datetime | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return (end - start).total_seconds() / 3600
+
+
+def derive_pr_metrics(pr: PullRequest) -> PullRequestMetrics:
+    """Compute the per-PR metrics from the PR itself.
+
+    Cycle time only counts approved PRs, so the team-level invariant
+    pickup <= cycle holds.
+    """
+    start = pr_start_time(pr)
+    approval = first_approval_at(pr)
+    merged = pr.get("merged_at")
+    return {
+        "start_at": start,
+        "first_approval_at": approval,
+        "cycle_hours": _hours(start, merged) if approval is not None else None,
+        "pickup_hours": _hours(start, approval),
+        "review_hours": _hours(approval, merged),
+        "size": abs(pr.get("additions", 0) or 0) + abs(pr.get("deletions", 0) or 0),
+        "is_ai": is_ai_coauthored(pr),
+    }
+
+
+def pr_metrics(pr: PullRequest) -> PullRequestMetrics:
+    """The metrics stored with a cached PR, or computed now for one without them."""
+    stored = pr.get("metrics")
+    return stored if stored is not None else derive_pr_metrics(pr)
+
+
+def pr_reviewers(pr: PullRequest) -> list[str]:
+    """Distinct logins that reviewed `pr`, other than its author, in review order."""
+    author = pr["user"]["login"]
+    reviewers: list[str] = []
+    for review in pr.get("reviews", []):
+        reviewer = review.get("user", {}).get("login")
+        if reviewer and reviewer != author and reviewer not in reviewers:
+            reviewers.append(reviewer)
+    return reviewers
+
+
+def empty_aggregate() -> DevAggregate:
+    return {
+        "pr_count": 0,
+        "ai_count": 0,
+        "size_sum": 0,
+        "reviews_given": 0,
+        "cycle_hours": [],
+        "pickup_hours": [],
+        "review_hours": [],
+        "sizes": [],
+    }
+
+
+def _add_pr(agg: DevAggregate, metrics: PullRequestMetrics) -> None:
+    agg["pr_count"] += 1
+    agg["ai_count"] += int(metrics["is_ai"])
+    agg["size_sum"] += metrics["size"]
+    agg["sizes"].append(metrics["size"])
+    for key in ("cycle_hours", "pickup_hours", "review_hours"):
+        if (hours := metrics[key]) is not None:
+            agg[key].append(hours)
+
+
+def aggregate_prs(prs: Iterable[PullRequest]) -> dict[str, DevAggregate]:
+    """Per-login aggregates of `prs`: what each login authored and how many it reviewed.
+
+    Bots are kept; the reports filter them, so a change to the bot list needs no rebuild.
+    """
+    out: dict[str, DevAggregate] = {}
+    for pr in prs:
+        _add_pr(out.setdefault(pr["user"]["login"], empty_aggregate()), pr_metrics(pr))
+        for reviewer in pr_reviewers(pr):
+            out.setdefault(reviewer, empty_aggregate())["reviews_given"] += 1
+    return out
+
+
+def merge_aggregates(aggregates: Iterable[DevAggregate]) -> DevAggregate:
+    """One aggregate covering all of `aggregates`; value lists are concatenated."""
+    merged = empty_aggregate()
+    for agg in aggregates:
+        for key in ("pr_count", "ai_count", "size_sum", "reviews_given"):
+            merged[key] += agg[key]
+        for key in ("cycle_hours", "pickup_hours", "review_hours"):
+            merged[key].extend(agg[key])
+        merged["sizes"].extend(agg["sizes"])
+    return merged
+
+
+def merge_by_login(groups: Iterable[dict[str, DevAggregate]]) -> dict[str, DevAggregate]:
+    """Per-login merge of several per-login aggregates (e.g. across repos or months)."""
+    by_login: dict[str, list[DevAggregate]] = {}
+    for group in groups:
+        for login, agg in group.items():
+            by_login.setdefault(login, []).append(agg)
+    return {login: merge_aggregates(aggs) for login, aggs in by_login.items()}
@@ -0,0 +1,67 @@
+"""Micro-benchmark of response decoding: stdlib `json` vs. `_json.loads` (orjson).
+
+    uv run --extra fast scripts/bench_json.py
+
+Decodes every JSON response body recorded under tests/integration/cassettes (or
+`--cassettes`), so runs are offline and compare the same bytes each time. `uv run`
+installs the project into its venv, so no PYTHONPATH is needed; `--extra fast` adds
+orjson from the lock.
+"""
+
+import json
+import statistics
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import typer
+from vcr.serializers import yamlserializer
+
+from git_dev_metrics.github import _json
+
+CASSETTES = Path(__file__).resolve().parent.parent / "tests" / "integration" / "cassettes"
+ROUNDS = 20
+REPEATS = 7
+
+
+def _bodies(directory: Path) -> list[bytes]:
+    bodies: list[bytes] = []
+    for cassette in sorted(directory.glob("*.yaml")):
+        for interaction in yamlserializer.deserialize(cassette.read_text())["interactions"]:
+            body = interaction["response"]["body"].get("string")
+            if isinstance(body, str):
+                body = body.encode()
+            if body and body.lstrip()[:1] in (b"{", b"["):
+                bodies.append(body)
+    return bodies
+
+
+def _time(fn: Callable[[], object]) -> tuple[float, float]:
+    """Best and median seconds per call over `REPEATS` runs of `ROUNDS` calls."""
+    runs = [t / ROUNDS for t in timeit.repeat(fn, number=ROUNDS, repeat=REPEATS)]
+    return min(runs), statistics.median(runs)
+
+
+def main(
+    cassettes: Path = typer.Option(CASSETTES, "--cassettes", help="Directory of vcr cassettes"),
+) -> None:
+    bodies = _bodies(cassettes)
+    if not bodies:
+        typer.echo(f"No JSON response bodies recorded under {cassettes}.")
+        raise typer.Exit(1)
+    size = sum(len(body) for body in bodies)
+    typer.echo(f"{len(bodies)} response bodies, {size / 1024:.0f} KiB from {cassettes}")
+    if not _json.FAST_JSON:
+        typer.echo("orjson is not installed; both rows use the stdlib decoder.")
+
+    stdlib_best, stdlib_median = _time(lambda: [json.loads(body) for body in bodies])
+    fast_best, fast_median = _time(lambda: [_json.loads(body) for body in bodies])
+    typer.echo(f"{'':<10} {'best':>10} {'median':>10}  (ms per pass over every body)")
+    typer.echo(f"{'stdlib':<10} {stdlib_best * 1e3:10.2f} {stdlib_median * 1e3:10.2f}")
+    typer.echo(f"{'_json':<10} {fast_best * 1e3:10.2f} {fast_median * 1e3:10.2f}")
+    best, median = stdlib_best / fast_best, stdlib_median / fast_median
+    typer.echo(f"speedup x{best:.2f} (best), x{median:.2f} (median)")
+
+
+if __name__ == "__main__":
+    typer.run(main)
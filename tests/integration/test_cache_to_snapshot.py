@@ -6,7 +6,12 @@ JSON blobs) preserves enough shape that the metrics pipeline produces correct Ro
 
 from datetime import UTC, datetime
 
-from git_dev_metrics.cache import insert_prs, load_all_repos_for_range, seal_month
+from git_dev_metrics.cache import (
+    insert_prs,
+    load_all_repos_for_range,
+    load_repo_aggregates_for_range,
+    seal_month,
+)
 from git_dev_metrics.metrics.snapshot import MetricsSnapshot
 from git_dev_metrics.utils.date_utils import month_range
 
@@ -49,22 +54,26 @@ def _review(login: str, day: int) -> dict:
     }
 
 
+def _seed(db_path) -> None:
+    prs_repo1 = [
+        _pr(101, "alice", 5, reviews=[_review("bob", 5)]),
+        _pr(102, "bob", 12),
+    ]
+    prs_repo2 = [
+        _pr(103, "alice", 20, additions=50, deletions=25, changed_files=3),
+    ]
+
+    insert_prs(prs_repo1, "myorg", "repo1", 2026, 4, db_path=db_path)
+    seal_month("myorg", "repo1", 2026, 4, db_path=db_path)
+    insert_prs(prs_repo2, "myorg", "repo2", 2026, 4, db_path=db_path)
+    seal_month("myorg", "repo2", 2026, 4, db_path=db_path)
+
+
 class TestCacheToSnapshotRoundTrip:
     def test_should_compute_row_values_after_cache_round_trip(self, tmp_path):
         # Arrange
         db_path = tmp_path / "cache.db"
-        prs_repo1 = [
-            _pr(101, "alice", 5, reviews=[_review("bob", 5)]),
-            _pr(102, "bob", 12),
-        ]
-        prs_repo2 = [
-            _pr(103, "alice", 20, additions=50, deletions=25, changed_files=3),
-        ]
-
-        insert_prs(prs_repo1, "myorg", "repo1", 2026, 4, db_path=db_path)
-        seal_month("myorg", "repo1", 2026, 4, db_path=db_path)
-        insert_prs(prs_repo2, "myorg", "repo2", 2026, 4, db_path=db_path)
-        seal_month("myorg", "repo2", 2026, 4, db_path=db_path)
+        _seed(db_path)
 
         # Act
         repo_prs = load_all_repos_for_range([(2026, 4)], db_path=db_path)
@@ -82,3 +91,24 @@ class TestCacheToSnapshotRoundTrip:
         for row in [*snapshot.devs, snapshot.team]:
             assert isinstance(row.health, int)
             assert row.band in ("good", "ok", "bad")
+
+    def test_should_build_same_snapshot_from_cached_aggregates(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        _seed(db_path)
+        period = month_range(2026, 4)
+
+        # Act
+        from_prs = MetricsSnapshot.from_repo_prs(
+            load_all_repos_for_range([(2026, 4)], db_path=db_path), period
+        )
+        from_aggregates = MetricsSnapshot.from_aggregates(
+            load_repo_aggregates_for_range([(2026, 4)], db_path=db_path), period
+        )
+
+        # Assert
+        assert {r.name: r for r in from_aggregates.devs} == {r.name: r for r in from_prs.devs}
+        assert set(from_aggregates.repos) == set(from_prs.repos)
+        assert from_aggregates.team == from_prs.team
+        assert from_aggregates.summary == from_prs.summary
+        assert from_aggregates.reviewer_counts == from_prs.reviewer_counts
@@ -62,7 +62,8 @@ class TestPullEndToEnd:
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
         mocker.patch(
-            "git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=mapped
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics",
+            return_value=[{"prs": mapped, "query": "q", "cursor": None}],
         )
 
         # Act
@@ -103,7 +104,8 @@ class TestPullEndToEnd:
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
         mocker.patch(
-            "git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=mapped
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics",
+            return_value=[{"prs": mapped, "query": "q", "cursor": None}],
         )
         mocker.patch("git_dev_metrics.cli._browser.webbrowser.open", return_value=False)
         dashboard_out = tmp_path / "r.html"
@@ -173,7 +175,8 @@ class TestPullEndToEnd:
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
         mocker.patch(
-            "git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=mapped
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics",
+            return_value=[{"prs": mapped, "query": "q", "cursor": None}],
         )
 
         # Act
@@ -1,4 +1,5 @@
 import json
+import sqlite3
 
 from git_dev_metrics.cache import (
     count_prs,
@@ -6,11 +7,17 @@ from git_dev_metrics.cache import (
     delete_target,
     get_all_dev_logins,
     get_nicknames,
+    get_synced_profile,
     get_targets,
+    has_pr_files,
     insert_prs,
     is_sealed,
+    load_pr_files,
+    load_prs,
+    mark_partial,
     open_connection,
     query_prs,
+    replace_pr_files,
     seal_month,
     set_nickname,
     set_target,
@@ -88,6 +95,20 @@ class TestInsertPrs:
         assert rows[0]["title"] == "second"
         assert rows[0]["additions"] == 99
 
+    def test_should_replace_reviews_on_reinsert(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        pr = any_pr(number=7, reviews=[approved_review(login="bob")])
+
+        # Act
+        insert_prs([pr], "myorg", "myrepo", 2026, 4, db_path=db_path)
+        insert_prs([pr], "myorg", "myrepo", 2026, 4, db_path=db_path)
+
+        # Assert
+        conn = open_connection(db_path)
+        review_rows = conn.execute("SELECT * FROM reviews WHERE pr_number = ?", (7,)).fetchall()
+        assert [r["user_login"] for r in review_rows] == ["bob"]
+
     def test_should_persist_multiple_reviews_per_pr(self, tmp_path):
         # Arrange
         db_path = tmp_path / "cache.db"
@@ -122,6 +143,67 @@ class TestSealing:
         assert is_sealed("myorg", "myrepo", 2026, 4, db_path=db_path) is True
         assert is_sealed("myorg", "myrepo", 2026, 5, db_path=db_path) is False
 
+    def test_should_add_profile_column_to_existing_database(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE synced_months (year INTEGER, month INTEGER, repo_org TEXT, "
+            "repo_name TEXT, synced_at TEXT, partial INTEGER, "
+            "PRIMARY KEY (year, month, repo_org, repo_name))"
+        )
+        conn.execute("INSERT INTO synced_months VALUES (2026, 4, 'o', 'r', '2026-05-01', 0)")
+        conn.commit()
+        conn.close()
+
+        result = get_synced_profile("o", "r", 2026, 4, db_path=db_path)
+
+        assert result == "full"
+
+    def test_should_migrate_iso_timestamps_to_epoch_seconds(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            "CREATE TABLE prs (repo_org TEXT, repo_name TEXT, year INTEGER, month INTEGER, "
+            "number INTEGER, state TEXT, title TEXT, author_login TEXT, created_at TEXT, "
+            "merged_at TEXT, closed_at TEXT, additions INTEGER, deletions INTEGER, "
+            "changed_files INTEGER, first_commit_at TEXT, ready_for_review_at TEXT, body TEXT, "
+            "commit_messages_json TEXT, PRIMARY KEY (repo_org, repo_name, year, month, number));"
+            "CREATE TABLE reviews (pr_number INTEGER, repo_org TEXT, repo_name TEXT, "
+            "year INTEGER, month INTEGER, user_login TEXT, state TEXT, submitted_at TEXT);"
+            "INSERT INTO prs (repo_org, repo_name, year, month, number, author_login, "
+            "created_at, merged_at) VALUES ('o', 'r', 2026, 4, 1, 'alice', "
+            "'2026-04-05T08:00:00+00:00', '2026-04-05T18:30:00+00:00');"
+            "INSERT INTO reviews VALUES (1, 'o', 'r', 2026, 4, 'bob', 'APPROVED', "
+            "'2026-04-05T10:00:00+00:00');"
+        )
+        conn.commit()
+        conn.close()
+
+        # Act
+        [pr] = load_prs("o", "r", 2026, 4, db_path=db_path)
+
+        # Assert
+        assert pr["created_at"] == dt(year=2026, month=4, day=5, hour=8, minute=0)
+        assert pr["merged_at"] == dt(year=2026, month=4, day=5, hour=18, minute=30)
+        assert pr["closed_at"] is None
+        assert pr["reviews"][0]["submitted_at"] == dt(year=2026, month=4, day=5, hour=10)
+        conn = open_connection(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        row = conn.execute("SELECT typeof(created_at) AS kind FROM prs").fetchone()
+        assert row["kind"] == "integer"
+        indexes = {r["name"] for r in conn.execute("PRAGMA index_list(reviews)")}
+        assert "idx_reviews_scope" in indexes
+
+    def test_should_store_timestamps_as_epoch_seconds(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        created = dt(year=2026, month=4, day=5, hour=8, minute=0)
+        insert_prs([any_pr(number=1, created_at=created)], "o", "r", 2026, 4, db_path=db_path)
+
+        rows = query_prs("o", "r", 2026, 4, db_path=db_path)
+
+        assert rows[0]["created_at"] == int(created.timestamp())
+
     def test_should_count_prs_for_scope(self, tmp_path):
         db_path = tmp_path / "cache.db"
         insert_prs(
@@ -138,6 +220,54 @@ class TestSealing:
         assert result == 2
 
 
+def _file_pr(number: int, login: str, *paths: str) -> dict:
+    return {
+        "number": number,
+        "user": {"login": login},
+        "files": [{"path": p, "additions": 3, "deletions": 1} for p in paths],
+    }
+
+
+class TestPrFiles:
+    def test_should_round_trip_file_level_prs(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        seal_month("myorg", "myrepo", 2026, 4, db_path=db_path)
+
+        replace_pr_files(
+            [_file_pr(1, "alice", "a.py", "b.ts"), _file_pr(2, "bob", "c.go")],
+            "myorg",
+            "myrepo",
+            2026,
+            4,
+            db_path=db_path,
+        )
+
+        result = load_pr_files("myorg", "myrepo", 2026, 4, db_path=db_path)
+        assert result == [
+            _file_pr(1, "alice", "a.py", "b.ts"),
+            _file_pr(2, "bob", "c.go"),
+        ]
+        assert has_pr_files("myorg", "myrepo", 2026, 4, db_path=db_path) is True
+
+    def test_should_replace_previous_files_for_month(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        replace_pr_files([_file_pr(1, "alice", "old.py")], "o", "r", 2026, 4, db_path=db_path)
+
+        replace_pr_files([_file_pr(1, "alice", "new.py")], "o", "r", 2026, 4, db_path=db_path)
+
+        result = load_pr_files("o", "r", 2026, 4, db_path=db_path)
+        assert [f["path"] for f in result[0]["files"]] == ["new.py"]
+
+    def test_should_treat_files_as_stale_after_a_later_pull(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        seal_month("o", "r", 2026, 4, db_path=db_path)
+        replace_pr_files([_file_pr(1, "alice", "a.py")], "o", "r", 2026, 4, db_path=db_path)
+
+        mark_partial("o", "r", 2026, 4, db_path=db_path)
+
+        assert has_pr_files("o", "r", 2026, 4, db_path=db_path) is False
+
+
 class TestNicknameDb:
     def test_should_return_empty_dict_when_no_nicknames(self, tmp_path):
         db_path = tmp_path / "cache.db"
@@ -1,4 +1,14 @@
-from git_dev_metrics.cache import insert_prs, load_prs
+from git_dev_metrics.cache import (
+    insert_prs,
+    load_aggregates_by_month,
+    load_all_repos_by_month,
+    load_all_repos_for_range,
+    load_prs,
+    load_repo_aggregates_for_range,
+    open_connection,
+    seal_month,
+)
+from git_dev_metrics.pr_metrics import METRICS_VERSION, aggregate_prs
 
 from ..conftest import any_pr, approved_review, dt
 
@@ -56,3 +66,145 @@ class TestLoadPrs:
 
         assert len(loaded) == 1
         assert [r["user"]["login"] for r in loaded[0]["reviews"]] == ["bob"]
+
+
+def _seed_range(db_path) -> None:
+    for repo in ("api", "web"):
+        for month in (3, 4):
+            prs = [
+                any_pr(
+                    id=month * 10 + n,
+                    number=n,
+                    reviews=[approved_review(login=f"{repo}-{month}-{n}")],
+                )
+                for n in (1, 2)
+            ]
+            insert_prs(prs, "myorg", repo, 2026, month, db_path=db_path)
+            seal_month("myorg", repo, 2026, month, db_path=db_path)
+    unsealed = [any_pr(id=500, number=1, reviews=[approved_review(login="ghost")])]
+    insert_prs(unsealed, "myorg", "draft", 2026, 4, db_path=db_path)
+
+
+class TestRangeLoader:
+    def test_should_match_per_month_loads(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+
+        by_repo = load_all_repos_for_range([(2026, 3), (2026, 4)], db_path=db_path)
+
+        assert set(by_repo) == {"myorg/api", "myorg/web"}
+        for repo in ("api", "web"):
+            expected = load_prs("myorg", repo, 2026, 4, db_path=db_path) + load_prs(
+                "myorg", repo, 2026, 3, db_path=db_path
+            )
+            assert by_repo[f"myorg/{repo}"] == expected
+
+    def test_should_attach_reviews_to_their_own_repo_and_month(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+
+        by_month = load_all_repos_by_month([(2026, 4), (2026, 5)], db_path=db_path)
+
+        assert by_month[(2026, 5)] == []
+        logins = [[r["user"]["login"] for r in pr["reviews"]] for pr in by_month[(2026, 4)]]
+        assert logins == [["api-4-1"], ["api-4-2"], ["web-4-1"], ["web-4-2"]]
+
+    def test_should_load_whole_range_in_two_queries(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+        conn = open_connection(db_path)
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            load_all_repos_for_range([(2026, 3), (2026, 4)], db_path=db_path)
+        finally:
+            conn.set_trace_callback(None)
+
+        assert len(statements) == 2
+
+
+class TestDevMonthAggregates:
+    def test_should_match_aggregating_the_loaded_prs(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+        months = [(2026, 3), (2026, 4)]
+
+        by_repo = load_repo_aggregates_for_range(months, db_path=db_path)
+
+        expected = load_all_repos_for_range(months, db_path=db_path)
+        assert by_repo == {name: aggregate_prs(prs) for name, prs in expected.items()}
+
+    def test_should_merge_repos_per_month(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+
+        by_month = load_aggregates_by_month([(2026, 4), (2026, 5)], db_path=db_path)
+
+        assert by_month[(2026, 5)] == {}
+        april = by_month[(2026, 4)]
+        assert sum(agg["pr_count"] for agg in april.values()) == 4
+        assert april["web-4-1"]["reviews_given"] == 1
+
+    def test_should_answer_built_months_without_reading_prs(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+        load_repo_aggregates_for_range([(2026, 3), (2026, 4)], db_path=db_path)
+        conn = open_connection(db_path)
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            load_repo_aggregates_for_range([(2026, 3), (2026, 4)], db_path=db_path)
+        finally:
+            conn.set_trace_callback(None)
+
+        assert not [sql for sql in statements if "prs" in sql.split() or "reviews" in sql.split()]
+
+    def test_should_rebuild_month_after_new_prs_are_stored(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        _seed_range(db_path)
+        load_repo_aggregates_for_range([(2026, 4)], db_path=db_path)
+
+        insert_prs([any_pr(number=9, user={"login": "dave"})], "myorg", "api", 2026, 4, db_path)
+        by_repo = load_repo_aggregates_for_range([(2026, 4)], db_path=db_path)
+
+        assert by_repo["myorg/api"]["dave"]["pr_count"] == 1
+
+
+class TestStoredMetrics:
+    def _approved_pr(self):
+        return any_pr(
+            number=1,
+            created_at=dt(year=2026, month=4, day=1, hour=8),
+            merged_at=dt(year=2026, month=4, day=1, hour=20),
+            reviews=[approved_review(submitted_at=dt(year=2026, month=4, day=1, hour=11))],
+        )
+
+    def test_should_persist_derived_metrics_on_insert(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        insert_prs([self._approved_pr()], "o", "r", 2026, 4, db_path=db_path)
+
+        [pr] = load_prs("o", "r", 2026, 4, db_path=db_path)
+
+        metrics = pr.get("metrics")
+        assert metrics is not None
+        assert metrics["cycle_hours"] == 12.0
+        assert metrics["pickup_hours"] == 3.0
+        assert metrics["first_approval_at"] == dt(year=2026, month=4, day=1, hour=11)
+        assert metrics["size"] == 150
+
+    def test_should_recompute_and_store_metrics_of_older_version(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        insert_prs([self._approved_pr()], "o", "r", 2026, 4, db_path=db_path)
+        conn = open_connection(db_path)
+        with conn:
+            conn.execute("UPDATE prs SET cycle_hours = 99, metrics_version = 0")
+
+        [pr] = load_prs("o", "r", 2026, 4, db_path=db_path)
+
+        assert "metrics" not in pr
+        row = conn.execute("SELECT cycle_hours, metrics_version FROM prs").fetchone()
+        assert (row["cycle_hours"], row["metrics_version"]) == (12.0, METRICS_VERSION)
+        [reloaded] = load_prs("o", "r", 2026, 4, db_path=db_path)
+        reloaded_metrics = reloaded.get("metrics")
+        assert reloaded_metrics is not None
+        assert reloaded_metrics["cycle_hours"] == 12.0
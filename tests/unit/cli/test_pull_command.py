@@ -1,10 +1,10 @@
 from freezegun import freeze_time
 from typer.testing import CliRunner
 
-from git_dev_metrics.cache import count_prs, seal_month
+from git_dev_metrics.cache import count_prs, is_sealed, seal_month
 from git_dev_metrics.cli import app
 
-from ..conftest import any_pr, approved_review, dt
+from ..conftest import any_pr, approved_review, dt, pr_page
 
 runner = CliRunner()
 
@@ -33,7 +33,9 @@ class TestPull:
         mocker.patch(
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
-        mocker.patch("git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=prs)
+        mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics", return_value=[pr_page(prs)]
+        )
 
         result = runner.invoke(
             app,
@@ -66,7 +68,9 @@ class TestPull:
         mocker.patch(
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
-        mocker.patch("git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=prs)
+        mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics", return_value=[pr_page(prs)]
+        )
 
         result = runner.invoke(
             app,
@@ -91,6 +95,28 @@ class TestPull:
         assert is_partial("myorg", "myrepo", 2026, 5, db_path=db_path)
         assert not is_sealed("myorg", "myrepo", 2026, 5, db_path=db_path)
 
+    @freeze_time("2026-05-12 09:00:00")
+    def test_should_refresh_partial_month_since_last_sync(self, tmp_path, mocker):
+        db_path = tmp_path / "cache.db"
+        mocker.patch(
+            "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
+        )
+        fetch = mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics",
+            side_effect=lambda *_a, **_kw: [pr_page(_ten_prs_for_april())],
+        )
+        args = ["pull", "--month", "2026-05", "--org", "myorg", "--repo", "myrepo"]
+
+        runner.invoke(app, [*args, "--db", str(db_path)])
+        result = runner.invoke(app, [*args, "--db", str(db_path)])
+
+        assert result.exit_code == 0
+        assert "(refreshed)" in result.output
+        assert fetch.call_args_list[0].kwargs["updated_since"] is None
+        assert fetch.call_args_list[1].kwargs["updated_since"] == dt(
+            year=2026, month=5, day=12, hour=8, minute=50
+        )
+
     def test_should_invoke_wizard_when_no_flags(self, tmp_path, mocker):
         db_path = tmp_path / "cache.db"
         wizard = mocker.patch("git_dev_metrics.cli.commands.pull.pull_wizard")
@@ -98,7 +124,40 @@ class TestPull:
         result = runner.invoke(app, ["pull", "--db", str(db_path)])
 
         assert result.exit_code == 0, result.output
-        wizard.assert_called_once_with(db_path=db_path, re_pull=False)
+        wizard.assert_called_once_with(
+            db_path=db_path, re_pull=False, jobs=4, org_wide=False, profile="full"
+        )
+
+    def test_should_pass_jobs_to_wizard(self, tmp_path, mocker):
+        db_path = tmp_path / "cache.db"
+        wizard = mocker.patch("git_dev_metrics.cli.commands.pull.pull_wizard")
+
+        result = runner.invoke(app, ["pull", "--jobs", "8", "--db", str(db_path)])
+
+        assert result.exit_code == 0, result.output
+        wizard.assert_called_once_with(
+            db_path=db_path, re_pull=False, jobs=8, org_wide=False, profile="full"
+        )
+
+    def test_should_turn_on_hedging_with_flag(self, tmp_path, mocker):
+        mocker.patch("git_dev_metrics.cli.commands.pull.pull_wizard")
+        set_hedging = mocker.patch("git_dev_metrics.cli.commands.pull.set_hedging")
+
+        result = runner.invoke(app, ["pull", "--hedge", "--db", str(tmp_path / "cache.db")])
+
+        assert result.exit_code == 0, result.output
+        set_hedging.assert_called_once_with(True)
+
+    def test_should_keep_response_cache_next_to_db(self, tmp_path, mocker):
+        mocker.patch("git_dev_metrics.cli.commands.pull.pull_wizard")
+        set_response_cache = mocker.patch("git_dev_metrics.cli.commands.pull.set_response_cache")
+
+        result = runner.invoke(
+            app, ["pull", "--response-cache", "--db", str(tmp_path / "cache.db")]
+        )
+
+        assert result.exit_code == 0, result.output
+        set_response_cache.assert_called_once_with(tmp_path / "responses.db")
 
     @freeze_time("2026-05-12")
     def test_should_refuse_already_sealed_month(self, tmp_path, mocker):
@@ -108,7 +167,7 @@ class TestPull:
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
         fetch = mocker.patch(
-            "git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=[]
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics", return_value=[]
         )
 
         result = runner.invoke(
@@ -139,7 +198,9 @@ class TestPull:
             "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
         )
         prs = _ten_prs_for_april()
-        mocker.patch("git_dev_metrics.cli.runners.pull_runner.fetch_repo_metrics", return_value=prs)
+        mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics", return_value=[pr_page(prs)]
+        )
 
         result = runner.invoke(
             app,
@@ -163,3 +224,81 @@ class TestPull:
         from git_dev_metrics.cache import is_sealed
 
         assert is_sealed("myorg", "myrepo", 2026, 4, db_path=db_path)
+
+
+class TestPullRange:
+    @freeze_time("2026-05-12")
+    def test_should_bucket_one_search_into_months_and_seal_each(self, tmp_path, mocker):
+        db_path = tmp_path / "cache.db"
+        seal_month("myorg", "myrepo", 2026, 3, db_path=db_path)
+        mocker.patch(
+            "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
+        )
+        march_pr = any_pr(number=1, merged_at=dt(year=2026, month=3, day=9))
+        feb_pr = any_pr(number=2, merged_at=dt(year=2026, month=2, day=3))
+        fetch = mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_repo_metrics",
+            return_value=[pr_page([feb_pr, march_pr]), pr_page(_ten_prs_for_april())],
+        )
+
+        result = runner.invoke(
+            app,
+            ["pull", "--from", "2026-02", "--to", "2026-04", "--org", "myorg", "--repo", "myrepo"]
+            + ["--db", str(db_path)],
+        )
+
+        assert result.exit_code == 0
+        assert "Skipped 2026-03: already sealed." in result.output
+        assert "Pulled 1 PRs for myorg/myrepo 2026-02." in result.output
+        assert "Pulled 10 PRs for myorg/myrepo 2026-04." in result.output
+        assert fetch.call_count == 1
+        period = fetch.call_args.args[3]
+        assert (period.since, period.until) == (
+            dt(year=2026, month=2, day=1),
+            dt(year=2026, month=5, day=1),
+        )
+        assert count_prs("myorg", "myrepo", 2026, 3, db_path=db_path) == 0
+        assert is_sealed("myorg", "myrepo", 2026, 2, db_path=db_path)
+        assert is_sealed("myorg", "myrepo", 2026, 4, db_path=db_path)
+
+    def test_should_reject_range_mixed_with_month(self, tmp_path):
+        result = runner.invoke(
+            app,
+            ["pull", "--month", "2026-04", "--from", "2026-01", "--to", "2026-02"]
+            + ["--org", "o", "--repo", "r", "--db", str(tmp_path / "cache.db")],
+        )
+
+        assert result.exit_code == 1
+
+
+class TestPullOrgWide:
+    @freeze_time("2026-05-12")
+    def test_should_split_one_org_search_into_repo_rows(self, tmp_path, mocker):
+        db_path = tmp_path / "cache.db"
+        mocker.patch(
+            "git_dev_metrics.cli.commands.pull.get_github_token", return_value="fake-token"
+        )
+        april = _ten_prs_for_april()
+        fetch = mocker.patch(
+            "git_dev_metrics.cli.runners.pull_runner.iter_org_metrics",
+            return_value=[
+                {
+                    "prs_by_repo": {"myorg/big": april[:9], "myorg/quiet": april[9:]},
+                    "query": "org:myorg is:pr",
+                    "cursor": None,
+                }
+            ],
+        )
+
+        result = runner.invoke(
+            app,
+            ["pull", "--month", "2026-04", "--org", "myorg", "--org-wide"] + ["--db", str(db_path)],
+        )
+
+        assert result.exit_code == 0
+        assert "Done. Pulled 10 PRs across 2 repos." in result.output
+        assert fetch.call_count == 1
+        assert count_prs("myorg", "big", 2026, 4, db_path=db_path) == 9
+        assert count_prs("myorg", "quiet", 2026, 4, db_path=db_path) == 1
+        assert is_sealed("myorg", "big", 2026, 4, db_path=db_path)
+        assert is_sealed("myorg", "quiet", 2026, 4, db_path=db_path)
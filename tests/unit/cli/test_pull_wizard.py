@@ -1,14 +1,41 @@
+from collections.abc import Iterator
 from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 import typer
 
-from git_dev_metrics.cache import count_prs, is_sealed, seal_month
+from git_dev_metrics.cache import (
+    count_prs,
+    get_page_size,
+    get_synced_profile,
+    has_pr_files,
+    is_sealed,
+    load_checkpoints,
+    load_pr_files,
+    open_connection,
+    seal_month,
+)
+from git_dev_metrics.cli.runners.pull_runner import (
+    RepoPullResult,
+    fetch_and_seal_month,
+    is_sealed_for,
+    pull_month_range,
+    pull_org_month,
+    pull_repos_concurrently,
+)
 from git_dev_metrics.cli.wizards.pull_wizard import pull_wizard
-from git_dev_metrics.models import Repository
+from git_dev_metrics.github import (
+    GitHubAPIError,
+    GitHubAuthError,
+    GitHubRateLimitError,
+    TokenPool,
+)
+from git_dev_metrics.models import OrgPullRequestPage, PullRequestPage, Repository
+from git_dev_metrics.pr_metrics import METRICS_VERSION
+from git_dev_metrics.utils.date_utils import month_range
 
-from ..conftest import any_pr, approved_review, dt
+from ..conftest import any_pr, approved_review, dt, pr_page
 
 
 def _three_prs(prefix: int) -> list:
@@ -46,7 +73,11 @@ class TestPullWizardMultiRepo:
             captured_options.append(dict(opts))
             return ["myorg/repoA", "myorg/repoB"]
 
-        fetch = Mock(side_effect=lambda _t, _o, _r, _p: _three_prs(100))
+        fetch = Mock(
+            side_effect=lambda _t, _o, _r, _p, resume, updated_since, page_size: [
+                pr_page(_three_prs(100))
+            ]
+        )
 
         # Act
         pull_wizard(
@@ -85,7 +116,7 @@ class TestPullWizardSkipsSealedInBatch:
             _repo("myorg/repoA", private=False, pushed=dt(year=2026, month=4, day=20)),
             _repo("myorg/repoB", private=False, pushed=dt(year=2026, month=4, day=20)),
         ]
-        fetch = Mock(return_value=_three_prs(200))
+        fetch = Mock(return_value=[pr_page(_three_prs(200))])
 
         # Act
         pull_wizard(
@@ -119,7 +150,7 @@ class TestPullWizardRePull:
             _repo("myorg/repoA", private=False, pushed=dt(year=2026, month=4, day=20)),
             _repo("myorg/repoB", private=False, pushed=dt(year=2026, month=4, day=20)),
         ]
-        fetch = Mock(return_value=_three_prs(200))
+        fetch = Mock(return_value=[pr_page(_three_prs(200))])
 
         pull_wizard(
             db_path=db_path,
@@ -141,6 +172,46 @@ class TestPullWizardRePull:
         assert fetch.call_count == 2
 
 
+class TestPullWizardConcurrent:
+    def test_should_pull_repos_in_parallel_and_report_failures(self, tmp_path, mocker, capsys):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        mocker.patch("git_dev_metrics.cli.wizards.pull_wizard.load_last_org", return_value=None)
+        mocker.patch("git_dev_metrics.cli.wizards.pull_wizard.save_last_org")
+        names = ["repoA", "repoB", "repoC"]
+        repos = [
+            _repo(f"myorg/{name}", private=False, pushed=dt(year=2026, month=4, day=20))
+            for name in names
+        ]
+
+        def fetch(_token, _org, repo, _period, resume, updated_since, page_size):
+            if repo == "repoB":
+                raise GitHubAPIError("GitHub API error: 502")
+            return [pr_page(_three_prs(300))]
+
+        # Act
+        pull_wizard(
+            db_path=db_path,
+            ask_org=lambda _last: "myorg",
+            ask_month=lambda _choices: "2026-04",
+            ask_repos=lambda _opts: [f"myorg/{name}" for name in names],
+            clock=lambda: dt(year=2026, month=5, day=12),
+            fetch=fetch,
+            fetch_repos=lambda _token, _org: repos,
+            get_token=lambda: "fake",
+            jobs=3,
+        )
+
+        # Assert
+        captured = capsys.readouterr()
+        assert "Failed myorg/repoB: GitHub API error: 502" in captured.err
+        assert "Done. Pulled 2, skipped 0, failed 1." in captured.out
+        assert is_sealed("myorg", "repoA", 2026, 4, db_path=db_path)
+        assert not is_sealed("myorg", "repoB", 2026, 4, db_path=db_path)
+        assert is_sealed("myorg", "repoC", 2026, 4, db_path=db_path)
+        assert count_prs("myorg", "repoC", 2026, 4, db_path=db_path) == 3
+
+
 class TestPullWizardNoActiveRepos:
     def test_should_exit_when_no_active_repos_in_month(self, tmp_path, mocker, capsys):
         # Arrange
@@ -198,3 +269,340 @@ class TestPullWizardMonthChoices:
         assert values[:4] == ["2026-05", "2026-04", "2026-03", "2026-02"]
         assert labels[0] == "May 2026 (current)"
         assert len(values) == 12
+
+
+class TestPullRunnerStreaming:
+    def test_should_write_each_page_before_the_next_is_fetched(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        seen_in_db: list[int] = []
+
+        def fetch(_token, org, repo, _period, resume, updated_since, page_size):
+            yield pr_page(_three_prs(400))
+            seen_in_db.append(count_prs(org, repo, 2026, 4, db_path=db_path))
+            yield pr_page(_three_prs(500))
+
+        # Act
+        count = fetch_and_seal_month(
+            "myorg", "repoA", 2026, 4, month_range(2026, 4), "fake", db_path, fetch=fetch
+        )
+
+        # Assert
+        assert seen_in_db == [3]
+        assert count == 6
+        assert is_sealed("myorg", "repoA", 2026, 4, db_path=db_path)
+
+    def test_should_build_dev_aggregates_when_sealing(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+
+        def fetch(_token, _org, _repo, _period, resume, updated_since, page_size):
+            yield pr_page(_three_prs(400))
+
+        # Act
+        fetch_and_seal_month(
+            "myorg", "repoA", 2026, 4, month_range(2026, 4), "fake", db_path, fetch=fetch
+        )
+
+        # Assert
+        conn = open_connection(db_path)
+        (version,) = conn.execute("SELECT agg_version FROM synced_months").fetchone()
+        (prs,) = conn.execute("SELECT SUM(pr_count) FROM dev_month_agg").fetchone()
+        assert (version, prs) == (METRICS_VERSION, 3)
+
+    def test_should_count_every_streamed_page(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+
+        def fetch(_token, _org, _repo, _period, resume, updated_since, page_size):
+            yield pr_page(_three_prs(400))
+            yield pr_page(_three_prs(500))
+
+        # Act
+        results = pull_repos_concurrently(
+            ["myorg/repoA"], 2026, 4, month_range(2026, 4), "fake", db_path, fetch=fetch, jobs=2
+        )
+
+        # Assert
+        assert results == [RepoPullResult("myorg/repoA", count=6)]
+        assert count_prs("myorg", "repoA", 2026, 4, db_path=db_path) == 6
+
+    def test_should_keep_pages_but_not_seal_when_stream_fails(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+
+        def fetch(_token, _org, _repo, _period, resume, updated_since, page_size):
+            yield pr_page(_three_prs(600))
+            raise GitHubAPIError("GitHub API error: 502")
+
+        # Act
+        results = pull_repos_concurrently(
+            ["myorg/repoA"], 2026, 4, month_range(2026, 4), "fake", db_path, fetch=fetch, jobs=2
+        )
+
+        # Assert
+        assert results[0].error == "GitHub API error: 502"
+        assert count_prs("myorg", "repoA", 2026, 4, db_path=db_path) == 3
+        assert not is_sealed("myorg", "repoA", 2026, 4, db_path=db_path)
+
+
+class TestPullTokenPool:
+    def test_should_resume_on_next_token_when_one_is_exhausted(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        calls: list[tuple[str, dict]] = []
+
+        def fetch(token, _org, _repo, _period, resume, updated_since, page_size):
+            calls.append((token, dict(resume)))
+            if token == "token-a":
+                yield pr_page(_three_prs(700), cursor="c1")
+                raise GitHubRateLimitError("Rate limit exceeded")
+            yield pr_page(_three_prs(800))
+
+        # Act
+        results = pull_repos_concurrently(
+            ["myorg/repoA"],
+            2026,
+            4,
+            month_range(2026, 4),
+            TokenPool(["token-a", "token-b"]),
+            db_path,
+            fetch=fetch,
+        )
+
+        # Assert
+        assert results == [RepoPullResult("myorg/repoA", count=6)]
+        assert calls == [("token-a", {}), ("token-b", {"repo:o/r is:pr": "c1"})]
+        assert is_sealed("myorg", "repoA", 2026, 4, db_path=db_path)
+
+    def test_should_fail_repo_when_no_token_is_left(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+
+        def fetch(_token, _org, _repo, _period, resume, updated_since, page_size):
+            raise GitHubAuthError("Unauthorized. Your token might be expired.")
+
+        # Act
+        results = pull_repos_concurrently(
+            ["myorg/repoA"],
+            2026,
+            4,
+            month_range(2026, 4),
+            TokenPool(["token-a", "token-b"]),
+            db_path,
+            fetch=fetch,
+        )
+
+        # Assert
+        assert results[0].error == "Unauthorized. Your token might be expired."
+
+    def test_should_print_usage_per_token_in_summary(self, tmp_path, mocker, capsys):
+        # Arrange
+        mocker.patch("git_dev_metrics.cli.wizards.pull_wizard.load_last_org", return_value=None)
+        mocker.patch("git_dev_metrics.cli.wizards.pull_wizard.save_last_org")
+        mocker.patch(
+            "git_dev_metrics.cli.wizards.pull_wizard.extra_tokens", return_value=["spare-bbbb"]
+        )
+        repos = [_repo("myorg/repoA", private=False, pushed=dt(year=2026, month=4, day=20))]
+
+        def fetch(token, _org, _repo, _period, resume, updated_since, page_size):
+            if token == "fake-aaaa":
+                raise GitHubAuthError("Unauthorized. Your token might be expired.")
+            return [pr_page(_three_prs(900))]
+
+        # Act
+        pull_wizard(
+            db_path=tmp_path / "cache.db",
+            ask_org=lambda _last: "myorg",
+            ask_month=lambda _choices: "2026-04",
+            ask_repos=lambda _opts: ["myorg/repoA"],
+            clock=lambda: dt(year=2026, month=5, day=12),
+            fetch=fetch,
+            fetch_repos=lambda _token, _org: repos,
+            get_token=lambda: "fake-aaaa",
+        )
+
+        # Assert
+        out = capsys.readouterr().out
+        assert "Pulled 3 PRs for myorg/repoA." in out
+        assert "Token …aaaa: 0 requests, 0 points. (rejected)" in out
+
+
+class TestPullCheckpoints:
+    def test_should_resume_from_last_stored_cursor_after_failure(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        period = month_range(2026, 4)
+        resumes: list[dict] = []
+
+        def failing(_token, _org, _repo, _period, resume, updated_since, page_size):
+            resumes.append(dict(resume))
+            yield pr_page(_three_prs(700), cursor="c1")
+            raise GitHubAPIError("GitHub API error: timeout")
+
+        def rest(_token, _org, _repo, _period, resume, updated_since, page_size):
+            resumes.append(dict(resume))
+            yield pr_page(_three_prs(800))
+
+        with pytest.raises(GitHubAPIError):
+            fetch_and_seal_month("myorg", "repoA", 2026, 4, period, "t", db_path, fetch=failing)
+
+        # Act
+        count = fetch_and_seal_month("myorg", "repoA", 2026, 4, period, "t", db_path, fetch=rest)
+
+        # Assert
+        assert resumes == [{}, {"repo:o/r is:pr": "c1"}]
+        assert count == 6
+        assert load_checkpoints("myorg", "repoA", 2026, 4, db_path=db_path) == ({}, 0)
+
+
+class TestPullMonthRange:
+    def test_should_resume_range_and_count_rows_of_both_runs(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        march = any_pr(
+            id=600,
+            number=600,
+            created_at=dt(year=2026, month=3, day=2, hour=8),
+            merged_at=dt(year=2026, month=3, day=2, hour=16),
+        )
+        resumes: list[dict] = []
+
+        def failing(_token, _org, _repo, _period, resume, updated_since, page_size):
+            resumes.append(dict(resume))
+            yield pr_page([march, *_three_prs(700)], cursor="c1")
+            raise GitHubAPIError("GitHub API error: timeout")
+
+        def rest(_token, _org, _repo, _period, resume, updated_since, page_size):
+            resumes.append(dict(resume))
+            yield pr_page(_three_prs(800))
+
+        months = [(2026, 3), (2026, 4)]
+        with pytest.raises(GitHubAPIError):
+            pull_month_range("myorg", "repoA", months, "t", db_path, fetch=failing)
+
+        # Act
+        counts = pull_month_range("myorg", "repoA", months, "t", db_path, fetch=rest)
+
+        # Assert
+        assert resumes == [{}, {"repo:o/r is:pr": "c1"}]
+        assert counts == {(2026, 3): 1, (2026, 4): 6}
+        assert load_checkpoints("myorg", "repoA", 2026, 3, db_path=db_path) == ({}, 0)
+
+
+class TestPullOrgMonth:
+    def test_should_seal_selected_repos_missing_from_org_search(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        page: OrgPullRequestPage = {
+            "prs_by_repo": {"myorg/repoA": _three_prs(900), "myorg/other": _three_prs(950)},
+            "query": "org:myorg is:pr",
+            "cursor": None,
+        }
+
+        # Act
+        counts = pull_org_month(
+            "myorg",
+            2026,
+            4,
+            month_range(2026, 4),
+            "fake",
+            db_path,
+            fetch=lambda *_args, **_kwargs: [page],
+            repos=["myorg/repoA", "myorg/repoB"],
+        )
+
+        # Assert
+        assert counts == {"myorg/repoA": 3, "myorg/repoB": 0}
+        assert is_sealed("myorg", "repoB", 2026, 4, db_path=db_path)
+        assert count_prs("myorg", "other", 2026, 4, db_path=db_path) == 0
+        assert not is_sealed("myorg", "other", 2026, 4, db_path=db_path)
+
+    def test_should_resume_org_search_on_next_token(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        calls: list[tuple[str, dict]] = []
+
+        def fetch(token, _org, _period, resume, page_size) -> Iterator[OrgPullRequestPage]:
+            calls.append((token, dict(resume)))
+            if token == "token-a":
+                yield {
+                    "prs_by_repo": {"myorg/repoA": _three_prs(700)},
+                    "query": "org:myorg is:pr",
+                    "cursor": "c1",
+                }
+                raise GitHubRateLimitError("Rate limit exceeded")
+            yield {
+                "prs_by_repo": {"myorg/repoA": _three_prs(800)},
+                "query": "org:myorg is:pr",
+                "cursor": None,
+            }
+
+        # Act
+        counts = pull_org_month(
+            "myorg",
+            2026,
+            4,
+            month_range(2026, 4),
+            TokenPool(["token-a", "token-b"]),
+            db_path,
+            fetch=fetch,
+        )
+
+        # Assert
+        assert counts == {"myorg/repoA": 6}
+        assert calls == [("token-a", {}), ("token-b", {"org:myorg is:pr": "c1"})]
+        assert is_sealed("myorg", "repoA", 2026, 4, db_path=db_path)
+
+
+class TestPullProfiles:
+    def test_should_store_files_and_record_profile(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        pr = any_pr(number=1, user={"login": "alice"})
+        pr["files"] = [{"path": "a.py", "additions": 4, "deletions": 0}]
+
+        def fetch(_token, _org, _repo, _period, resume, updated_since, page_size):
+            yield pr_page([pr])
+
+        # Act
+        fetch_and_seal_month(
+            "o", "r", 2026, 4, month_range(2026, 4), "fake", db_path, fetch=fetch, profile="files"
+        )
+
+        # Assert
+        assert get_synced_profile("o", "r", 2026, 4, db_path=db_path) == "files"
+        assert has_pr_files("o", "r", 2026, 4, db_path=db_path)
+        assert load_pr_files("o", "r", 2026, 4, db_path=db_path)[0]["files"] == pr["files"]
+
+    def test_should_pull_again_when_sealed_with_narrower_profile(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        seal_month("o", "r", 2026, 4, db_path=db_path, profile="timing")
+
+        assert is_sealed_for("o", "r", 2026, 4, "timing", db_path)
+        assert not is_sealed_for("o", "r", 2026, 4, "full", db_path)
+
+
+class TestPullPageSizes:
+    def test_should_start_next_pull_from_recorded_page_size(self, tmp_path):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        started_with: list[int | None] = []
+
+        def fetch(
+            _token, _org, _repo, _period, resume, updated_since, page_size
+        ) -> Iterator[PullRequestPage]:
+            started_with.append(page_size)
+            page = pr_page(_three_prs(900))
+            page["page_size"] = 40
+            yield page
+
+        # Act
+        for month in (4, 5):
+            fetch_and_seal_month(
+                "o", "r", 2026, month, month_range(2026, month), "fake", db_path, fetch=fetch
+            )
+
+        # Assert
+        assert started_with == [None, 40]
+        assert get_page_size("o", "r", db_path=db_path) == 40
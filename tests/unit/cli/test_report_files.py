@@ -0,0 +1,59 @@
+from typer.testing import CliRunner
+
+from git_dev_metrics.cache import has_pr_files, seal_month
+from git_dev_metrics.cli import app
+
+runner = CliRunner()
+
+
+def _file_prs() -> list[dict]:
+    return [
+        {
+            "number": 1,
+            "user": {"login": "alice"},
+            "files": [{"path": "src/app.py", "additions": 10, "deletions": 2}],
+        }
+    ]
+
+
+class TestReportFileCache:
+    def test_should_backfill_once_then_render_from_cache(self, tmp_path, mocker, _stub_webbrowser):
+        # Arrange
+        db_path = tmp_path / "cache.db"
+        seal_month("o", "r", 2026, 4, db_path=db_path)
+        mocker.patch("git_dev_metrics.cli.runners._pr_files.load_token", return_value="tok")
+        fetch = mocker.patch(
+            "git_dev_metrics.cli.runners._pr_files.fetch_skill_report_prs",
+            return_value=_file_prs(),
+        )
+        args = ["--from", "2026-04", "--to", "2026-04", "--db", str(db_path)]
+
+        # Act
+        skill = runner.invoke(app, ["skill-report", *args, "--output", str(tmp_path / "s.html")])
+        lang = runner.invoke(app, ["lang-report", *args, "--output", str(tmp_path / "l.html")])
+
+        # Assert
+        assert skill.exit_code == 0, skill.output
+        assert lang.exit_code == 0, lang.output
+        fetch.assert_called_once_with("tok", "o", "r", 2026, 4)
+        assert has_pr_files("o", "r", 2026, 4, db_path=db_path) is True
+        assert (tmp_path / "l.html").exists()
+
+    def test_should_not_need_a_token_when_files_are_cached(
+        self, tmp_path, mocker, _stub_webbrowser
+    ):
+        db_path = tmp_path / "cache.db"
+        seal_month("o", "r", 2026, 4, db_path=db_path)
+        mocker.patch("git_dev_metrics.cli.runners._pr_files.load_token", return_value="tok")
+        mocker.patch(
+            "git_dev_metrics.cli.runners._pr_files.fetch_skill_report_prs",
+            return_value=_file_prs(),
+        )
+        args = ["skill-report", "--from", "2026-04", "--to", "2026-04", "--db", str(db_path)]
+        runner.invoke(app, [*args, "--output", str(tmp_path / "a.html")])
+        mocker.patch("git_dev_metrics.cli.runners._pr_files.load_token", return_value=None)
+
+        result = runner.invoke(app, [*args, "--output", str(tmp_path / "b.html")])
+
+        assert result.exit_code == 0, result.output
+        assert "Skill report written" in result.output
@@ -176,3 +176,34 @@ class TestStale:
         assert "myorg/repoA" in html
         assert "myorg/ghost-repo" not in html
         assert "Skipping" in result.stderr
+
+    @freeze_time("2026-05-12")
+    def test_should_scan_concurrently_when_jobs_above_one(self, tmp_path, mocker, _stub_webbrowser):
+        db_path = tmp_path / "cache.db"
+        seal_month("myorg", "repoA", 2026, 4, db_path=db_path)
+        seal_month("myorg", "ghost-repo", 2026, 4, db_path=db_path)
+        mocker.patch(
+            "git_dev_metrics.cli.commands.stale.get_github_token", return_value="fake-token"
+        )
+        fetch_many = mocker.patch(
+            "git_dev_metrics.cli.commands.stale.fetch_open_prs_many",
+            return_value={
+                ("myorg", "ghost-repo"): GitHubNotFoundError("not found"),
+                ("myorg", "repoA"): [
+                    _open_pr(1, "alice", dt(year=2026, month=4, day=1, hour=8, minute=0))
+                ],
+            },
+        )
+        out = tmp_path / "stale.html"
+
+        result = runner.invoke(
+            app, ["stale", "--jobs", "8", "--db", str(db_path), "--output", str(out)]
+        )
+
+        assert result.exit_code == 0, result.output
+        tokens, repos, jobs = fetch_many.call_args.args
+        assert tokens.tokens == ["fake-token"]
+        assert repos == [("myorg", "ghost-repo"), ("myorg", "repoA")]
+        assert jobs == 8
+        assert "myorg/repoA" in out.read_text()
+        assert "Skipping myorg/ghost-repo" in result.stderr
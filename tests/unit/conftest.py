@@ -4,7 +4,7 @@ from typing import Any
 import freezegun
 import pytest
 
-from git_dev_metrics.models import PullRequest
+from git_dev_metrics.models import PullRequest, PullRequestPage
 
 # default ignore list contains "gi" prefix which incorrectly skips git_dev_metrics modules
 freezegun.configure(default_ignore_list=[])
@@ -53,3 +53,8 @@ def approved_review(submitted_at: datetime | None = None, login: str = "reviewer
     if submitted_at is None:
         submitted_at = _dt("2024-01-01T12:00:00Z")
     return {"user": {"login": login}, "state": "APPROVED", "submitted_at": submitted_at}
+
+
+def pr_page(prs: list[PullRequest], cursor: str | None = None) -> PullRequestPage:
+    """One streamed page of PRs, as yielded by `iter_repo_metrics`."""
+    return {"prs": prs, "query": "repo:o/r is:pr", "cursor": cursor}
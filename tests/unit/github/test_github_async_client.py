@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from git_dev_metrics.github import GitHubNotFoundError, graphql_client
+from git_dev_metrics.github.graphql_queries import REPO_METRICS_QUERY
+
+aiohttp_web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+from git_dev_metrics.github import async_graphql_client  # noqa: E402
+from git_dev_metrics.github.async_graphql_client import (  # noqa: E402
+    async_session,
+    execute_paginated_query_async,
+    gather_bounded,
+)
+
+
+def _page(numbers: list[int], cursor: str | None) -> dict:
+    return {
+        "data": {
+            "repository": {
+                "pullRequests": {
+                    "nodes": [{"number": n} for n in numbers],
+                    "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+                }
+            }
+        }
+    }
+
+
+async def _serve_and_paginate(
+    responses: list[tuple[int, dict]], stall_first: float = 0.0
+) -> tuple[list[dict], int]:
+    calls = 0
+
+    async def handler(_request):
+        nonlocal calls
+        status, body = responses[calls]
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(stall_first)
+        return aiohttp_web.json_response(body, status=status)
+
+    app = aiohttp_web.Application()
+    app.router.add_post("/graphql", handler)
+    async with (
+        test_utils.TestServer(app) as server,
+        async_session("fake-token", str(server.make_url("/graphql"))) as session,
+    ):
+        nodes = await execute_paginated_query_async(
+            session,
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 1},
+            "repository.pullRequests",
+        )
+    return nodes, calls
+
+
+class TestAsyncPagination:
+    def test_should_fetch_all_pages(self):
+        nodes, calls = asyncio.run(
+            _serve_and_paginate([(200, _page([1], "c1")), (200, _page([2], None))])
+        )
+
+        assert [n["number"] for n in nodes] == [1, 2]
+        assert calls == 2
+
+    def test_should_retry_transient_502(self, monkeypatch):
+        monkeypatch.setattr(graphql_client, "TRANSIENT_RETRY_BASE_DELAY", 0.0)
+
+        nodes, calls = asyncio.run(
+            _serve_and_paginate([(502, {"message": "Bad Gateway"}), (200, _page([1], None))])
+        )
+
+        assert [n["number"] for n in nodes] == [1]
+        assert calls == 2
+
+    def test_should_retry_read_timeout(self, monkeypatch):
+        monkeypatch.setattr(graphql_client, "TRANSIENT_RETRY_BASE_DELAY", 0.0)
+        monkeypatch.setattr(async_graphql_client, "DEFAULT_TIMEOUT", 0.2)
+
+        nodes, calls = asyncio.run(
+            _serve_and_paginate([(200, _page([9], None)), (200, _page([1], None))], stall_first=1)
+        )
+
+        assert [n["number"] for n in nodes] == [1]
+        assert calls == 2
+
+    def test_should_map_not_found_like_sync_client(self):
+        not_found = {"errors": [{"type": "NOT_FOUND", "message": "Could not resolve"}]}
+
+        with pytest.raises(GitHubNotFoundError):
+            asyncio.run(_serve_and_paginate([(200, not_found)]))
+
+
+class TestGatherBounded:
+    def test_should_cap_in_flight_coroutines_and_keep_order(self):
+        in_flight = 0
+        peak = 0
+
+        async def work(i: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if i == 3:
+                raise GitHubNotFoundError("gone")
+            return i
+
+        results = asyncio.run(gather_bounded([lambda i=i: work(i) for i in range(6)], limit=2))
+
+        assert peak == 2
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], GitHubNotFoundError)
@@ -0,0 +1,70 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from git_dev_metrics.github.graphql_client import close_clients, connection_stats, get_client
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    close_clients()
+    yield
+    close_clients()
+
+
+class TestClientRegistry:
+    def test_should_share_one_client_per_token(self):
+        assert get_client("token-a") is get_client("token-a")
+        assert get_client("token-a") is not get_client("token-b")
+
+    def test_should_build_new_client_after_close(self):
+        first = get_client("token-a")
+
+        close_clients()
+
+        assert get_client("token-a") is not first
+
+
+class TestConnectionStats:
+    def test_should_reuse_keep_alive_connection_across_requests(self, local_server):
+        session = get_client("token-a").transport.session  # type: ignore[attr-defined]
+
+        for _ in range(3):
+            session.get(local_server, timeout=5)
+
+        stats = connection_stats()
+        assert stats.opened == 1
+        assert stats.requests == 3
+        assert stats.reused == 2
+
+    def test_should_report_nothing_without_clients(self):
+        stats = connection_stats()
+
+        assert stats.opened == 0
+        assert stats.reused == 0
@@ -1,9 +1,11 @@
+import json
 import re
+from typing import cast
 
 import pytest
 import responses
 
-from git_dev_metrics.github import GitHubAPIError, fetch_repositories
+from git_dev_metrics.github import GitHubAPIError, fetch_repositories, queries
 from git_dev_metrics.github.queries import fetch_pull_requests, fetch_reviews
 from git_dev_metrics.utils import TimePeriod
 
@@ -125,12 +127,7 @@ class TestFetchReviews:
             re.compile(r"https://api\.github\.com/graphql"),
             json={
                 "data": {
-                    "repository": {
-                        "pullRequests": {
-                            "nodes": [pr_with_reviews],
-                            "pageInfo": {"hasNextPage": False, "endCursor": "cursor1"},
-                        }
-                    }
+                    "repository": {"pr1": pr_with_reviews},
                 }
             },
             status=200,
@@ -141,7 +138,6 @@ class TestFetchReviews:
             "facebook",
             "react",
             [1],
-            TimePeriod(since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)),
         )
 
         assert len(result) == 1
@@ -161,12 +157,7 @@ class TestFetchReviews:
             re.compile(r"https://api\.github\.com/graphql"),
             json={
                 "data": {
-                    "repository": {
-                        "pullRequests": {
-                            "nodes": [pr_no_reviews],
-                            "pageInfo": {"hasNextPage": False, "endCursor": "cursor1"},
-                        }
-                    }
+                    "repository": {"pr1": pr_no_reviews},
                 }
             },
             status=200,
@@ -177,7 +168,6 @@ class TestFetchReviews:
             "facebook",
             "react",
             [1],
-            TimePeriod(since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)),
         )
 
         assert 1 in result
@@ -190,7 +180,74 @@ class TestFetchReviews:
             "facebook",
             "react",
             [],
-            TimePeriod(since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)),
         )
 
         assert result == {}
+
+    @responses.activate
+    def test_should_page_reviews_past_the_inline_limit(self):
+        def review(login: str) -> dict:
+            return {"author": {"login": login}, "state": "COMMENTED", "submittedAt": None}
+
+        url = re.compile(r"https://api\.github\.com/graphql")
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "data": {
+                    "repository": {
+                        "pr1": {
+                            "id": "PR_1",
+                            "number": 1,
+                            "reviews": {
+                                "nodes": [review("first")],
+                                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                            },
+                        }
+                    }
+                }
+            },
+        )
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "data": {
+                    "o0": {
+                        "reviews": {
+                            "nodes": [review("second")],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                }
+            },
+        )
+
+        result = fetch_reviews("fake-token", "facebook", "react", [1])
+
+        nested = json.loads(cast(bytes, responses.calls[1].request.body))["variables"]
+        assert nested == {"id0": "PR_1", "c0": "c1"}
+        assert [r["user"]["login"] for r in result[1]] == ["first", "second"]
+
+    @responses.activate
+    def test_should_look_up_only_requested_prs_in_batches(self, monkeypatch):
+        monkeypatch.setattr(queries, "REVIEW_BATCH_SIZE", 2)
+        responses.add(
+            responses.POST,
+            re.compile(r"https://api\.github\.com/graphql"),
+            json={"data": {"repository": {"pr7": {"number": 7, "reviews": {"nodes": []}}}}},
+            status=200,
+        )
+
+        result = fetch_reviews(
+            "fake-token",
+            "facebook",
+            "react",
+            [7, 8, 9],
+        )
+
+        sent = [json.loads(cast(bytes, call.request.body))["query"] for call in responses.calls]
+        assert len(sent) == 2
+        assert "pr7: pullRequest(number: 7)" in sent[0]
+        assert "pr9: pullRequest(number: 9)" in sent[1]
+        assert result == {7: [], 8: [], 9: []}
@@ -0,0 +1,111 @@
+import re
+import threading
+
+import pytest
+import requests
+import responses
+
+from git_dev_metrics.github import GitHubAPIError, graphql_client
+from git_dev_metrics.github._latency import (
+    MIN_TIMEOUT,
+    LatencyTracker,
+    endpoint_name,
+    is_idempotent,
+)
+from git_dev_metrics.github.graphql_client import (
+    DEFAULT_TIMEOUT,
+    TRANSIENT_RETRY_ATTEMPTS,
+    execute_query,
+    get_client,
+    set_hedging,
+)
+from git_dev_metrics.github.graphql_queries import SEARCH_MERGED_PRS_QUERY
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = LatencyTracker(min_samples=1)
+    monkeypatch.setattr(graphql_client, "latency", tracker)
+    yield tracker
+    set_hedging(False)
+
+
+class TestLatencyTracker:
+    def test_should_keep_default_timeout_until_enough_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.observe("Search", 1.0)
+
+        assert tracker.percentile("Search", 0.99) is None
+        assert tracker.timeout("Search", 60) == 60
+        assert tracker.hedge_delay("Search") is None
+
+    def test_should_derive_timeout_from_p99_within_bounds(self):
+        tracker = LatencyTracker(min_samples=3)
+        for seconds in (1.0, 2.0, 20.0):
+            tracker.observe("Search", seconds)
+
+        assert tracker.timeout("Search", 60) == 40.0
+        assert tracker.timeout("Search", 30) == 30
+        tracker.clear()
+        for _ in range(3):
+            tracker.observe("Search", 0.5)
+        assert tracker.timeout("Search", 60) == MIN_TIMEOUT
+
+    def test_should_track_endpoints_by_operation_name(self):
+        assert endpoint_name(SEARCH_MERGED_PRS_QUERY) == "SearchMergedPRs"
+        assert is_idempotent(SEARCH_MERGED_PRS_QUERY)
+
+
+class TestHedging:
+    def test_should_return_hedge_when_first_request_stalls(self, tracker, monkeypatch):
+        # Arrange
+        tracker.observe("SearchMergedPRs", 0.01)
+        release = threading.Event()
+        calls: list[float] = []
+
+        def execute(_client, _request, timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                release.wait(timeout=2)
+                return {"search": "slow"}
+            return {"search": "hedged"}
+
+        monkeypatch.setattr(graphql_client, "_execute", execute)
+        set_hedging(True)
+
+        # Act
+        result = execute_query(get_client("fake-token"), SEARCH_MERGED_PRS_QUERY, {})
+        release.set()
+
+        # Assert
+        assert result == {"search": "hedged"}
+        assert len(calls) == 2
+
+    def test_should_not_hedge_when_disabled(self, tracker, monkeypatch):
+        tracker.observe("SearchMergedPRs", 0.01)
+        calls: list[float] = []
+
+        def execute(_client, _request, timeout):
+            calls.append(timeout)
+            return {}
+
+        monkeypatch.setattr(graphql_client, "_execute", execute)
+
+        execute_query(get_client("fake-token"), SEARCH_MERGED_PRS_QUERY, {})
+
+        assert calls == [MIN_TIMEOUT]
+
+    @responses.activate
+    def test_should_count_timeouts_as_slow_samples(self, tracker, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(graphql_client.time, "sleep", lambda _: None)
+        url = re.compile(r"https://api\.github\.com/graphql")
+        responses.add(responses.POST, url, body=requests.ReadTimeout("read timed out"))
+
+        # Act
+        with pytest.raises(GitHubAPIError, match="Network error"):
+            execute_query(get_client("fake-token"), SEARCH_MERGED_PRS_QUERY, {})
+
+        # Assert
+        assert len(responses.calls) == TRANSIENT_RETRY_ATTEMPTS
+        assert tracker.percentile("SearchMergedPRs", 0.5) == DEFAULT_TIMEOUT
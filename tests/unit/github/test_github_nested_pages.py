@@ -0,0 +1,71 @@
+import json
+import re
+from typing import cast
+
+import responses
+
+from git_dev_metrics.github._nested_pages import complete_nested
+from git_dev_metrics.github.graphql_client import get_client
+
+GRAPHQL_URL = re.compile(r"https://api\.github\.com/graphql")
+
+
+def _review(login: str) -> dict:
+    return {"author": {"login": login}, "state": "APPROVED", "submittedAt": None}
+
+
+def _commit(message: str) -> dict:
+    return {"commit": {"committedDate": None, "message": message}}
+
+
+class TestCompleteNested:
+    @responses.activate
+    def test_should_page_overflowing_connections_with_aliased_node_lookups(self):
+        pr = {
+            "id": "PR_1",
+            "reviews": {
+                "nodes": [_review("a")],
+                "pageInfo": {"hasNextPage": True, "endCursor": "r1"},
+            },
+            "commits": {
+                "nodes": [_commit("late")],
+                "pageInfo": {"hasPreviousPage": True, "startCursor": "c1"},
+            },
+        }
+        done = {"id": "PR_2", "reviews": {"nodes": [], "pageInfo": {"hasNextPage": False}}}
+        responses.add(
+            responses.POST,
+            GRAPHQL_URL,
+            json={
+                "data": {
+                    "o0": {
+                        "reviews": {
+                            "nodes": [_review("b")],
+                            "pageInfo": {"hasNextPage": False, "endCursor": "r2"},
+                        }
+                    },
+                    "o1": {
+                        "commits": {
+                            "nodes": [_commit("early")],
+                            "pageInfo": {"hasPreviousPage": False, "startCursor": "c0"},
+                        }
+                    },
+                }
+            },
+        )
+
+        complete_nested(get_client("fake-token"), [pr, done], ("reviews", "commits"))
+
+        assert [r["author"]["login"] for r in pr["reviews"]["nodes"]] == ["a", "b"]
+        assert [c["commit"]["message"] for c in pr["commits"]["nodes"]] == ["early", "late"]
+        assert len(responses.calls) == 1
+        sent = json.loads(cast(bytes, responses.calls[0].request.body))["variables"]
+        assert sent == {"id0": "PR_1", "c0": "r1", "id1": "PR_1", "c1": "c1"}
+
+    @responses.activate
+    def test_should_not_query_when_nothing_overflows(self):
+        pr = {"id": "PR_1", "files": {"nodes": [], "pageInfo": {"hasNextPage": False}}}
+
+        complete_nested(get_client("fake-token"), [pr], ("files",))
+
+        assert len(responses.calls) == 0
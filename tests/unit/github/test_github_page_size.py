@@ -0,0 +1,176 @@
+import json
+import re
+import time
+from typing import cast
+
+import requests
+import responses
+
+from git_dev_metrics.github import graphql_client
+from git_dev_metrics.github._page_size import MAX_PAGE_SIZE, PageSizer
+from git_dev_metrics.github.graphql_client import execute_paginated_query, get_client
+from git_dev_metrics.github.graphql_queries import REPO_METRICS_QUERY
+
+
+class TestPageSizer:
+    def test_should_grow_while_pages_are_fast(self):
+        sizer = PageSizer(20, target=4.0)
+
+        sizer.record(1.0)
+        sizer.record(1.0)
+
+        assert sizer.size == 45
+
+    def test_should_never_grow_past_max(self):
+        sizer = PageSizer(90, target=4.0)
+
+        sizer.record(0.1)
+
+        assert sizer.size == MAX_PAGE_SIZE
+
+    def test_should_shrink_when_pages_are_slow(self):
+        sizer = PageSizer(40, target=4.0)
+
+        sizer.record(5.0)
+        assert sizer.size == 40
+        sizer.record(9.0)
+        assert sizer.size == 30
+
+    def test_should_halve_and_rewrite_variables_on_back_off(self):
+        sizer = PageSizer(50)
+        variables = {"first": 50}
+
+        sizer.back_off(variables)
+
+        assert sizer.size == 25
+        assert variables == {"first": 25}
+
+    def test_should_keep_requested_size_as_floor_when_below_minimum(self):
+        sizer = PageSizer(2)
+        variables: dict = {}
+
+        sizer.back_off(variables)
+
+        assert sizer.size == 2
+
+
+class TestAdaptivePagination:
+    @responses.activate
+    def test_should_retry_gateway_timeout_with_smaller_page(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(graphql_client.time, "sleep", lambda _: None)
+        url = re.compile(r"https://api\.github\.com/graphql")
+        responses.add(responses.POST, url, status=502)
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "data": {
+                    "repository": {
+                        "pullRequests": {
+                            "nodes": [{"number": 1}],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                }
+            },
+        )
+        sizer = PageSizer(50)
+
+        # Act
+        result = execute_paginated_query(
+            get_client("fake-token"),
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 50},
+            "repository.pullRequests",
+            quiet=True,
+            sizer=sizer,
+        )
+
+        # Assert
+        sent = [
+            json.loads(cast(bytes, call.request.body))["variables"]["first"]
+            for call in responses.calls
+        ]
+        assert sent == [50, 25]
+        assert result == [{"number": 1}]
+        assert sizer.size > 25
+
+    @responses.activate
+    def test_should_retry_read_timeout_with_smaller_page(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(graphql_client.time, "sleep", lambda _: None)
+        url = re.compile(r"https://api\.github\.com/graphql")
+        responses.add(responses.POST, url, body=requests.ReadTimeout("read timed out"))
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "data": {
+                    "repository": {
+                        "pullRequests": {
+                            "nodes": [{"number": 1}],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                }
+            },
+        )
+        sizer = PageSizer(50)
+
+        # Act
+        result = execute_paginated_query(
+            get_client("fake-token"),
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 50},
+            "repository.pullRequests",
+            quiet=True,
+            sizer=sizer,
+        )
+
+        # Assert
+        sent = [
+            json.loads(cast(bytes, call.request.body))["variables"]["first"]
+            for call in responses.calls
+        ]
+        assert sent == [50, 25]
+        assert result == [{"number": 1}]
+
+    @responses.activate
+    def test_should_time_only_the_successful_round_trip(self, monkeypatch):
+        # Arrange
+        url = re.compile(r"https://api\.github\.com/graphql")
+        monkeypatch.setattr(graphql_client, "TRANSIENT_RETRY_BASE_DELAY", 0.2)
+        monkeypatch.setattr(graphql_client, "_wait_for_budget", lambda _scheduler: time.sleep(0.2))
+        responses.add(responses.POST, url, status=502)
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "data": {
+                    "repository": {
+                        "pullRequests": {
+                            "nodes": [],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                }
+            },
+        )
+        sizer = PageSizer(50)
+        recorded: list[float] = []
+        monkeypatch.setattr(sizer, "record", recorded.append)
+
+        # Act
+        execute_paginated_query(
+            get_client("fake-token"),
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 50},
+            "repository.pullRequests",
+            quiet=True,
+            sizer=sizer,
+        )
+
+        # Assert
+        assert len(recorded) == 1
+        assert recorded[0] < 0.2
@@ -1,10 +1,17 @@
 import re
+import time
 
 import pytest
 import responses
 
-from git_dev_metrics.github import GitHubAPIError
-from git_dev_metrics.github.graphql_client import execute_paginated_query, get_client
+from git_dev_metrics.github import GitHubAPIError, _json
+from git_dev_metrics.github.graphql_client import (
+    _extract_nodes,
+    _get_page_info,
+    execute_paginated_query,
+    get_client,
+    iter_pages,
+)
 from git_dev_metrics.github.graphql_queries import REPO_METRICS_QUERY
 
 
@@ -242,6 +249,88 @@ class TestPagination:
         assert len(responses.calls) == 1
 
 
+def _wait_for_calls(n: int, timeout: float = 2.0) -> int:
+    deadline = time.monotonic() + timeout
+    while len(responses.calls) < n and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return len(responses.calls)
+
+
+class TestExtractNodes:
+    def test_should_read_nodes_and_page_info_of_nested_connection(self):
+        result = {
+            "repository": {
+                "pullRequests": {
+                    "nodes": [{"number": 1}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                }
+            }
+        }
+
+        assert _extract_nodes(result, "repository.pullRequests") == [{"number": 1}]
+        assert _get_page_info(result, "repository.pullRequests") == {
+            "hasNextPage": True,
+            "endCursor": "c1",
+        }
+
+    def test_should_tolerate_missing_or_null_connection(self):
+        assert _extract_nodes({"repository": None}, "repository.pullRequests") == []
+        assert _extract_nodes({}, "search") == []
+        assert _get_page_info({"search": None}, "search") == {}
+
+    def test_should_decode_response_body(self):
+        assert _json.loads(b'{"search": {"nodes": []}}') == {"search": {"nodes": []}}
+
+
+class TestPrefetch:
+    @responses.activate
+    def test_should_request_next_page_while_caller_holds_current(self):
+        for cursor, has_next in (("c1", True), ("c2", False)):
+            responses.add(
+                responses.POST,
+                re.compile(r"https://api\.github\.com/graphql"),
+                json={
+                    "data": {
+                        "repository": {
+                            "pullRequests": {
+                                "nodes": [{"number": cursor}],
+                                "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                            }
+                        }
+                    }
+                },
+            )
+        pages = iter_pages(
+            get_client("fake-token"),
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 1},
+            "repository.pullRequests",
+        )
+
+        first = next(pages)
+
+        assert first == ([{"number": "c1"}], "c1")
+        assert _wait_for_calls(2) == 2
+        assert list(pages) == [([{"number": "c2"}], None)]
+
+    @responses.activate
+    def test_should_raise_prefetch_errors_in_caller(self):
+        responses.add(
+            responses.POST,
+            re.compile(r"https://api\.github\.com/graphql"),
+            json={"errors": [{"type": "NOT_FOUND", "message": "Could not resolve"}]},
+        )
+        pages = iter_pages(
+            get_client("fake-token"),
+            REPO_METRICS_QUERY,
+            {"owner": "o", "name": "r", "first": 1},
+            "repository.pullRequests",
+        )
+
+        with pytest.raises(GitHubAPIError):
+            next(pages)
+
+
 class TestRetryOnTransientErrors:
     @responses.activate
     def test_should_retry_then_succeed_on_504(self, monkeypatch):
@@ -1,9 +1,18 @@
+import json
 import re
+from typing import cast
 
+import pytest
 import responses
 
 from git_dev_metrics.github import fetch_open_prs, fetch_org_repositories, fetch_repo_metrics
-from git_dev_metrics.github.queries import _filter_and_map_pr, fetch_reviews
+from git_dev_metrics.github.graphql_queries import profile_covers, search_merged_query
+from git_dev_metrics.github.queries import (
+    _filter_and_map_pr,
+    fetch_reviews,
+    iter_org_metrics,
+    iter_repo_metrics,
+)
 from git_dev_metrics.utils import TimePeriod
 
 from ..conftest import dt
@@ -286,12 +295,7 @@ class TestFetchReviewsSkip:
             re.compile(r"https://api\.github\.com/graphql"),
             json={
                 "data": {
-                    "repository": {
-                        "pullRequests": {
-                            "nodes": [pr1, pr2],
-                            "pageInfo": {"hasNextPage": False, "endCursor": None},
-                        }
-                    }
+                    "repository": {"pr1": pr1, "pr2": pr2},
                 }
             },
             status=200,
@@ -302,7 +306,6 @@ class TestFetchReviewsSkip:
             "facebook",
             "react",
             [1],
-            TimePeriod(since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)),
         )
 
         assert 1 in result
@@ -506,3 +509,97 @@ class TestFetchOpenPrs:
         result = fetch_open_prs("fake-token", "myorg", "myrepo", quiet=True)
 
         assert result == []
+
+
+class TestIterOrgMetrics:
+    @responses.activate
+    def test_should_group_org_search_page_by_repository(self):
+        def pr(number: int, repo: str) -> dict:
+            return {
+                "number": number,
+                "mergedAt": "2024-01-15T00:00:00Z",
+                "repository": {"nameWithOwner": repo},
+                "reviews": {"nodes": []},
+            }
+
+        responses.add(
+            responses.POST,
+            re.compile(r"https://api\.github\.com/graphql"),
+            json={
+                "data": {
+                    "search": {
+                        "nodes": [pr(1, "org/a"), pr(1, "org/b"), pr(2, "org/a")],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            },
+            status=200,
+        )
+        period = TimePeriod(
+            since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)
+        )
+
+        pages = list(iter_org_metrics("fake-token", "org", period))
+
+        grouped = pages[0]["prs_by_repo"]
+        assert {name: [p["number"] for p in prs] for name, prs in grouped.items()} == {
+            "org/a": [1, 2],
+            "org/b": [1],
+        }
+        body = cast(bytes, responses.calls[0].request.body)
+        assert "nameWithOwner" in json.loads(body)["query"]
+
+
+class TestFetchProfiles:
+    def test_should_leave_body_and_commit_messages_out_of_timing_profile(self):
+        timing = search_merged_query("timing").payload["query"]
+        full = search_merged_query("full").payload["query"]
+
+        assert "body" not in timing
+        assert "message" not in timing
+        assert "committedDate" in timing
+        assert "body" in full
+        assert "files(" not in full
+        assert "files(" in search_merged_query("files").payload["query"]
+
+    def test_should_reject_unknown_profile(self):
+        with pytest.raises(ValueError, match="Unknown fetch profile"):
+            search_merged_query("everything")
+
+    def test_should_order_profiles_by_fields_they_hold(self):
+        assert profile_covers("files", "full")
+        assert profile_covers("full", "full")
+        assert not profile_covers("timing", "full")
+
+    @responses.activate
+    def test_should_map_files_when_profile_selects_them(self):
+        responses.add(
+            responses.POST,
+            re.compile(r"https://api\.github\.com/graphql"),
+            json={
+                "data": {
+                    "search": {
+                        "nodes": [
+                            {
+                                "number": 7,
+                                "mergedAt": "2024-01-15T00:00:00Z",
+                                "reviews": {"nodes": []},
+                                "files": {
+                                    "nodes": [{"path": "a.py", "additions": 2, "deletions": 1}]
+                                },
+                            }
+                        ],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            },
+            status=200,
+        )
+        period = TimePeriod(
+            since=dt(year=2024, month=1, day=1), until=dt(year=2024, month=2, day=1)
+        )
+
+        pages = list(iter_repo_metrics("fake-token", "org", "r", period, profile="files"))
+
+        assert pages[0]["prs"][0].get("files") == [{"path": "a.py", "additions": 2, "deletions": 1}]
+        assert "files(" in json.loads(cast(bytes, responses.calls[0].request.body))["query"]
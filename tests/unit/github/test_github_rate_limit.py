@@ -0,0 +1,167 @@
+import re
+from datetime import UTC, datetime
+
+import pytest
+import responses
+
+from git_dev_metrics.github import GitHubRateLimitError, graphql_client
+from git_dev_metrics.github.graphql_client import (
+    RateLimitScheduler,
+    close_clients,
+    execute_query,
+    get_client,
+    rate_limit_scheduler,
+)
+from git_dev_metrics.github.graphql_queries import REPO_METRICS_QUERY
+
+GRAPHQL_URL = re.compile(r"https://api\.github\.com/graphql")
+VARIABLES = {"owner": "o", "name": "r", "first": 1}
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rate_limit(clock: FakeClock, remaining: int, reset_in: float, cost: int = 1) -> dict:
+    reset_at = datetime.fromtimestamp(clock.now + reset_in, tz=UTC)
+    return {"cost": cost, "remaining": remaining, "resetAt": reset_at.isoformat()}
+
+
+def _ok(remaining: int = 4999) -> dict:
+    return {
+        "data": {
+            "rateLimit": {"cost": 1, "remaining": remaining, "resetAt": "2099-01-01T00:00:00Z"},
+            "repository": {"pullRequests": {"nodes": [], "pageInfo": {"hasNextPage": False}}},
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    close_clients()
+    yield
+    close_clients()
+
+
+@pytest.fixture
+def sleeps(mocker):
+    clock = FakeClock()
+    graphql_client._schedulers["token-a"] = RateLimitScheduler(clock=clock)
+    recorded: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        recorded.append(seconds)
+        clock.now += seconds
+
+    mocker.patch.object(graphql_client.time, "sleep", side_effect=sleep)
+    return recorded
+
+
+class TestRateLimitScheduler:
+    def test_should_go_immediately_before_any_budget_is_known(self):
+        scheduler = RateLimitScheduler(clock=FakeClock())
+
+        assert scheduler.reserve() == 0.0
+
+    def test_should_deduct_last_cost_per_request(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.observe(_rate_limit(clock, remaining=4000, reset_in=3600, cost=3))
+
+        scheduler.reserve()
+        scheduler.reserve()
+
+        assert scheduler.remaining == 3994
+
+    def test_should_wait_for_reset_when_budget_hits_reserve(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(reserve=50, clock=clock)
+        scheduler.observe(_rate_limit(clock, remaining=50, reset_in=120))
+
+        assert scheduler.reserve() == pytest.approx(120)
+
+        clock.now += 120
+        assert scheduler.reserve() == 0.0
+
+    def test_should_spread_requests_when_budget_runs_low(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(reserve=0, throttle_below=100, clock=clock)
+        scheduler.observe(_rate_limit(clock, remaining=11, reset_in=100))
+
+        assert scheduler.reserve() == 0.0
+        assert scheduler.reserve() == pytest.approx(10)
+
+    def test_should_keep_lowest_remaining_within_same_window(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.observe(_rate_limit(clock, remaining=3000, reset_in=600))
+
+        scheduler.observe(_rate_limit(clock, remaining=3500, reset_in=600))
+
+        assert scheduler.remaining == 3000
+
+    def test_should_hold_every_caller_while_paused(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(clock=clock)
+
+        scheduler.pause(30)
+
+        assert scheduler.reserve() == pytest.approx(30)
+
+    def test_should_share_scheduler_between_clients_of_one_token(self):
+        assert rate_limit_scheduler("token-a") is rate_limit_scheduler("token-a")
+        assert rate_limit_scheduler("token-a") is not rate_limit_scheduler("token-b")
+
+
+class TestExecuteQueryRateLimits:
+    @responses.activate
+    def test_should_wait_retry_after_on_secondary_limit(self, sleeps):
+        responses.add(
+            responses.POST,
+            GRAPHQL_URL,
+            json={"message": "You have exceeded a secondary rate limit."},
+            status=403,
+            headers={"Retry-After": "7"},
+        )
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok(), status=200)
+
+        result = execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+
+        assert result["rateLimit"]["remaining"] == 4999
+        assert sleeps == [pytest.approx(7)]
+
+    @responses.activate
+    def test_should_not_treat_plain_forbidden_as_rate_limit(self, sleeps):
+        responses.add(
+            responses.POST, GRAPHQL_URL, json={"message": "Resource not accessible"}, status=403
+        )
+
+        with pytest.raises(Exception, match="403"):
+            execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        assert sleeps == []
+
+    @responses.activate
+    def test_should_give_up_after_repeated_rate_limits(self, sleeps):
+        responses.add(
+            responses.POST,
+            GRAPHQL_URL,
+            json={"message": "API rate limit exceeded"},
+            status=429,
+            headers={"Retry-After": "1"},
+        )
+
+        with pytest.raises(GitHubRateLimitError):
+            execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        assert sleeps == [pytest.approx(1)] * graphql_client.RATE_LIMIT_RETRY_ATTEMPTS
+
+    @responses.activate
+    def test_should_feed_response_budget_into_token_scheduler(self, sleeps):
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok(remaining=4321), status=200)
+
+        execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+
+        assert rate_limit_scheduler("token-a").remaining == 4321
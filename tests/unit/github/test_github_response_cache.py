@@ -0,0 +1,134 @@
+import re
+
+import pytest
+import responses
+
+from git_dev_metrics.github._response_cache import ResponseCache, response_key, token_identity
+from git_dev_metrics.github.graphql_client import (
+    close_clients,
+    execute_query,
+    get_client,
+    set_response_cache,
+)
+from git_dev_metrics.github.graphql_queries import REPO_METRICS_QUERY
+
+GRAPHQL_URL = re.compile(r"https://api\.github\.com/graphql")
+VARIABLES = {"owner": "o", "name": "r", "first": 1}
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ok(login: str = "alice") -> dict:
+    return {
+        "data": {
+            "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2099-01-01T00:00:00Z"},
+            "repository": {"pullRequests": {"nodes": [{"login": login}]}},
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    close_clients()
+    yield
+    set_response_cache(None)
+    close_clients()
+
+
+class TestResponseKey:
+    def test_should_differ_by_variables_and_token(self):
+        base = response_key(REPO_METRICS_QUERY, VARIABLES, token_identity("token-a"))
+
+        assert base == response_key(REPO_METRICS_QUERY, dict(VARIABLES), token_identity("token-a"))
+        assert base != response_key(
+            REPO_METRICS_QUERY, {**VARIABLES, "after": "c1"}, token_identity("token-a")
+        )
+        assert base != response_key(REPO_METRICS_QUERY, VARIABLES, token_identity("token-b"))
+
+    def test_should_ignore_page_size(self):
+        key = response_key(REPO_METRICS_QUERY, VARIABLES, token_identity("token-a"))
+
+        assert key == response_key(
+            REPO_METRICS_QUERY, {**VARIABLES, "first": 40}, token_identity("token-a")
+        )
+
+    def test_should_not_reveal_token(self):
+        assert "secret" not in token_identity("ghp_secret")
+
+
+class TestResponseCache:
+    def test_should_return_stored_response_within_ttl(self, tmp_path):
+        clock = FakeClock()
+        cache = ResponseCache(tmp_path / "responses.db", ttl=60, clock=clock)
+        cache.put("k", {"a": 1})
+
+        clock.now += 59
+        assert cache.get("k") == {"a": 1}
+        clock.now += 2
+        assert cache.get("k") is None
+
+    def test_should_evict_least_recently_used_past_max_bytes(self, tmp_path):
+        clock = FakeClock()
+        cache = ResponseCache(tmp_path / "responses.db", max_bytes=50, clock=clock)
+        cache.put("read", {"body": "x" * 10})
+        clock.now += 1
+        cache.put("unread", {"body": "y" * 10})
+        clock.now += 1
+        cache.get("read")
+        clock.now += 1
+
+        cache.put("new", {"body": "z" * 10})
+
+        assert cache.get("unread") is None
+        assert cache.get("read") == {"body": "x" * 10}
+        assert cache.get("new") == {"body": "z" * 10}
+
+
+class TestExecuteQueryResponseCache:
+    @responses.activate
+    def test_should_replay_identical_request_from_disk(self, tmp_path):
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok(), status=200)
+        set_response_cache(tmp_path / "responses.db")
+
+        first = execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        second = execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+
+        assert first == second
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_should_go_to_network_for_another_token(self, tmp_path):
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok("alice"), status=200)
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok("bob"), status=200)
+        set_response_cache(tmp_path / "responses.db")
+
+        execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        result = execute_query(get_client("token-b"), REPO_METRICS_QUERY, VARIABLES)
+
+        assert result["repository"]["pullRequests"]["nodes"] == [{"login": "bob"}]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_should_always_send_when_cache_is_off(self):
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok(), status=200)
+
+        execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_should_always_send_from_live_client(self, tmp_path):
+        responses.add(responses.POST, GRAPHQL_URL, json=_ok(), status=200)
+        set_response_cache(tmp_path / "responses.db")
+
+        execute_query(get_client("token-a"), REPO_METRICS_QUERY, VARIABLES)
+        execute_query(get_client("token-a", live=True), REPO_METRICS_QUERY, VARIABLES)
+
+        assert len(responses.calls) == 2
@@ -0,0 +1,141 @@
+import json
+import re
+from datetime import UTC, datetime
+from typing import cast
+
+import responses
+
+from git_dev_metrics.github._search_windows import (
+    SEARCH_RESULT_CAP,
+    iter_search_merged,
+    search_merged,
+    window_query,
+)
+from git_dev_metrics.github.graphql_client import get_client
+from git_dev_metrics.github.graphql_queries import SEARCH_MERGED_PRS_QUERY
+from git_dev_metrics.utils import TimePeriod
+
+GRAPHQL_URL = re.compile(r"https://api\.github\.com/graphql")
+JANUARY = TimePeriod(since=datetime(2024, 1, 1, tzinfo=UTC), until=datetime(2024, 2, 1, tzinfo=UTC))
+
+
+def _search_page(issue_count: int, numbers: list[int]) -> dict:
+    return {
+        "data": {
+            "search": {
+                "issueCount": issue_count,
+                "nodes": [{"number": n} for n in numbers],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+
+
+class TestWindowQuery:
+    def test_should_cover_half_open_range_to_the_second(self):
+        query = window_query("repo:o/r is:pr", JANUARY.since, JANUARY.until)
+
+        assert query == "repo:o/r is:pr merged:2024-01-01T00:00:00Z..2024-01-31T23:59:59Z"
+
+
+class TestSearchMerged:
+    @responses.activate
+    def test_should_not_split_when_under_cap(self):
+        responses.add(responses.POST, GRAPHQL_URL, json=_search_page(2, [1, 2]))
+
+        nodes = search_merged(
+            get_client("fake-token"),
+            SEARCH_MERGED_PRS_QUERY,
+            "repo:o/r is:pr",
+            JANUARY,
+            25,
+            repo_id="o/r",
+        )
+
+        assert [n["number"] for n in nodes] == [1, 2]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_should_split_overflowing_range_and_dedupe(self):
+        halves = {
+            "merged:2024-01-01T00:00:00Z..2024-01-16T11:59:59Z": _search_page(600, [1, 2]),
+            "merged:2024-01-16T12:00:00Z..2024-01-31T23:59:59Z": _search_page(500, [2, 3]),
+        }
+
+        def reply(request):
+            search = json.loads(request.body)["variables"]["query"]
+            for window, page in halves.items():
+                if search.endswith(window):
+                    return 200, {}, json.dumps(page)
+            return 200, {}, json.dumps(_search_page(SEARCH_RESULT_CAP + 100, [1]))
+
+        responses.add_callback(responses.POST, GRAPHQL_URL, callback=reply)
+
+        nodes = search_merged(
+            get_client("fake-token"),
+            SEARCH_MERGED_PRS_QUERY,
+            "repo:o/r is:pr",
+            JANUARY,
+            25,
+            repo_id="o/r",
+        )
+
+        assert sorted(n["number"] for n in nodes) == [1, 2, 3]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_should_stream_split_windows_page_by_page(self):
+        first_half = "merged:2024-01-01T00:00:00Z..2024-01-16T11:59:59Z"
+        more = _search_page(600, [1])
+        more["data"]["search"]["pageInfo"] = {"hasNextPage": True, "endCursor": "c1"}
+
+        def reply(request):
+            variables = json.loads(request.body)["variables"]
+            if variables.get("after") == "c1":
+                return 200, {}, json.dumps(_search_page(600, [2]))
+            if variables["query"].endswith(first_half):
+                return 200, {}, json.dumps(more)
+            if "2024-01-16T12:00:00Z" in variables["query"]:
+                return 200, {}, json.dumps(_search_page(500, [3]))
+            return 200, {}, json.dumps(_search_page(SEARCH_RESULT_CAP + 100, [1]))
+
+        responses.add_callback(responses.POST, GRAPHQL_URL, callback=reply)
+
+        pages = list(
+            iter_search_merged(
+                get_client("fake-token"),
+                SEARCH_MERGED_PRS_QUERY,
+                "repo:o/r is:pr",
+                JANUARY,
+                25,
+                repo_id="o/r",
+            )
+        )
+
+        assert [([n["number"] for n in page.nodes], page.cursor) for page in pages] == [
+            ([1], "c1"),
+            ([3], None),
+            ([2], None),
+        ]
+
+    @responses.activate
+    def test_should_resume_saved_cursor_without_probing(self):
+        responses.add(responses.POST, GRAPHQL_URL, json=_search_page(2, [3]))
+        search = "repo:o/r is:pr merged:2024-01-01..2024-02-01"
+
+        pages = list(
+            iter_search_merged(
+                get_client("fake-token"),
+                SEARCH_MERGED_PRS_QUERY,
+                "repo:o/r is:pr",
+                JANUARY,
+                25,
+                repo_id="o/r",
+                resume={search: "c2"},
+            )
+        )
+
+        assert [[n["number"] for n in page.nodes] for page in pages] == [[3]]
+        assert (
+            json.loads(cast(bytes, responses.calls[0].request.body))["variables"]["after"] == "c2"
+        )
@@ -0,0 +1,159 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from git_dev_metrics.github import (
+    GitHubAuthError,
+    GitHubRateLimitError,
+    TokenPool,
+    extra_tokens,
+    graphql_client,
+)
+from git_dev_metrics.github.graphql_client import RateLimitScheduler, close_clients
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fresh_budgets():
+    close_clients()
+    yield
+    close_clients()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _spend(clock: FakeClock, token: str, remaining: int, reset_in: float = 3600) -> None:
+    scheduler = graphql_client._schedulers.setdefault(token, RateLimitScheduler(clock=clock))
+    reset_at = datetime.fromtimestamp(clock.now + reset_in, tz=UTC).isoformat()
+    scheduler.observe({"cost": 2, "remaining": remaining, "resetAt": reset_at})
+
+
+class TestTokenPoolAcquire:
+    def test_should_pick_token_with_most_budget_left(self, clock):
+        _spend(clock, "token-a", 100)
+        _spend(clock, "token-b", 4000)
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+
+        assert pool.acquire() == "token-b"
+
+    def test_should_spread_fresh_tokens_evenly(self, clock):
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+
+        assert [pool.acquire() for _ in range(4)] == ["token-a", "token-b"] * 2
+
+    def test_should_drop_duplicate_and_empty_tokens(self):
+        assert TokenPool(["token-a", "", "token-a"]).tokens == ["token-a"]
+
+    def test_should_raise_when_no_token_given(self):
+        with pytest.raises(GitHubAuthError):
+            TokenPool([])
+
+
+class TestTokenPoolTakeOut:
+    def test_should_skip_rejected_token_for_good(self, clock):
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+
+        assert pool.take_out("token-a", GitHubAuthError("bad credentials"))
+        clock.now += 10 * 3600
+
+        assert {pool.acquire() for _ in range(3)} == {"token-b"}
+
+    def test_should_bring_exhausted_token_back_after_reset(self, clock):
+        _spend(clock, "token-a", 0, reset_in=600)
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+        pool.take_out("token-a", GitHubRateLimitError("rate limited"))
+        _spend(clock, "token-b", 10)
+
+        assert pool.acquire() == "token-b"
+        clock.now += 601
+        assert pool.acquire() == "token-a"
+
+    def test_should_report_when_no_other_token_is_left(self, clock):
+        pool = TokenPool(["token-a"], clock=clock)
+
+        assert not pool.take_out("token-a", GitHubRateLimitError("rate limited"))
+
+    def test_should_hand_out_soonest_reset_when_all_exhausted(self, clock):
+        _spend(clock, "token-a", 0, reset_in=900)
+        _spend(clock, "token-b", 0, reset_in=300)
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+        pool.take_out("token-a", GitHubRateLimitError("rate limited"))
+        pool.take_out("token-b", GitHubRateLimitError("rate limited"))
+
+        assert pool.acquire() == "token-b"
+
+    def test_should_raise_when_every_token_rejected(self, clock):
+        pool = TokenPool(["token-a"], clock=clock)
+        pool.take_out("token-a", GitHubAuthError("bad credentials"))
+
+        with pytest.raises(GitHubAuthError, match="rejected"):
+            pool.acquire()
+
+
+class TestTokenPoolHandOff:
+    def test_should_switch_tokens_instead_of_waiting_for_the_reset(self, clock):
+        _spend(clock, "token-a", 0)
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+        scheduler = graphql_client._schedulers["token-a"]
+
+        with pytest.raises(GitHubRateLimitError):
+            graphql_client._wait_for_budget(scheduler)
+        pool.take_out("token-b", GitHubAuthError("bad credentials"))
+        assert not scheduler.should_hand_off()
+
+    def test_should_not_hand_off_a_lone_token(self, clock):
+        _spend(clock, "token-a", 0)
+        TokenPool(["token-a"], clock=clock)
+
+        assert not graphql_client._schedulers["token-a"].should_hand_off()
+
+    def test_should_call_with_next_token_when_one_runs_dry(self, clock):
+        pool = TokenPool(["token-a", "token-b"], clock=clock)
+
+        def fetch(token: str) -> str:
+            if token == "token-a":
+                raise GitHubRateLimitError("rate limited")
+            return token
+
+        assert pool.call(fetch) == "token-b"
+
+
+class TestTokenPoolUsage:
+    def test_should_report_requests_points_and_state_per_token(self, clock):
+        _spend(clock, "secret-aaaa", 4998)
+        _spend(clock, "secret-aaaa", 4996)
+        pool = TokenPool(["secret-aaaa", "secret-bbbb"], clock=clock)
+        pool.take_out("secret-bbbb", GitHubAuthError("bad credentials"))
+
+        first, second = pool.usage()
+
+        assert (first.label, first.requests, first.points, first.remaining) == (
+            "…aaaa",
+            2,
+            4,
+            4996,
+        )
+        assert first.state == "ok"
+        assert (second.requests, second.state) == (0, "rejected")
+
+
+class TestExtraTokens:
+    def test_should_split_comma_separated_tokens(self, monkeypatch):
+        monkeypatch.setenv("GDM_GITHUB_TOKENS", " token-a, ,token-b ")
+
+        assert extra_tokens() == ["token-a", "token-b"]
+
+    def test_should_be_empty_when_unset(self, monkeypatch):
+        monkeypatch.delenv("GDM_GITHUB_TOKENS", raising=False)
+
+        assert extra_tokens() == []
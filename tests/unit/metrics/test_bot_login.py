@@ -1,5 +1,6 @@
 from git_dev_metrics.constants import is_bot_login
-from git_dev_metrics.metrics.calculator import group_prs_by_devs
+from git_dev_metrics.metrics.snapshot import compute_dev_metrics
+from git_dev_metrics.pr_metrics import aggregate_prs
 
 from ..conftest import any_pr
 
@@ -21,12 +22,12 @@ class TestIsBotLogin:
         assert is_bot_login(None) is False
 
 
-class TestGroupPrsByDevsBotExclusion:
+class TestDevMetricsBotExclusion:
     def test_should_exclude_dash_bot_authors(self):
         prs = [
             any_pr(id=1, number=1, user={"login": "alice"}),
             any_pr(id=2, number=2, user={"login": "patches-bot"}),
         ]
-        result = group_prs_by_devs(prs)
+        result = compute_dev_metrics(aggregate_prs(prs), days=30, reviewer_counts={})
         assert "alice" in result
         assert "patches-bot" not in result
@@ -0,0 +1,45 @@
+from git_dev_metrics.pr_metrics import derive_pr_metrics, pr_metrics
+
+from ..conftest import any_pr, approved_review, dt
+
+
+class TestDerivePrMetrics:
+    def test_should_derive_hours_from_start_approval_and_merge(self):
+        pr = any_pr(
+            created_at=dt(year=2026, month=4, day=1, hour=8),
+            merged_at=dt(year=2026, month=4, day=1, hour=20),
+            reviews=[approved_review(submitted_at=dt(year=2026, month=4, day=1, hour=11))],
+            additions=30,
+            deletions=-12,
+        )
+
+        metrics = derive_pr_metrics(pr)
+
+        assert metrics["start_at"] == dt(year=2026, month=4, day=1, hour=8)
+        assert metrics["first_approval_at"] == dt(year=2026, month=4, day=1, hour=11)
+        assert (metrics["pickup_hours"], metrics["review_hours"]) == (3.0, 9.0)
+        assert metrics["cycle_hours"] == 12.0
+        assert metrics["size"] == 42
+
+    def test_should_leave_cycle_unset_without_approval(self):
+        pr = any_pr(reviews=[])
+
+        metrics = derive_pr_metrics(pr)
+
+        assert metrics["cycle_hours"] is None
+        assert metrics["pickup_hours"] is None
+        assert metrics["review_hours"] is None
+
+    def test_should_flag_ai_trailer_in_any_commit_message(self):
+        pr = any_pr(
+            body=None,
+            commit_messages=["fix", "feat\n\nCo-Authored-By: helper <helper@example.com>"],
+        )
+
+        assert derive_pr_metrics(pr)["is_ai"] is True
+
+    def test_should_prefer_metrics_stored_with_pr(self):
+        stored = {**derive_pr_metrics(any_pr()), "size": 999}
+        pr = any_pr(metrics=stored)
+
+        assert pr_metrics(pr)["size"] == 999
@@ -1,47 +1,50 @@
 """Unit tests for metrics/loader.py."""
 
+from git_dev_metrics.cache import insert_prs, mark_partial, seal_month
+from git_dev_metrics.metrics import loader
 from git_dev_metrics.metrics.loader import (
     InvalidRangeError,
     load_snapshot_for_months,
     load_snapshot_for_range,
 )
+from git_dev_metrics.pr_metrics import aggregate_prs
 
-from ..conftest import any_pr
+from ..conftest import any_pr, approved_review
 
 
 class TestLoadSnapshotForMonths:
-    def test_should_return_none_when_no_data(self, mocker):
+    def test_should_return_none_when_no_data(self, mocker, tmp_path):
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
             return_value={},
         )
 
-        result = load_snapshot_for_months([(2026, 4)], None)
+        result = load_snapshot_for_months([(2026, 4)], tmp_path / "cache.db")
 
         assert result is None
 
-    def test_should_return_snapshot_when_data_exists(self, mocker):
-        repo_prs = {"org/repo": [any_pr()]}
+    def test_should_return_snapshot_when_data_exists(self, mocker, tmp_path):
+        repo_aggregates = {"org/repo": aggregate_prs([any_pr()])}
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
-            return_value=repo_prs,
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
+            return_value=repo_aggregates,
         )
 
-        result = load_snapshot_for_months([(2026, 4)], None)
+        result = load_snapshot_for_months([(2026, 4)], tmp_path / "cache.db")
 
         assert result is not None
         assert result.team.pr_count == 1
         assert result.period.since.year == 2026
         assert result.period.since.month == 4
 
-    def test_should_build_range_period_from_months(self, mocker):
-        repo_prs = {"org/repo": [any_pr()]}
+    def test_should_build_range_period_from_months(self, mocker, tmp_path):
+        repo_aggregates = {"org/repo": aggregate_prs([any_pr()])}
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
-            return_value=repo_prs,
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
+            return_value=repo_aggregates,
         )
 
-        result = load_snapshot_for_months([(2026, 1), (2026, 3)], None)
+        result = load_snapshot_for_months([(2026, 1), (2026, 3)], tmp_path / "cache.db")
 
         assert result is not None
         assert result.period.since.year == 2026
@@ -52,44 +55,104 @@ class TestLoadSnapshotForMonths:
 
 
 class TestLoadSnapshotForRange:
-    def test_should_parse_and_load_range(self, mocker):
-        repo_prs = {"org/repo": [any_pr()]}
+    def test_should_parse_and_load_range(self, mocker, tmp_path):
+        repo_aggregates = {"org/repo": aggregate_prs([any_pr()])}
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
-            return_value=repo_prs,
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
+            return_value=repo_aggregates,
         )
 
-        result = load_snapshot_for_range("2026-04", "2026-06", None)
+        result = load_snapshot_for_range("2026-04", "2026-06", tmp_path / "cache.db")
 
         assert result is not None
         assert result.team.pr_count == 1
 
-    def test_should_raise_on_inverted_range(self, mocker):
+    def test_should_raise_on_inverted_range(self, mocker, tmp_path):
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
             return_value={},
         )
 
         exc = None
         try:
-            load_snapshot_for_range("2026-06", "2026-04", None)
+            load_snapshot_for_range("2026-06", "2026-04", tmp_path / "cache.db")
         except InvalidRangeError as e:
             exc = e
 
         assert exc is not None
         assert "--to must be >= --from" in str(exc)
 
-    def test_should_raise_on_bad_month_format(self, mocker):
+    def test_should_raise_on_bad_month_format(self, mocker, tmp_path):
         mocker.patch(
-            "git_dev_metrics.metrics.loader.load_all_repos_for_range",
+            "git_dev_metrics.metrics.loader.load_repo_aggregates_for_range",
             return_value={},
         )
 
         exc = None
         try:
-            load_snapshot_for_range("bad", "2026-04", None)
+            load_snapshot_for_range("bad", "2026-04", tmp_path / "cache.db")
         except ValueError as e:
             exc = e
 
         assert exc is not None
         assert "Expected YYYY-MM" in str(exc)
+
+
+class TestSnapshotCache:
+    def _pull(self, db_path, prs, *, partial: bool = False) -> None:
+        insert_prs(prs, "org", "repo", 2026, 4, db_path=db_path)
+        if partial:
+            mark_partial("org", "repo", 2026, 4, db_path=db_path)
+        else:
+            seal_month("org", "repo", 2026, 4, db_path=db_path)
+
+    def test_should_serve_repeat_load_from_cache(self, mocker, tmp_path):
+        db_path = tmp_path / "cache.db"
+        self._pull(db_path, [any_pr(number=1, reviews=[approved_review(login="bob")])])
+        first = load_snapshot_for_months([(2026, 4)], db_path)
+        spy = mocker.spy(loader, "load_repo_aggregates_for_range")
+
+        second = load_snapshot_for_months([(2026, 4)], db_path)
+
+        assert second == first
+        spy.assert_not_called()
+
+    def test_should_rebuild_after_month_is_pulled_again(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        self._pull(db_path, [any_pr(number=1)])
+        load_snapshot_for_months([(2026, 4)], db_path)
+
+        self._pull(db_path, [any_pr(number=2)], partial=True)
+        result = load_snapshot_for_months([(2026, 4)], db_path)
+
+        assert result is not None
+        assert result.team.pr_count == 2
+        assert result.has_partial
+
+    def test_should_rebuild_when_prs_are_stored_without_a_new_seal(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        self._pull(db_path, [any_pr(number=1)])
+        load_snapshot_for_months([(2026, 4)], db_path)
+
+        insert_prs([any_pr(number=2)], "org", "repo", 2026, 4, db_path=db_path)
+        result = load_snapshot_for_months([(2026, 4)], db_path)
+
+        assert result is not None
+        assert result.team.pr_count == 2
+
+
+class TestAiAvailability:
+    def test_should_mark_ai_unavailable_when_a_month_was_pulled_with_timing(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        insert_prs([any_pr(number=1)], "org", "repo", 2026, 4, db_path=db_path)
+        insert_prs([any_pr(number=2)], "org", "repo", 2026, 5, db_path=db_path)
+        seal_month("org", "repo", 2026, 4, db_path=db_path)
+        seal_month("org", "repo", 2026, 5, db_path=db_path, profile="timing")
+
+        april = load_snapshot_for_months([(2026, 4)], db_path)
+        both = load_snapshot_for_months([(2026, 4), (2026, 5)], db_path)
+
+        assert april is not None
+        assert april.ai_available
+        assert both is not None
+        assert not both.ai_available
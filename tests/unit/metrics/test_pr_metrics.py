@@ -5,6 +5,8 @@ from git_dev_metrics.metrics import (
     calculate_throughput,
     median,
 )
+from git_dev_metrics.metrics.snapshot import reviewer_counts_of
+from git_dev_metrics.pr_metrics import aggregate_prs
 from git_dev_metrics.utils import TimePeriod
 from git_dev_metrics.utils import period_days as _period_days
 
@@ -174,16 +176,16 @@ class TestCalculatePrsPerWeekUsesActualSpan:
         assert result == 1.0
 
 
-class TestCalculateReviewsGiven:
-    def test_should_return_empty_for_no_prs(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
+def _reviews_given(prs):
+    return reviewer_counts_of(aggregate_prs(prs))
+
 
-        result = calculate_reviews_given([])
+class TestReviewsGiven:
+    def test_should_return_empty_for_no_prs(self):
+        result = _reviews_given([])
         assert result == {}
 
     def test_should_count_reviews_from_devs(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
-
         prs = [
             any_pr(
                 id=1,
@@ -210,13 +212,11 @@ class TestCalculateReviewsGiven:
                 ],
             ),
         ]
-        result = calculate_reviews_given(prs)
+        result = _reviews_given(prs)
         assert result["alice"] == 1
         assert result["bob"] == 1
 
     def test_should_count_external_reviewers(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
-
         prs = [
             any_pr(
                 id=1,
@@ -231,12 +231,10 @@ class TestCalculateReviewsGiven:
                 ],
             ),
         ]
-        result = calculate_reviews_given(prs)
+        result = _reviews_given(prs)
         assert result["external-reviewer"] == 1
 
     def test_should_count_each_pr_only_once_per_reviewer(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
-
         prs = [
             any_pr(
                 id=1,
@@ -262,13 +260,11 @@ class TestCalculateReviewsGiven:
             ),
         ]
 
-        result = calculate_reviews_given(prs)
+        result = _reviews_given(prs)
 
         assert result["bob"] == 1
 
     def test_should_exclude_self_reviews(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
-
         prs = [
             any_pr(
                 id=1,
@@ -284,13 +280,11 @@ class TestCalculateReviewsGiven:
             ),
         ]
 
-        result = calculate_reviews_given(prs)
+        result = _reviews_given(prs)
 
         assert "alice" not in result
 
     def test_should_exclude_bot_suffix_reviewers(self):
-        from git_dev_metrics.metrics.calculator import calculate_reviews_given
-
         prs = [
             any_pr(
                 id=1,
@@ -306,15 +300,12 @@ class TestCalculateReviewsGiven:
             )
         ]
 
-        result = calculate_reviews_given(prs)
+        result = _reviews_given(prs)
 
         assert "patches-bot" not in result
 
     def test_should_not_collide_across_repos_with_same_pr_number(self):
-        from git_dev_metrics.metrics.calculator import (
-            calculate_pickup_time,
-            calculate_reviews_given,
-        )
+        from git_dev_metrics.metrics.calculator import calculate_pickup_time
 
         prs = [
             any_pr(
@@ -347,7 +338,7 @@ class TestCalculateReviewsGiven:
             ),
         ]
 
-        reviews_given = calculate_reviews_given(prs)
+        reviews_given = _reviews_given(prs)
         pickup = calculate_pickup_time(prs)
 
         assert reviews_given["bob"] == 1
@@ -1,6 +1,7 @@
 """Unit tests for MetricsSnapshot."""
 
 from git_dev_metrics.metrics import MetricsSnapshot
+from git_dev_metrics.metrics._snapshot_codec import decode_snapshot, encode_snapshot
 from git_dev_metrics.metrics.snapshot import Row, build_summary
 from git_dev_metrics.utils import TimePeriod
 
@@ -114,6 +115,17 @@ class TestFromRepoPrs:
         assert snap.reviewer_counts.get("bob") == 1
 
 
+class TestSnapshotCodec:
+    def test_should_round_trip_through_msgpack(self):
+        prs = [
+            any_pr(user={"login": "alice"}, reviews=[approved_review(login="bob")]),
+            any_pr(user={"login": "bob"}, body="Generated with AI"),
+        ]
+        snap = MetricsSnapshot.from_repo_prs({"org/r": prs}, _period(), has_partial=True)
+
+        assert decode_snapshot(encode_snapshot(snap)) == snap
+
+
 class TestBand:
     def test_should_band_good_at_80(self):
         snap = MetricsSnapshot.from_repo_prs({}, _period())